@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML/엔티티 정리 마이크로벤치마크 (네이버 검색 응답 형태의 합성 기사)
+
+    python benchmarks/bench_clean_html.py            # 10,000건
+    python benchmarks/bench_clean_html.py --items 50000 --repeat 7
+
+비교 대상:
+- 기존: 정규식 2번 + str.replace 6번 (편집기의 예전 _clean_html)
+- clean_html: 항목별 단일 패스
+- clean_news: 기사 목록의 제목/내용을 한 번의 치환으로
+"""
+
+import os
+import re
+import sys
+import random
+import argparse
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from news_core.text import clean_html, clean_news
+
+WORDS = [
+    '삼성전자', 'SK하이닉스', '하반기', '신입', '채용', '공채', '반도체', '인재',
+    '확대', '발표', '일자리', '청년', '고용', '지원', '투자', 'AI', '개발자', '모집',
+]
+
+ENTITIES = ['&quot;', '&amp;', '&lt;', '&gt;', '&apos;', '&nbsp;']
+
+def legacy_clean_html(text: str) -> str:
+    """기존 구현 (비교 기준)"""
+    
+    text = re.sub(r'<[^>]+>', '', text)
+    text = text.replace('&quot;', '"')
+    text = text.replace('&apos;', "'")
+    text = text.replace('&amp;', '&')
+    text = text.replace('&lt;', '<')
+    text = text.replace('&gt;', '>')
+    text = text.replace('&nbsp;', ' ')
+    text = re.sub(r'\s+', ' ', text)
+    
+    return text.strip()
+
+def make_text(rng: random.Random, words: int) -> str:
+    parts = []
+    
+    for _ in range(words):
+        word = rng.choice(WORDS)
+        roll = rng.random()
+        
+        # 네이버 응답처럼 검색어 강조 태그와 엔티티가 섞인 문장
+        if roll < 0.15:
+            word = f"<b>{word}</b>"
+        elif roll < 0.25:
+            entity = rng.choice(ENTITIES)
+            word = f"{entity}{word}{entity}"
+        
+        parts.append(word)
+    
+    return ' '.join(parts)
+
+def make_items(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    
+    return [
+        {
+            'title': make_text(rng, 8),
+            'description': make_text(rng, 30),
+            'link': f"https://n.news.naver.com/article/{i:06d}",
+            'pubDate': 'Mon, 06 Jan 2025 09:00:00 +0900',
+        }
+        for i in range(count)
+    ]
+
+def bench(label: str, func, repeat: int, baseline: float = None) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    speedup = f"  x{baseline / best:.2f}" if baseline else ""
+    print(f"  {label:<28} {best * 1000:8.1f} ms{speedup}")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    items = make_items(args.items)
+    
+    # 기존 구현이 다루던 엔티티만 있는 입력에서는 결과가 같아야 함
+    expected = [(legacy_clean_html(n['title']), legacy_clean_html(n['description'])) for n in items]
+    assert [(clean_html(n['title']), clean_html(n['description'])) for n in items] == expected
+    assert [(n['title'], n['description']) for n in clean_news(items)] == expected
+    
+    print(f"📊 기사 {len(items):,}건 (제목 + 내용), 최솟값 / {args.repeat}회")
+    
+    def run_legacy():
+        for news in items:
+            legacy_clean_html(news['title'])
+            legacy_clean_html(news['description'])
+    
+    def run_single():
+        for news in items:
+            clean_html(news['title'])
+            clean_html(news['description'])
+    
+    def run_batch():
+        clean_news(items)
+    
+    baseline = bench("기존 (정규식 2 + replace 6)", run_legacy, args.repeat)
+    bench("clean_html (항목별)", run_single, args.repeat, baseline)
+    bench("clean_news (배치)", run_batch, args.repeat, baseline)
+
+if __name__ == "__main__":
+    main()
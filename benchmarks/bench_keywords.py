@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 매처 마이크로벤치마크 (고용뉴스 관련도 점수 표 + 합성 키워드로 표 크기 늘리기)
+
+    python benchmarks/bench_keywords.py
+    python benchmarks/bench_keywords.py --items 20000 --sizes 0 50 200 1000
+
+비교 대상:
+- 기존: 키워드마다 `in` / `.count()`로 본문 전체를 다시 훑음
+- KeywordMatcher: 표를 한 번 컴파일하고 본문을 한 번만 훑음
+"""
+
+import os
+import sys
+import random
+import argparse
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+from bench_clean_html import make_items
+from news_core.keywords import KeywordMatcher
+
+HIGH = ['채용 공고', '신입 채용', '대규모 채용', '인재 영입']
+MEDIUM = ['채용', '구인', '일자리', '입사']
+EMPLOYMENT = [
+    '채용', '신입사원', '경력직', '구인', '일자리',
+    '취업', '고용', '인력', '직원모집', '리크루팅',
+    '입사', '면접', '인재채용', '대규모채용', '청년채용'
+]
+
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처고노도로모보소오조초'
+
+def synthetic_keywords(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(count)]
+
+def legacy_score(content: str, employment) -> int:
+    """기존 구현 (비교 기준)"""
+    
+    content = content.lower()
+    score = 0
+    
+    for keyword in HIGH:
+        if keyword in content:
+            score += 5
+    
+    for keyword in MEDIUM:
+        score += content.count(keyword) * 2
+    
+    for keyword in employment:
+        if keyword in content:
+            score += 1
+    
+    return score
+
+def matcher_score(matcher: KeywordMatcher, content: str) -> int:
+    hits = matcher.scan(content)
+    return hits.distinct['high'] * 5 + hits.counts['medium'] * 2 + hits.distinct['employment']
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--sizes', type=int, nargs='*', default=[0, 50, 200])
+    args = parser.parse_args()
+    
+    texts = [f"{news['title']} {news['description']}" for news in make_items(args.items)]
+    
+    print(f"📊 기사 {len(texts):,}건, 최솟값 / {args.repeat}회")
+    print(f"  {'키워드 수':>8} {'기존':>10} {'매처':>10} {'배율':>7}")
+    
+    for extra in args.sizes:
+        employment = EMPLOYMENT + synthetic_keywords(extra)
+        matcher = KeywordMatcher({'high': HIGH, 'medium': MEDIUM, 'employment': employment})
+        
+        # 겹치는 키워드(채용 ⊂ 신입 채용 ⊂ ...)가 있어도 점수는 같아야 함
+        assert [legacy_score(t, employment) for t in texts] == [matcher_score(matcher, t) for t in texts]
+        
+        legacy = min(timeit.repeat(lambda: [legacy_score(t, employment) for t in texts], number=1, repeat=args.repeat))
+        compiled = min(timeit.repeat(lambda: [matcher_score(matcher, t) for t in texts], number=1, repeat=args.repeat))
+        
+        size = len(HIGH) + len(MEDIUM) + len(employment)
+        print(f"  {size:>8} {legacy * 1000:8.1f}ms {compiled * 1000:8.1f}ms {legacy / compiled:6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 기사 판별 점검 + 마이크로벤치마크
+
+    python benchmarks/bench_near_duplicate.py
+    python benchmarks/bench_near_duplicate.py --items 5000 --repeat 3
+
+점검: 회사/수치만 다른 정형 제목은 남기고, 같은 기사를 다르게 쓴 제목은 제거
+비교 대상:
+- 전수 비교: 기사마다 앞선 모든 기사와 자카드 유사도 계산
+- NearDuplicateIndex: LSH 버킷 후보만 비교
+"""
+
+import os
+import sys
+import argparse
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+from bench_clean_html import make_items
+from news_core.near_duplicate import DEFAULT_THRESHOLD, NearDuplicateIndex, shingles
+
+# 제목 bigram 유사도는 높지만 다른 기사 (괄호 안은 자카드 유사도)
+DIFFERENT = [
+    ("삼성전자, 하반기 신입사원 공개채용 시작", "SK하이닉스, 하반기 신입사원 공개채용 시작"),  # 0.55
+    ("삼성전자 3분기 영업이익 발표", "LG전자 3분기 영업이익 발표"),  # 0.71
+    ("현대중공업, LNG선 2척 수주", "삼성중공업, LNG선 4척 수주"),  # 0.50
+]
+
+# 매체마다 다르게 쓴 같은 기사
+SAME = [
+    ("삼성전자 하반기 공채 시작…반도체 인재 대거 채용", "삼성전자, 하반기 신입 공채 돌입 반도체 인재 확보"),  # 0.41
+    ("[단독] 고용노동부, 청년 일자리 지원 5만명 확대", "고용부 청년일자리 지원 5만명으로 늘린다"),
+]
+
+def is_duplicate(first: str, second: str) -> bool:
+    index = NearDuplicateIndex()
+    index.add(first)
+    return not index.add(second)
+
+def pairwise_unique(titles, threshold: float):
+    """전수 비교 (비교 기준, 주체/수치 검사 없음)"""
+    
+    kept = []
+    
+    for title in titles:
+        current = shingles(title)
+        
+        if all(len(current & other) / len(current | other) < threshold for other in kept if current | other):
+            kept.append(current)
+    
+    return len(kept)
+
+def index_unique(titles) -> int:
+    index = NearDuplicateIndex()
+    return sum(1 for title in titles if index.add(title))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    for first, second in DIFFERENT:
+        assert not is_duplicate(first, second), (first, second)
+    
+    for first, second in SAME:
+        assert is_duplicate(first, second), (first, second)
+    
+    print(f"✅ 다른 기사 {len(DIFFERENT)}쌍 유지, 같은 기사 {len(SAME)}쌍 제거 (임계값 {DEFAULT_THRESHOLD})")
+    
+    titles = [news['title'] for news in make_items(args.items)]
+    
+    pairwise = min(timeit.repeat(lambda: pairwise_unique(titles, DEFAULT_THRESHOLD), number=1, repeat=args.repeat))
+    indexed = min(timeit.repeat(lambda: index_unique(titles), number=1, repeat=args.repeat))
+    
+    print(f"📊 제목 {len(titles):,}건, 최솟값 / {args.repeat}회")
+    print(f"  전수 비교 {pairwise * 1000:8.1f}ms ({pairwise_unique(titles, DEFAULT_THRESHOLD):,}건 남음)")
+    print(f"  LSH 인덱스 {indexed * 1000:8.1f}ms ({index_unique(titles):,}건 남음) {pairwise / indexed:6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고용뉴스 관련도 순위 단계 벤치마크 (10,000 / 100,000건)
+
+    python benchmarks/bench_relevance_scorer.py
+    python benchmarks/bench_relevance_scorer.py --sizes 10000 100000 300000 --top-k 30
+
+비교 대상:
+- 기존: 키워드마다 본문을 다시 훑는 점수 계산 + 전체 정렬 후 [:k]
+- 점수 엔진 (키워드만): 같은 가중치, 힙으로 상위 k개
+- 점수 엔진 (scoring_config.json): 최신성 감쇠 + 매체 다양성 감점까지
+"""
+
+import os
+import sys
+import copy
+import json
+import random
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from bench_clean_html import make_items
+from news_core.relevance_scorer import RelevanceScorer
+
+CONFIG_PATH = os.path.join(ROOT, 'employment_bot', 'scoring_config.json')
+
+NOW = datetime(2025, 1, 6, 12, 0, tzinfo=timezone.utc)
+
+def make_news(count: int, seed: int = 3):
+    """합성 기사에 48시간 안의 pubDate와 매체 50곳 중 하나의 원문 링크를 붙임"""
+    
+    rng = random.Random(seed)
+    items = make_items(count, seed)
+    
+    for news in items:
+        published = NOW - timedelta(minutes=rng.randint(0, 48 * 60))
+        news['pubDate'] = published.strftime('%a, %d %b %Y %H:%M:%S +0000')
+        news['originallink'] = f"https://www.press{rng.randint(1, 50)}.co.kr/news/{rng.randint(1, 10**6)}"
+    
+    return items
+
+def legacy_rank(news_list, groups, k):
+    """기존 구현 (비교 기준)"""
+    
+    high, medium, employment = groups
+    
+    for news in news_list:
+        content = f"{news.get('title', '')} {news.get('description', '')}".lower()
+        score = 0
+        
+        for keyword in high:
+            if keyword in content:
+                score += 5
+        
+        for keyword in medium:
+            score += content.count(keyword) * 2
+        
+        for keyword in employment:
+            if keyword in content:
+                score += 1
+        
+        news['relevance_score'] = score
+    
+    return sorted(news_list, key=lambda x: x.get('relevance_score', 0), reverse=True)[:k]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='*', default=[10000, 100000])
+    parser.add_argument('--top-k', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    
+    keyword_only = copy.deepcopy(config)
+    keyword_only['recency']['weight'] = 0
+    keyword_only['diversity']['source_penalty'] = 0
+    
+    full_scorer = RelevanceScorer(config)
+    keyword_scorer = RelevanceScorer(keyword_only)
+    
+    groups = tuple(config['keyword_groups'][name]['keywords'] for name in ('high', 'medium', 'employment'))
+    
+    print(f"📊 상위 {args.top_k}개 선택, 최솟값 / {args.repeat}회")
+    
+    for size in args.sizes:
+        news = make_news(size)
+        
+        # 키워드만 쓰면 기존 구현과 같은 기사/같은 순서
+        expected = [id(n) for n in legacy_rank(news, groups, args.top_k)]
+        assert [id(n) for n in keyword_scorer.select(news, args.top_k, now=NOW)] == expected
+        
+        def timed(func):
+            return min(timeit.repeat(func, number=1, repeat=args.repeat))
+        
+        legacy = timed(lambda: legacy_rank(news, groups, args.top_k))
+        keyword = timed(lambda: keyword_scorer.select(news, args.top_k, now=NOW))
+        full = timed(lambda: full_scorer.select(news, args.top_k, now=NOW))
+        
+        picked = full_scorer.select(news, args.top_k, now=NOW)
+        sources = len({n['originallink'].split('/')[2] for n in picked})
+        
+        print(f"\n  기사 {size:,}건")
+        print(f"    기존 (점수 + 전체 정렬)        {legacy * 1000:9.1f} ms")
+        print(f"    점수 엔진 (키워드만, 힙)       {keyword * 1000:9.1f} ms  x{legacy / keyword:.2f}")
+        print(f"    점수 엔진 (최신성 + 다양성)    {full * 1000:9.1f} ms  x{legacy / full:.2f}  (매체 {sources}곳)")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 기업뉴스봇 - 산업/기업 동향 전문
+--stream: 산업별로 수집/편집이 끝나는 대로 바로 발송
 """
 
 import os
@@ -10,9 +11,16 @@ import json
 from datetime import datetime
 from naver_corporate_collector import NaverCorporateCollector
 from gemini_corporate_editor import GeminiCorporateEditor
-from kakao_sender import KakaoSender
+from news_core.kakao_sender import KakaoSender
+from news_core.kakao_templates import CompiledTemplate, DigestRenderer
+from news_core.pipeline import Pipeline
 
-def main():
+# 기사 한 줄 (텍스트 형식)
+ARTICLE_TEXT = CompiledTemplate("{index}. {short_title}\n   {link}\n")
+
+def main() -> bool:
+    """성공하면 True (새 기사가 없는 날도 성공), 수집/발송 실패는 False"""
+    
     print("=" * 50)
     print("🏢 기업뉴스봇 시작")
     print(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -34,11 +42,11 @@ def main():
         
         if total_count == 0:
             print("❌ 수집된 뉴스가 없습니다.")
-            return
+            return True
             
     except Exception as e:
         print(f"❌ 뉴스 수집 실패: {e}")
-        return
+        return False
     
     # 2단계: Gemini AI 편집
     print("\n[2/4] 🤖 AI 편집 중...")
@@ -56,8 +64,8 @@ def main():
     
     # 3단계: 메시지 포맷팅
     print("\n[3/4] 📝 메시지 포맷팅 중...")
-    message = format_corporate_message(formatted_news)
-    print(f"✓ 메시지 길이: {len(message)}자")
+    messages = format_corporate_message(formatted_news)
+    print(f"✓ 메시지 {len(messages)}개")
     
     # 4단계: 카카오톡 발송
     print("\n[4/4] 📤 카카오톡 발송 중...")
@@ -67,16 +75,18 @@ def main():
             refresh_token=os.environ['KAKAO_REFRESH_TOKEN']
         )
         
-        result = sender.send_message(message)
+        sent = sender.send_messages(messages)
+        ok = sent == len(messages)
         
-        if result:
+        if ok:
             print("✓ 발송 성공!")
+            collector.mark_delivered(formatted_news)
         else:
-            print("❌ 발송 실패")
+            print(f"❌ 발송 실패 ({sent}/{len(messages)}개 발송)")
             
     except Exception as e:
         print(f"❌ 발송 오류: {e}")
-        return
+        return False
     
     # 결과 저장
     save_result(formatted_news, "corporate")
@@ -85,11 +95,90 @@ def main():
     print("✅ 기업뉴스봇 완료!")
     print("=" * 50)
 
-def format_corporate_message(categorized_news):
-    """기업뉴스 포맷 (산업별)"""
+    return ok
+
+def main_streaming() -> bool:
+    """수집 → 편집 → 포맷 → 발송을 산업 단위 파이프라인으로 연결"""
+    
+    print("=" * 50)
+    print("🏢 기업뉴스봇 시작 (스트리밍)")
+    print(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+    
+    try:
+        collector = NaverCorporateCollector(
+            client_id=os.environ['NAVER_CLIENT_ID'],
+            client_secret=os.environ['NAVER_CLIENT_SECRET']
+        )
+        editor = GeminiCorporateEditor(
+            api_key=os.environ['GEMINI_API_KEY']
+        )
+        sender = KakaoSender(
+            rest_api_key=os.environ['KAKAO_REST_API_KEY'],
+            refresh_token=os.environ['KAKAO_REFRESH_TOKEN']
+        )
+    except Exception as e:
+        print(f"❌ 초기화 실패: {e}")
+        return False
     
-    header = f"🏢 오늘의 산업 뉴스 ({datetime.now().strftime('%m월 %d일')})\n"
-    header += "=" * 30 + "\n\n"
+    delivered_news = {}
+    failed = []
+    
+    def edit(section):
+        industry, news_list = section
+        
+        if not news_list:
+            return None
+        
+        try:
+            return editor.format_corporate_news({industry: news_list})
+        except Exception as e:
+            print(f"⚠️ [{industry}] AI 편집 오류: {e}")
+            return {industry: news_list}
+    
+    def send(item):
+        section, messages = item
+        industry = next(iter(section))
+        
+        print(f"📤 [{industry}] 카카오톡 발송 중... (메시지 {len(messages)}개)")
+        
+        if sender.send_messages(messages) == len(messages):
+            print(f"✓ [{industry}] 발송 성공!")
+            collector.mark_delivered(section)
+            delivered_news.update(section)
+        else:
+            print(f"❌ [{industry}] 발송 실패")
+            failed.append(industry)
+    
+    pipeline = (
+        Pipeline(collector.iter_by_industry())
+        .stage('편집', edit)
+        .stage('포맷', lambda section: (section, format_corporate_message(section)))
+    )
+    pipeline.run(send)
+    
+    if not delivered_news:
+        print("❌ 발송된 뉴스가 없습니다.")
+        return not failed
+    
+    # 결과 저장
+    save_result(delivered_news, "corporate")
+    
+    print("\n" + "=" * 50)
+    print(f"✅ 기업뉴스봇 완료! ({len(delivered_news)}개 산업 발송)")
+    print("=" * 50)
+    
+    return not failed
+
+def format_corporate_message(categorized_news, style=None):
+    """기업뉴스 포맷 (산업별 그룹 → 카카오 템플릿 목록, 항목마다 기사 링크)"""
+    
+    renderer = DigestRenderer(
+        f"🏢 오늘의 산업 뉴스 ({datetime.now().strftime('%m월 %d일')})",
+        "https://www.naver.com",
+        style=style,
+        item_text=ARTICLE_TEXT
+    )
     
     # 산업별 이모지
     industry_icons = {
@@ -102,49 +191,26 @@ def format_corporate_message(categorized_news):
         '바이오/의료': '💊'
     }
     
-    sections = []
+    groups = []
     
     for industry, news_list in categorized_news.items():
-        if not news_list:
-            continue
-        
         icon = industry_icons.get(industry, '📌')
-        section = f"{icon} {industry}\n"
+        items = []
         
-        for i, news in enumerate(news_list, 1):
+        for news in news_list:
             title = news.get('title', '제목 없음')
-            link = news.get('link', '')
-            
-            # 제목 길이 제한
-            if len(title) > 30:
-                title = title[:27] + "..."
-            
-            section += f"{i}. {title}\n"
-            section += f"   {link}\n"
         
-        sections.append(section)
-    
-    full_message = header + "\n".join(sections)
-    
-    # 1000자 제한
-    if len(full_message) > 1000:
-        # 각 산업당 1개씩만
-        sections = []
-        for industry, news_list in categorized_news.items():
-            if not news_list:
-                continue
+            items.append({
+                'title': title,
+                # 텍스트 형식은 제목 길이 제한
+                'short_title': title if len(title) <= 30 else title[:27] + "...",
+                'description': news.get('description', ''),
+                'link': news.get('link', '')
+            })
             
-            icon = industry_icons.get(industry, '📌')
-            news = news_list[0]
-            title = news.get('title', '')[:25] + "..."
-            link = news.get('link', '')
+        groups.append((f"{icon} {industry}", items))
             
-            section = f"{icon} {industry}\n{title}\n{link}\n"
-            sections.append(section)
-        
-        full_message = header + "\n".join(sections)
-    
-    return full_message[:1000]
+    return renderer.render(groups)
 
 def save_result(news_dict, bot_type):
     """결과 저장"""
@@ -160,4 +226,5 @@ def save_result(news_dict, bot_type):
         json.dump(result_data, f, ensure_ascii=False, indent=2)
 
 if __name__ == "__main__":
-    main()
+    ok = main_streaming() if '--stream' in sys.argv else main()
+    sys.exit(0 if ok else 1)
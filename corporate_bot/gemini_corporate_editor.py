@@ -6,7 +6,7 @@
 
 import google.generativeai as genai
 from typing import List, Dict
-import re
+from news_core.text import clean_news
 
 class GeminiCorporateEditor:
     """Gemini AI 기업뉴스 편집기"""
@@ -21,30 +21,15 @@ class GeminiCorporateEditor:
         formatted = {}
         
         for industry, news_list in categorized_news.items():
-            formatted[industry] = []
-            
-            for news in news_list:
-                formatted_item = {
-                    'title': self._clean_html(news.get('title', '')),
+            # 산업별 제목/내용을 한 번에 정리
+            formatted[industry] = [
+                {
+                    'title': news['title'],
                     'link': news.get('link', ''),
-                    'description': self._clean_html(news.get('description', '')),
+                    'description': news['description'],
                     'pubDate': news.get('pubDate', '')
                 }
-                
-                formatted[industry].append(formatted_item)
+                for news in clean_news(news_list)
+            ]
         
         return formatted
-    
-    def _clean_html(self, text: str) -> str:
-        """HTML 정리"""
-        
-        text = re.sub(r'<[^>]+>', '', text)
-        text = text.replace('&quot;', '"')
-        text = text.replace('&apos;', "'")
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&nbsp;', ' ')
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
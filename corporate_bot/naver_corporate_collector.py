@@ -4,17 +4,54 @@
 기업뉴스 수집기 - 산업별 수집
 """
 
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple
+from news_core.naver_search_client import NaverSearchClient, NaverSearchError, RequestBudget, get_client
+from news_core.seen_store import SeenArticleStore
+from news_core.near_duplicate import DEFAULT_THRESHOLD, remove_near_duplicates
+from news_core.keyword_planner import KeywordPlanner
+from news_core.quota import QuotaManager, get_quota_manager
+from news_core.search import iter_news_pages
+from news_core.text import filter_by_date
+
+# 실행 한 번의 네이버 API 요청 상한 (오늘 남은 한도를 넘지 않음)
+DEFAULT_REQUEST_BUDGET = int(os.environ.get('CORPORATE_REQUEST_BUDGET', '100'))
+
+# 호출 장부의 검색어별 수확량 구분
+QUOTA_NAMESPACE = 'corporate'
 
 class NaverCorporateCollector:
     """산업별 기업뉴스 수집기"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str, max_workers: int = 8,
+                 client: Optional[NaverSearchClient] = None,
+                 seen_store: Optional[SeenArticleStore] = None, max_pages: int = 1,
+                 similarity_threshold: float = DEFAULT_THRESHOLD, request_budget: Optional[RequestBudget] = None,
+                 quota: Optional[QuotaManager] = None):
         self.client_id = client_id
         self.client_secret = client_secret
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        
+        # 동시 검색 수 상한 (1이면 순차 검색)
+        self.max_workers = max(1, max_workers)
+        
+        # 커넥션 풀을 공유하는 검색 클라이언트
+        self.client = client or get_client(client_id, client_secret, max_connections=self.max_workers)
+        
+        # 실행 간 발송 기록 / 검색어별 커서
+        self.seen_store = seen_store or SeenArticleStore('corporate')
+        self.max_pages = max_pages
+        
+        # 제목 bigram 자카드 유사도가 이 값 이상이면 같은 기사로 판단
+        self.similarity_threshold = similarity_threshold
+        
+        # 최근 며칠 기사만 / 산업별 기사 수
+        self.max_age_days = 3
+        self.news_per_industry = 2
+        
+        # 인증 정보별 일일 호출 장부와 실행당 요청 예산
+        self.quota = quota or get_quota_manager(client_id)
+        self.request_budget = request_budget or self.quota.budget(DEFAULT_REQUEST_BUDGET)
         
         # 산업별 키워드
         self.industries = {
@@ -51,61 +88,150 @@ class NaverCorporateCollector:
     def collect_by_industry(self) -> Dict[str, List[Dict]]:
         """산업별로 뉴스 수집 (각 2개)"""
         
-        result = {}
+        return dict(self.iter_by_industry(display=3))
+    
+    def iter_by_industry(self, display: int = 3) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        산업별 결과를 준비되는 대로 하나씩 반환 (스트리밍 발송용)
+        산업마다 과거 수확량이 높은 키워드부터 묶음(wave)으로 검색하고, 산업별 기사 수가 차면 중단
+        모든 산업의 첫 묶음을 산업 순서대로 미리 동시 요청하고, 부족한 산업만 다음 묶음 요청
+        """
         
-        for industry, keywords in self.industries.items():
-            print(f"  {industry}:", end=" ")
-            
-            industry_news = []
-            
+        planners = self._plan_industries()
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {}
+        
+        def submit(keywords: List[str]):
             for keyword in keywords:
-                try:
-                    news = self._search_news(keyword, display=3)
-                    industry_news.extend(news)
-                except Exception:
-                    continue
-            
-            # 중복 제거
-            unique_news = self._remove_duplicates(industry_news)
-            
-            # 날짜 필터링
-            filtered_news = self._filter_by_date(unique_news, days=3)
+                if keyword not in futures:
+                    futures[keyword] = executor.submit(self._search_or_empty, keyword, display)
+        
+        waves = {industry: planner.next_wave(self.news_per_industry) for industry, planner in planners.items()}
+        for wave in waves.values():
+            submit(wave)
+        
+        searched_total = 0
+        
+        try:
+            for industry, planner in planners.items():
+                searched = []
+                wave = waves[industry]
+                filtered_news = []
+                
+                while wave:
+                    searched.extend(wave)
             
-            # 상위 2개 선택
-            result[industry] = filtered_news[:2]
+                    # 수확량 순서대로 합쳐서 앞 키워드의 기사가 우선
+                    filtered_news = self._filter_industry_news(
+                        [news for keyword in searched for news in futures[keyword].result()[0]]
+                    )
+                    
+                    deficit = self.news_per_industry - len(filtered_news)
+                    if deficit <= 0:
+                        break
+                    
+                    wave = planner.next_wave(deficit)
+                    submit(wave)
+                
+                self._record_yield(searched, filtered_news, futures)
+                searched_total += len(searched)
+                
+                selected = filtered_news[:self.news_per_industry]
+                print(f"  {industry}: {len(selected)}개 (키워드 {len(searched)}/{len(self.industries[industry])}개)")
+                
+                yield industry, selected
             
-            print(f"{len(result[industry])}개")
+            print(f"  키워드 {searched_total}/{sum(map(len, self.industries.values()))}개 검색")
+            print(f"  {self.client.stats.summary()}")
+            print(f"  {self.quota.report(self.request_budget)}")
         
-        return result
+        finally:
+            # 소비가 중간에 멈추면 남은 검색은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    def _search_news(self, query: str, display: int = 3) -> List[Dict]:
-        """네이버 뉴스 API 검색"""
+    def _plan_industries(self) -> Dict[str, KeywordPlanner]:
+        """
+        산업별 검색 계획 (남은 요청 예산에 들어가는 키워드만)
+        과거 실행에서 쓸 만한 기사(미발송, 중복 아님, 날짜 범위 안)를 많이 낸 키워드부터
+        """
         
-        headers = {
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
-        }
+        queries = list(dict.fromkeys(
+            keyword
+            for keywords in self.industries.values()
+            for keyword in keywords
+        ))
+        affordable = set(self.quota.plan(QUOTA_NAMESPACE, queries, self.request_budget,
+                                         default_cost=self.max_pages))
+        
+        history = self.quota.ledger.yields(QUOTA_NAMESPACE)
         
-        params = {
-            'query': query,
-            'display': display,
-            'sort': 'date'
+        return {
+            industry: KeywordPlanner([keyword for keyword in keywords if keyword in affordable], history)
+            for industry, keywords in self.industries.items()
         }
+    
+    def _filter_industry_news(self, industry_news: List[Dict]) -> List[Dict]:
+        """발송 이력 제외 → 중복 제거 → 날짜 필터"""
         
-        response = requests.get(
-            self.base_url,
-            headers=headers,
-            params=params,
-            timeout=10
-        )
+        # 이전 실행에서 이미 발송한 기사 제외
+        industry_news = self.seen_store.filter_unseen(industry_news)
+        
+        # 중복 제거
+        unique_news = self._remove_duplicates(industry_news)
+        
+        # 날짜 필터링
+        return filter_by_date(unique_news, days=self.max_age_days)
+        
+    def _record_yield(self, searched: List[str], filtered_news: List[Dict], futures: Dict):
+        """키워드별 요청 수와 걸러진 뒤 남은 기사 중 그 키워드가 처음 가져온 기사 수 기록"""
+        
+        source = {}
+        for keyword in searched:
+            for news in futures[keyword].result()[0]:
+                source.setdefault(id(news), keyword)
+        
+        contributed = dict.fromkeys(searched, 0)
+        for news in filtered_news:
+            contributed[source[id(news)]] += 1
+    
+        for keyword in searched:
+            calls = futures[keyword].result()[1]
+        
+            if calls:
+                self.quota.record(QUOTA_NAMESPACE, keyword, calls, contributed[keyword])
+        
+    def _search_or_empty(self, query: str, display: int) -> Tuple[List[Dict], int]:
+        """(결과, 요청 수) - 오류 응답/예산 소진은 경고만 남기고 빈 결과"""
+    
+        pages = 0
+        items = []
+        
+        try:
+            for page in iter_news_pages(self.client, self.seen_store, query, display=display,
+                                        max_pages=self.max_pages, budget=self.request_budget):
+                pages += 1
+                items.extend(page)
+        
+        except NaverSearchError as e:
+            # 오류 응답도 한도를 쓴 요청
+            pages += 1
+            print(f"⚠️ '{query}' 검색 실패: {e}")
         
-        if response.status_code == 200:
-            return response.json().get('items', [])
-        else:
-            return []
+        except Exception as e:
+            print(f"⚠️ '{query}' 검색 실패: {e}")
+        
+        return items, pages
+    
+    def mark_delivered(self, categorized_news: Dict[str, List[Dict]]):
+        """발송 완료 기사를 기록해 다음 실행부터 제외"""
+        
+        self.seen_store.mark_delivered([
+            news for news_list in categorized_news.values() for news in news_list
+        ])
     
     def _remove_duplicates(self, news_list: List[Dict]) -> List[Dict]:
-        """중복 제거"""
+        """중복 제거 (링크 → 제목 유사도)"""
         
         seen_links = set()
         unique_news = []
@@ -117,29 +243,9 @@ class NaverCorporateCollector:
                 seen_links.add(link)
                 unique_news.append(news)
         
-        return unique_news
-    
-    def _filter_by_date(self, news_list: List[Dict], days: int = 3) -> List[Dict]:
-        """최근 N일 이내"""
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        filtered = []
-        
-        for news in news_list:
-            pub_date_str = news.get('pubDate', '')
-            
-            try:
-                pub_date = datetime.strptime(
-                    pub_date_str,
-                    '%a, %d %b %Y %H:%M:%S %z'
-                )
-                
-                pub_date_naive = pub_date.replace(tzinfo=None)
-                
-                if pub_date_naive >= cutoff_date:
-                    filtered.append(news)
-                    
-            except Exception:
-                filtered.append(news)
-        
-        return filtered
+        # 같은 기사를 다른 매체가 다른 제목으로 낸 경우
+        return remove_near_duplicates(
+            unique_news,
+            lambda news: news.get('title', ''),
+            threshold=self.similarity_threshold
+        )
@@ -3,6 +3,7 @@
 """
 고용뉴스봇 - 채용/취업 전문
 중복 제거 강화 버전
+--stream: 키워드별 새 기사 묶음을 편집이 끝나는 대로 바로 발송
 """
 
 import os
@@ -11,9 +12,29 @@ import json
 from datetime import datetime
 from naver_employment_collector import NaverEmploymentCollector
 from gemini_employment_editor import GeminiEmploymentEditor
-from kakao_sender import KakaoSender
+from news_core.kakao_sender import KakaoSender
+from news_core.kakao_templates import CompiledTemplate, DigestRenderer
+from news_core.keywords import KeywordMatcher
+from news_core.pipeline import Pipeline
 
-def main():
+# 산업 카테고리 키워드 (위에 있는 카테고리가 우선)
+CATEGORY_MATCHER = KeywordMatcher({
+    '조선': ['조선', '현대중공업', '삼성중공업', '대우조선', 'lng선', '선박'],
+    '반도체': ['반도체', '삼성전자', 'sk하이닉스', '메모리', '칩', '파운드리'],
+    'IT': ['it', '소프트웨어', '개발자', '프로그래머', '네이버', '카카오', '앱'],
+    '제조': ['제조', '공장', '생산직', '기계', '자동차', '현대차', '기아'],
+    '서비스': ['서비스', '유통', '판매', '고객', '영업', '마케팅'],
+    '금융': ['금융', '은행', '증권', '보험', '투자'],
+    '건설': ['건설', '부동산', '건축', '토목', 'GS건설', '현대건설'],
+    '바이오': ['바이오', '제약', '의료', '헬스케어', '병원'],
+})
+
+# 기사 하나 (텍스트 형식)
+NEWS_TEXT = CompiledTemplate('[{category}]\n"{short_title}"\n링크: {link}\n{point_line}')
+
+def main() -> bool:
+    """성공하면 True (새 기사가 없는 날도 성공), 수집/발송 실패는 False"""
+    
     print("=" * 50)
     print("💼 고용뉴스봇 시작")
     print(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -28,16 +49,16 @@ def main():
         )
         
         # 30개 수집 후 중복 제거하여 상위 10개 선정
-        raw_news = collector.collect_unique_news(count=30)
+        raw_news = collector.collect_unique_news()
         print(f"✓ 수집 완료: {len(raw_news)}개 뉴스 (중복 제거됨)")
         
         if not raw_news:
             print("❌ 수집된 뉴스가 없습니다.")
-            return
+            return True
             
     except Exception as e:
         print(f"❌ 뉴스 수집 실패: {e}")
-        return
+        return False
     
     # 2단계: Gemini AI 편집
     print("\n[2/4] 🤖 AI 편집 중...")
@@ -48,7 +69,7 @@ def main():
         
         # 상위 10개만 AI 편집
         formatted_news = editor.format_news_with_recruitment_point(raw_news[:10])
-        print(f"✓ 편집 완료: {len(formatted_news)}개 뉴스")
+        print(f"✓ 편집 완료: {len(formatted_news)}개 뉴스 ({editor.cache.summary()})")
         
         if not formatted_news:
             print("⚠️ AI 편집 실패, 원본 사용")
@@ -60,8 +81,8 @@ def main():
     
     # 3단계: 메시지 포맷팅
     print("\n[3/4] 📝 메시지 포맷팅 중...")
-    message = format_employment_message(formatted_news)
-    print(f"✓ 메시지 길이: {len(message)}자")
+    messages = format_employment_message(formatted_news)
+    print(f"✓ 메시지 {len(messages)}개")
     
     # 4단계: 카카오톡 발송
     print("\n[4/4] 📤 카카오톡 발송 중...")
@@ -71,16 +92,18 @@ def main():
             refresh_token=os.environ['KAKAO_REFRESH_TOKEN']
         )
         
-        result = sender.send_message(message)
+        sent = sender.send_messages(messages)
+        ok = sent == len(messages)
         
-        if result:
+        if ok:
             print("✓ 발송 성공!")
+            collector.mark_delivered(formatted_news)
         else:
-            print("❌ 발송 실패")
+            print(f"❌ 발송 실패 ({sent}/{len(messages)}개 발송)")
             
     except Exception as e:
         print(f"❌ 발송 오류: {e}")
-        return
+        return False
     
     # 결과 저장
     save_result(formatted_news, "employment")
@@ -89,73 +112,115 @@ def main():
     print("✅ 고용뉴스봇 완료!")
     print("=" * 50)
 
-def format_employment_message(news_list):
-    """고용뉴스 포맷"""
+    return ok
+
+def main_streaming() -> bool:
+    """수집 → AI 편집 → 포맷 → 발송을 기사 묶음 단위 파이프라인으로 연결"""
     
-    header = f"💼 오늘의 고용/채용 뉴스 ({datetime.now().strftime('%m월 %d일')})\n"
-    header += "=" * 30 + "\n\n"
+    print("=" * 50)
+    print("💼 고용뉴스봇 시작 (스트리밍)")
+    print(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
     
-    messages = []
+    try:
+        collector = NaverEmploymentCollector(
+            client_id=os.environ['NAVER_CLIENT_ID'],
+            client_secret=os.environ['NAVER_CLIENT_SECRET']
+        )
+        editor = GeminiEmploymentEditor(
+            api_key=os.environ['GEMINI_API_KEY']
+        )
+        sender = KakaoSender(
+            rest_api_key=os.environ['KAKAO_REST_API_KEY'],
+            refresh_token=os.environ['KAKAO_REFRESH_TOKEN']
+        )
+    except Exception as e:
+        print(f"❌ 초기화 실패: {e}")
+        return False
+    
+    delivered_news = []
+    failed = []
+    
+    def edit(batch):
+        try:
+            formatted = editor.format_news_with_recruitment_point(batch)
+            print(f"✓ 편집 완료: {len(formatted)}개 뉴스 ({editor.cache.summary()})")
+            return formatted or batch
+        except Exception as e:
+            print(f"⚠️ AI 편집 오류: {e}")
+            return batch
+    
+    def send(item):
+        batch, messages = item
+        
+        print(f"📤 카카오톡 발송 중... ({len(batch)}개 뉴스, 메시지 {len(messages)}개)")
+        
+        if sender.send_messages(messages) == len(messages):
+            print("✓ 발송 성공!")
+            collector.mark_delivered(batch)
+            delivered_news.extend(batch)
+        else:
+            print("❌ 발송 실패")
+            failed.append(batch)
+    
+    # 상위 10개까지 (일괄 모드와 같은 개수)
+    pipeline = (
+        Pipeline(collector.iter_unique_news(count=10))
+        .stage('편집', edit)
+        .stage('포맷', lambda batch: (batch, format_employment_message(batch)))
+    )
+    pipeline.run(send)
+    
+    if not delivered_news:
+        print("❌ 발송된 뉴스가 없습니다.")
+        return not failed
+    
+    # 결과 저장
+    save_result(delivered_news, "employment")
+    
+    print("\n" + "=" * 50)
+    print(f"✅ 고용뉴스봇 완료! ({len(delivered_news)}개 발송)")
+    print("=" * 50)
+    
+    return not failed
+
+def format_employment_message(news_list, style=None):
+    """고용뉴스 포맷 (기사 목록 → 카카오 템플릿 목록, 항목마다 기사 링크)"""
+    
+    renderer = DigestRenderer(
+        f"💼 오늘의 고용/채용 뉴스 ({datetime.now().strftime('%m월 %d일')})",
+        "https://www.naver.com",
+        style=style,
+        item_text=NEWS_TEXT
+    )
+    
+    items = []
     
     for news in news_list:
         category = determine_category(news)
         title = news.get('title', '제목 없음')
-        link = news.get('link', '')
         recruitment_point = news.get('recruitment_point', '')
         
-        # 제목 길이 제한
-        if len(title) > 35:
-            title = title[:32] + "..."
-        
-        msg = f"[{category}]\n"
-        msg += f'"{title}"\n'
-        msg += f'링크: {link}\n'
+        items.append({
+            'category': category,
+            'title': title,
+            # 텍스트 형식은 제목 길이 제한
+            'short_title': title if len(title) <= 35 else title[:32] + "...",
+            'link': news.get('link', ''),
+            'point_line': f'채용포인트: {recruitment_point}\n' if recruitment_point else '',
+            # list 템플릿 설명: [카테고리] 채용포인트
+            'description': f"[{category}] {recruitment_point}".strip()
+        })
         
-        if recruitment_point:
-            msg += f'채용포인트: {recruitment_point}\n'
-        
-        messages.append(msg)
-    
-    full_message = header + "\n".join(messages)
-    
-    # 1000자 제한
-    if len(full_message) > 1000:
-        # 채용포인트 제거하고 재시도
-        messages = []
-        for news in news_list:
-            category = determine_category(news)
-            title = news.get('title', '')[:32] + "..."
-            link = news.get('link', '')
-            msg = f"[{category}] {title}\n{link}\n"
-            messages.append(msg)
-        
-        full_message = header + "\n".join(messages)
-    
-    return full_message[:1000]
+    return renderer.render([("", items)])
 
 def determine_category(news):
     """산업 카테고리 판단"""
     
-    title = news.get('title', '').lower()
-    description = news.get('description', '').lower()
-    content = f"{title} {description}"
-    
-    categories = {
-        '조선': ['조선', '현대중공업', '삼성중공업', '대우조선', 'lng선', '선박'],
-        '반도체': ['반도체', '삼성전자', 'sk하이닉스', '메모리', '칩', '파운드리'],
-        'IT': ['it', '소프트웨어', '개발자', '프로그래머', '네이버', '카카오', '앱'],
-        '제조': ['제조', '공장', '생산직', '기계', '자동차', '현대차', '기아'],
-        '서비스': ['서비스', '유통', '판매', '고객', '영업', '마케팅'],
-        '금융': ['금융', '은행', '증권', '보험', '투자'],
-        '건설': ['건설', '부동산', '건축', '토목', 'GS건설', '현대건설'],
-        '바이오': ['바이오', '제약', '의료', '헬스케어', '병원'],
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in content for keyword in keywords):
-            return category
+    # 대소문자는 매처가 무시
+    content = f"{news.get('title', '')} {news.get('description', '')}"
     
-    return '기타'
+    return CATEGORY_MATCHER.first_group(content, default='기타')
 
 def save_result(news_list, bot_type):
     """결과 저장"""
@@ -172,4 +237,5 @@ def save_result(news_list, bot_type):
         json.dump(result_data, f, ensure_ascii=False, indent=2)
 
 if __name__ == "__main__":
-    main()
+    ok = main_streaming() if '--stream' in sys.argv else main()
+    sys.exit(0 if ok else 1)
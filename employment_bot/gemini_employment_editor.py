@@ -5,60 +5,16 @@
 """
 
 import google.generativeai as genai
-from typing import List, Dict
-import time
+from typing import List, Dict, Optional
+from news_core.llm_executor import LLMExecutor, estimate_tokens
+from news_core.llm_cache import LLMOutputCache, content_key
+from news_core.text import clean_news
+import json
 import re
 
-class GeminiEmploymentEditor:
-    """Gemini AI 고용뉴스 편집기"""
-    
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-    
-    def format_news_with_recruitment_point(self, news_list: List[Dict]) -> List[Dict]:
-        """채용포인트 생성"""
-        
-        formatted_news = []
-        
-        for i, news in enumerate(news_list, 1):
-            try:
-                print(f"  [{i}/{len(news_list)}] AI 분석...", end=" ")
-                
-                recruitment_point = self._generate_recruitment_point(news)
-                
-                formatted = {
-                    'title': self._clean_html(news.get('title', '')),
-                    'link': news.get('link', ''),
-                    'description': self._clean_html(news.get('description', '')),
-                    'pubDate': news.get('pubDate', ''),
-                    'recruitment_point': recruitment_point
-                }
-                
-                formatted_news.append(formatted)
-                print("✓")
-                
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"⚠️ {e}")
-                formatted_news.append({
-                    'title': self._clean_html(news.get('title', '')),
-                    'link': news.get('link', ''),
-                    'description': self._clean_html(news.get('description', '')),
-                    'pubDate': news.get('pubDate', ''),
-                    'recruitment_point': ''
-                })
-        
-        return formatted_news
-    
-    def _generate_recruitment_point(self, news: Dict) -> str:
-        """채용포인트 생성"""
-        
-        title = self._clean_html(news.get('title', ''))
-        description = self._clean_html(news.get('description', ''))
-        
-        prompt = f"""
+MODEL_NAME = 'gemini-2.0-flash-exp'
+
+RECRUITMENT_PROMPT = """
 다음 채용/고용 뉴스를 분석하여 구직자 관점에서 핵심 포인트를 한 줄로 요약하세요.
 
 제목: {title}
@@ -76,35 +32,237 @@ class GeminiEmploymentEditor:
 
 채용포인트:"""
 
-        try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={
-                    'temperature': 0.7,
-                    'max_output_tokens': 80,
-                }
-            )
-            
-            point = response.text.strip()
+BATCH_RECRUITMENT_PROMPT = """
+다음 채용/고용 뉴스 {count}건을 각각 분석하여 구직자 관점에서 핵심 포인트를 한 줄로 요약하세요.
+
+{articles}
+
+요구사항:
+1. 기사마다 30자 이내로 작성
+2. 채용 규모, 직무, 시기 등 구체적 정보 포함
+3. "~예상", "~전망", "~진행" 등의 표현 사용
+
+예시:
+- "상반기 신입사원 200명 채용 예정"
+- "디지털 전환으로 개발자 수요 급증"
+- "공장 증설로 생산직 대규모 채용"
+
+출력 형식: 기사 번호 순서대로 JSON 배열만 출력
+[{{"id": 1, "point": "채용포인트"}}, ...]"""
+
+class GeminiEmploymentEditor:
+    """Gemini AI 고용뉴스 편집기"""
+    
+    def __init__(self, api_key: str, batch_size: int = 10,
+                 executor: Optional[LLMExecutor] = None,
+                 cache: Optional[LLMOutputCache] = None):
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(MODEL_NAME)
+        
+        # 한 번의 요청에 묶을 기사 수 (1이면 기사별 요청)
+        self.batch_size = max(1, batch_size)
+        
+        # 속도 제한(RPM/TPM) + 재시도를 거치는 동시 실행기
+        self.executor = executor or LLMExecutor()
+        
+        # 이전 실행의 채용포인트 재사용
+        self.cache = cache or LLMOutputCache()
+    
+    def format_news_with_recruitment_point(self, news_list: List[Dict]) -> List[Dict]:
+        """채용포인트 생성 (캐시 확인 후 나머지만 batch_size개씩 묶어서 동시 요청)"""
+        
+        # 제목/내용은 여기서 한 번만 정리하고 캐시 키/프롬프트/결과에 그대로 사용
+        news_list = clean_news(news_list)
+        
+        keys = [self._cache_key(news) for news in news_list]
+        points = [self.cache.get(key) for key in keys]
+        
+        misses = [news for news, point in zip(news_list, points) if point is None]
+        print(f"  캐시 적중 {len(news_list) - len(misses)}개, AI 분석 {len(misses)}개")
+        
+        generated = iter(self._generate_recruitment_points(misses))
+        
+        formatted_news = []
+        
+        for news, key, recruitment_point in zip(news_list, keys, points):
+            if recruitment_point is None:
+                recruitment_point = next(generated)
+                
+                # 실패(빈 문자열)는 다음 실행에서 다시 시도하도록 저장하지 않음
+                if recruitment_point:
+                    self.cache.put(key, recruitment_point)
             
-            if len(point) > 35:
-                point = point[:32] + "..."
+            formatted_news.append({
+                'title': news['title'],
+                'link': news.get('link', ''),
+                'description': news['description'],
+                'pubDate': news.get('pubDate', ''),
+                'recruitment_point': recruitment_point
+            })
+        
+        self.cache.flush()
+        
+        return formatted_news
+    
+    def _cache_key(self, news: Dict) -> str:
+        """정리된 제목/내용 + 프롬프트 템플릿 + 모델명 해시"""
+        
+        return content_key(
+            news['title'],
+            news['description'],
+            RECRUITMENT_PROMPT + BATCH_RECRUITMENT_PROMPT,
+            MODEL_NAME
+        )
+    
+    def _generate_recruitment_points(self, news_list: List[Dict]) -> List[str]:
+        """batch_size개씩 묶어서 동시 요청 (실패한 기사는 빈 문자열)"""
+        
+        if not news_list:
+            return []
+        
+        batches = [
+            news_list[start:start + self.batch_size]
+            for start in range(0, len(news_list), self.batch_size)
+        ]
+        
+        print(f"  {len(news_list)}개 기사 / {len(batches)}개 묶음 AI 분석...")
+        
+        if self.batch_size > 1:
+            batch_points = self.executor.map(
+                self._request_batch_points,
+                batches,
+                estimate_tokens=lambda batch: estimate_tokens(self._build_batch_prompt(batch), 80 * len(batch)),
+                default=None
+            )
+        else:
+            batch_points = [None] * len(batches)
+        
+        # 묶음 응답 파싱 실패 시 해당 기사만 기사별 요청으로 대체
+        fallback = [
+            news
+            for batch, points in zip(batches, batch_points) if points is None
+            for news in batch
+        ]
+        
+        if fallback:
+            print(f"  기사별 요청으로 전환: {len(fallback)}개")
+        
+        fallback_points = iter(self._generate_recruitment_points_each(fallback))
+        
+        result = []
+        
+        for batch, points in zip(batches, batch_points):
+            if points is None:
+                points = [next(fallback_points) for _ in batch]
+            result.extend(points)
+        
+        print(f"  ✓ AI 분석 완료 (실패 {self.executor.failures}건)")
+        
+        return result
+    
+    def _generate_recruitment_points_each(self, news_list: List[Dict]) -> List[str]:
+        """기사별 채용포인트 동시 생성 (실패한 기사는 빈 문자열)"""
+        
+        return self.executor.map(
+            self._request_recruitment_point,
+            news_list,
+            estimate_tokens=lambda news: estimate_tokens(self._build_recruitment_prompt(news), 80),
+            default=''
+        )
+    
+    def _build_batch_prompt(self, news_list: List[Dict]) -> str:
+        articles = "\n\n".join(
+            f"[{i}]\n제목: {news['title']}\n"
+            f"내용: {news['description']}"
+            for i, news in enumerate(news_list, 1)
+        )
+        
+        return BATCH_RECRUITMENT_PROMPT.format(count=len(news_list), articles=articles)
+    
+    def _request_batch_points(self, news_list: List[Dict], timeout: float) -> Optional[List[str]]:
+        """
+        여러 기사를 한 프롬프트로 묶어 채용포인트 JSON 배열로 받기
+        API 오류는 예외로 올려 재시도, 응답이 깨지거나 개수가 맞지 않으면 None
+        """
+        
+        response = self.model.generate_content(
+            self._build_batch_prompt(news_list),
+            generation_config={
+                'temperature': 0.7,
+                'max_output_tokens': 80 * len(news_list),
+                'response_mime_type': 'application/json',
+            },
+            request_options={'timeout': timeout}
+        )
+        
+        try:
+            return self._parse_batch_points(response.text, len(news_list))
+        except ValueError:
+            return None
+    
+    def _parse_batch_points(self, text: str, expected: int) -> Optional[List[str]]:
+        """[{"id": n, "point": "..."}] 또는 ["..."] 형식 파싱"""
+        
+        # 코드 블록으로 감싼 응답 대비
+        text = re.sub(r'^```(?:json)?\s*|\s*```$', '', text.strip())
+        
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        
+        if not isinstance(data, list) or len(data) != expected:
+            return None
+        
+        points = [''] * expected
+        
+        # id가 겹치면 빈 칸이 남으므로 배치 결과를 버리고 건별 생성으로
+        used = set()
+        
+        for i, item in enumerate(data):
+            if isinstance(item, dict):
+                index = item.get('id', i + 1)
+                point = item.get('point', '')
+                if not isinstance(index, int) or not 1 <= index <= expected:
+                    return None
+                index -= 1
+            elif isinstance(item, str):
+                index, point = i, item
+            else:
+                return None
             
-            return point
+            if index in used:
+                return None
+            used.add(index)
             
-        except Exception as e:
-            return ""
+            points[index] = self._truncate_point(str(point))
+        
+        if len(used) != expected:
+            return None
+        
+        return points
     
-    def _clean_html(self, text: str) -> str:
-        """HTML 정리"""
-        
-        text = re.sub(r'<[^>]+>', '', text)
-        text = text.replace('&quot;', '"')
-        text = text.replace('&apos;', "'")
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&nbsp;', ' ')
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+    def _truncate_point(self, point: str) -> str:
+        point = point.strip().strip('"')
+        
+        if len(point) > 35:
+            point = point[:32] + "..."
+        
+        return point
+    
+    def _build_recruitment_prompt(self, news: Dict) -> str:
+        return RECRUITMENT_PROMPT.format(title=news['title'], description=news['description'])
+    
+    def _request_recruitment_point(self, news: Dict, timeout: float) -> str:
+        """채용포인트 생성 (API 오류는 예외로 올려 실행기가 재시도)"""
+        
+        response = self.model.generate_content(
+            self._build_recruitment_prompt(news),
+            generation_config={
+                'temperature': 0.7,
+                'max_output_tokens': 80,
+            },
+            request_options={'timeout': timeout}
+        )
+        
+        return self._truncate_point(response.text)
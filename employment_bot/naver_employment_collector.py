@@ -4,252 +4,290 @@
 고용뉴스 수집기 - 중복 제거 초강화 버전
 """
 
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict
-import re
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Dict, Optional
+from news_core.naver_search_client import (
+    MAX_DISPLAY, MAX_START, NaverSearchClient, NaverSearchError, RequestBudget, RequestBudgetExceeded,
+    get_client
+)
+from news_core.seen_store import SeenArticleStore
+from news_core.near_duplicate import DEFAULT_THRESHOLD, NearDuplicateIndex, remove_near_duplicates
+from news_core.quota import QuotaManager, get_quota_manager
+from news_core.relevance_scorer import RelevanceScorer
+from news_core.search import iter_news_pages
+from news_core.text import clean_html, filter_by_date
+
+# 관련도 점수 설정 (키워드 가중치, 최신성, 매체 다양성, 상위 개수, 날짜 범위)
+DEFAULT_SCORING_CONFIG = os.environ.get(
+    'EMPLOYMENT_SCORING_CONFIG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoring_config.json')
+)
+
+# 수집 모드
+# - standard: 키워드마다 display=15, 직전 실행 커서까지 최대 max_pages 페이지
+# - deep: 키워드마다 display=100, 날짜 범위(max_age_days) 끝까지 페이지 이동 (고재현율)
+COLLECT_MODES = ('standard', 'deep')
+DEFAULT_COLLECT_MODE = os.environ.get('EMPLOYMENT_COLLECT_MODE', 'standard')
+
+# 실행 한 번의 네이버 API 요청 상한 (deep 최대 키워드 5개 x 10페이지, 오늘 남은 한도를 넘지 않음)
+DEFAULT_REQUEST_BUDGET = int(os.environ.get('EMPLOYMENT_REQUEST_BUDGET', '50'))
+
+# 호출 장부의 검색어별 수확량 구분
+QUOTA_NAMESPACE = 'employment'
 
 class NaverEmploymentCollector:
     """고용뉴스 전문 수집기 (중복 제거 초강화)"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str,
+                 client: Optional[NaverSearchClient] = None,
+                 seen_store: Optional[SeenArticleStore] = None, max_pages: int = 3,
+                 similarity_threshold: float = DEFAULT_THRESHOLD, scorer: Optional[RelevanceScorer] = None,
+                 mode: str = DEFAULT_COLLECT_MODE, request_budget: Optional[RequestBudget] = None,
+                 quota: Optional[QuotaManager] = None):
+        if mode not in COLLECT_MODES:
+            raise ValueError(f"알 수 없는 수집 모드: {mode} ({', '.join(COLLECT_MODES)})")
+        
         self.client_id = client_id
         self.client_secret = client_secret
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
         
-        self.employment_keywords = [
-            '채용', '신입사원', '경력직', '구인', '일자리',
-            '취업', '고용', '인력', '직원모집', '리크루팅',
-            '입사', '면접', '인재채용', '대규모채용', '청년채용'
-        ]
+        # 커넥션 풀을 공유하는 검색 클라이언트
+        self.client = client or get_client(client_id, client_secret)
+        
+        # 실행 간 발송 기록 / 검색어별 커서
+        self.seen_store = seen_store or SeenArticleStore('employment')
+        self.max_pages = max_pages
+        
+        # 제목 bigram 자카드 유사도가 이 값 이상이면 같은 기사로 판단
+        self.similarity_threshold = similarity_threshold
+        
+        # 설정 파일을 한 번 컴파일한 점수 계산기
+        self.scorer = scorer or RelevanceScorer.from_file(DEFAULT_SCORING_CONFIG)
+    
+        # 수집 모드 / 인증 정보별 일일 호출 장부와 실행당 요청 예산
+        self.mode = mode
+        self.quota = quota or get_quota_manager(client_id)
+        self.request_budget = request_budget or self.quota.budget(DEFAULT_REQUEST_BUDGET)
+        
+        # 검색할 핵심 키워드
+        self.main_keywords = ['채용 공고', '신입 채용', '대규모 채용', '일자리', '취업']
     
-    def collect_unique_news(self, count: int = 30) -> List[Dict]:
+    def collect_unique_news(self, count: Optional[int] = None) -> List[Dict]:
         """
-        중복 제거된 고용뉴스 수집
+        중복 제거된 고용뉴스 수집 (count가 없으면 설정의 top_k개)
         """
         
+        if self.mode == 'deep':
+            return self._collect_deep(count)
+        
         all_news = []
         
-        # 핵심 키워드로 검색
-        main_keywords = ['채용 공고', '신입 채용', '대규모 채용', '일자리', '취업']
+        def keep(page: List[Dict]) -> int:
+            all_news.extend(page)
+            return len(filter_by_date(self.seen_store.filter_unseen(page), days=self.scorer.max_age_days))
         
-        for keyword in main_keywords:
-            try:
-                news = self._search_news(keyword, display=15)
-                all_news.extend(news)
-            except Exception as e:
-                print(f"⚠️ '{keyword}' 검색 실패: {e}")
-                continue
+        # 핵심 키워드로 검색 (남은 예산에 맞춘 검색어만)
+        for keyword in self._planned_keywords():
+            if not self._search_keyword(keyword, keep):
+                break
         
         print(f"  수집: {len(all_news)}개")
+        print(f"  {self.client.stats.summary()}")
+        print(f"  {self.quota.report(self.request_budget)}")
+        
+        # 0단계: 이전 실행에서 이미 발송한 기사 제외
+        all_news = self.seen_store.filter_unseen(all_news)
+        print(f"  발송 이력 제외 후: {len(all_news)}개")
         
         # 1단계: URL 기반 중복 제거
         unique_by_url = self._remove_duplicates_by_url(all_news)
         print(f"  URL 중복 제거 후: {len(unique_by_url)}개")
         
-        # 2단계: 제목 핵심 키워드 기반 중복 제거 (강화!)
+        # 2단계: 제목 유사도(MinHash) 기반 중복 제거
         unique_by_title = self._remove_duplicates_by_title_v2(unique_by_url)
         print(f"  제목 중복 제거 후: {len(unique_by_title)}개")
         
         # 3단계: 날짜 필터링
-        filtered = self._filter_by_date(unique_by_title, days=2)
+        filtered = filter_by_date(unique_by_title, days=self.scorer.max_age_days)
         print(f"  날짜 필터링 후: {len(filtered)}개")
         
-        # 4단계: 관련도 점수 계산
-        scored = self._calculate_relevance_score(filtered)
-        
-        return scored[:count]
+        # 4단계: 관련도 점수 상위 count개
+        return self.scorer.select(filtered, count)
     
-    def _search_news(self, query: str, display: int = 10) -> List[Dict]:
-        """네이버 뉴스 API 검색"""
-        
-        headers = {
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
-        }
-        
-        params = {
-            'query': query,
-            'display': display,
-            'sort': 'date'
-        }
-        
-        response = requests.get(
-            self.base_url,
-            headers=headers,
-            params=params,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            return response.json().get('items', [])
-        else:
-            raise Exception(f"API 오류: {response.status_code}")
-    
-    def _remove_duplicates_by_url(self, news_list: List[Dict]) -> List[Dict]:
-        """URL 기반 중복 제거"""
+    def _collect_deep(self, count: Optional[int] = None) -> List[Dict]:
+        """
+        고재현율 수집 - 받은 페이지를 바로 발송 이력/URL/제목/날짜로 걸러 통과한 기사만 보관
+        (원본 응답은 한 페이지 분량만 메모리에 있음)
+        """
         
         seen_urls = set()
-        unique_news = []
+        title_index = NearDuplicateIndex(threshold=self.similarity_threshold)
+        received = 0
+        candidates = []
         
-        for news in news_list:
-            link = news.get('link', '')
+        def keep(page: List[Dict]) -> int:
+            nonlocal received
+            received += len(page)
             
-            # URL 정규화 (파라미터 제거)
-            normalized_link = link.split('?')[0]
-            
-            if normalized_link and normalized_link not in seen_urls:
-                seen_urls.add(normalized_link)
-                unique_news.append(news)
+            fresh = self._take_new(page, seen_urls, title_index)
+            candidates.extend(fresh)
+            return len(fresh)
         
-        return unique_news
+        for keyword in self._planned_keywords():
+            if not self._search_keyword(keyword, keep):
+                break
+        
+        print(f"  수집: {received}개 → 중복/날짜 제외 후 {len(candidates)}개")
+        print(f"  {self.client.stats.summary()}")
+        print(f"  {self.quota.report(self.request_budget)}")
+        
+        return self.scorer.select(candidates, count)
     
-    def _remove_duplicates_by_title_v2(self, news_list: List[Dict]) -> List[Dict]:
+    def iter_unique_news(self, count: int = 10) -> Iterator[List[Dict]]:
         """
-        제목 기반 중복 제거 - 강화 버전
-        핵심 키워드 추출 방식 개선
+        키워드 검색이 끝날 때마다 새 기사를 묶음으로 반환 (스트리밍 발송용)
+        앞 묶음과의 중복도 제거하고 전체 count개까지, 묶음 안에서만 관련도 순 선택
         """
         
-        seen_signatures = set()
-        unique_news = []
-        
-        for news in news_list:
-            title = self._clean_title(news.get('title', ''))
+        seen_urls = set()
+        title_index = NearDuplicateIndex(threshold=self.similarity_threshold)
+        remaining = count
+        batch = []
+        
+        def keep(page: List[Dict]) -> int:
+            fresh = self._take_new(page, seen_urls, title_index)
+            batch.extend(fresh)
+            return len(fresh)
+        
+        for keyword in self._planned_keywords():
+            if remaining <= 0:
+                break
             
-            # 핵심 키워드 시그니처 생성 (개선!)
-            signature = self._create_enhanced_signature(title)
+            batch.clear()
+            searched = self._search_keyword(keyword, keep)
             
-            if signature and signature not in seen_signatures:
-                seen_signatures.add(signature)
-                unique_news.append(news)
-            else:
-                # 디버그: 중복 제거된 항목 출력
-                print(f"    🔄 중복 제거: {title[:30]}...")
+            selected = self.scorer.select(batch, remaining)
+            print(f"  '{keyword}': 새 기사 {len(selected)}개")
+            
+            if selected:
+                remaining -= len(selected)
+                yield selected
+            
+            if not searched:
+                break
         
-        return unique_news
+        print(f"  {self.client.stats.summary()}")
+        print(f"  {self.quota.report(self.request_budget)}")
     
-    def _create_enhanced_signature(self, title: str) -> str:
-        """
-        향상된 시그니처 생성
+    def _planned_keywords(self) -> List[str]:
+        """남은 요청 예산에 들어가는 핵심 키워드 (넘치면 과거 수확량이 높은 순)"""
         
-        핵심 아이디어:
-        1. 숫자 추출 (예: 820명, 200명)
-        2. 회사명 추출 (예: 서울교통공사, 현대중공업)
-        3. 핵심 단어 추출 (채용, 수주, 투자)
+        default_cost = MAX_START // MAX_DISPLAY if self.mode == 'deep' else self.max_pages
+        return self.quota.plan(QUOTA_NAMESPACE, self.main_keywords, self.request_budget,
+                               default_cost=default_cost)
+    
+    def _search_keyword(self, keyword: str, keep: Callable[[List[Dict]], int]) -> bool:
+        """
+        키워드 하나의 결과 페이지를 keep에 넘기고 (keep은 쓸 만한 기사 수 반환)
+        요청 수/쓸 만한 기사 수를 호출 장부에 기록, 요청 예산이 소진되면 False
+        오류 응답은 경고만 남기고 다음 키워드로
         """
         
-        # HTML 태그 제거
-        title = re.sub(r'<[^>]+>', '', title)
-        title = title.replace('&quot;', '"').replace('&apos;', "'").replace('&amp;', '&')
+        pages = useful = 0
         
-        # 1. 숫자 추출 (채용 인원, 금액 등)
-        numbers = re.findall(r'\d+(?:만|명|억|조)?', title)
+        try:
+            for page in self._iter_pages(keyword):
+                pages += 1
+                useful += keep(page)
         
-        # 2. 회사명 추출 (주요 기업명 패턴)
-        companies = []
-        company_keywords = [
-            '현대', '삼성', '엘지', 'LG', 'SK', '포스코', '한화',
-            '네이버', '카카오', '쿠팡', '배민', '토스',
-            '교통공사', '전력공사', '수자원공사', '도로공사',
-            '건설', '중공업', '전자', '화학', '금융', '은행'
-        ]
+        except RequestBudgetExceeded as e:
+            print(f"⚠️ {e} - 남은 키워드 건너뜀")
+            return False
         
-        for keyword in company_keywords:
-            if keyword in title:
-                companies.append(keyword)
+        except NaverSearchError as e:
+            # 오류 응답도 한도를 쓴 요청
+            pages += 1
+            print(f"⚠️ '{keyword}' 검색 실패: {e}")
         
-        # 3. 핵심 행위 추출
-        actions = []
-        action_keywords = ['채용', '모집', '선발', '입사', '구인', '수주', '투자', '확대', '증원']
+        except Exception as e:
+            print(f"⚠️ '{keyword}' 검색 실패: {e}")
         
-        for keyword in action_keywords:
-            if keyword in title:
-                actions.append(keyword)
+        finally:
+            if pages:
+                self.quota.record(QUOTA_NAMESPACE, keyword, pages, useful)
         
-        # 시그니처 생성: 회사명 + 숫자 + 행위
-        signature_parts = []
+        return True
+    
+    def _iter_pages(self, query: str) -> Iterator[List[Dict]]:
+        """
+        네이버 뉴스 API 검색 결과를 페이지 단위로 (오류 응답은 NaverSearchError)
+        standard: 직전 실행 커서 이후 기사까지만 페이지 이동
+        deep: 날짜 범위 하한까지 display=100으로 페이지 이동 (최신순이라 범위를 벗어나면 중단)
+        """
         
-        if companies:
-            signature_parts.extend(sorted(companies)[:2])  # 상위 2개
+        if self.mode == 'deep':
+            until = datetime.now(timezone.utc) - timedelta(days=self.scorer.max_age_days)
+            return iter_news_pages(self.client, self.seen_store, query, display=MAX_DISPLAY,
+                                   max_pages=MAX_START // MAX_DISPLAY, until=until,
+                                   budget=self.request_budget)
         
-        if numbers:
-            signature_parts.extend(sorted(numbers)[:2])  # 상위 2개
+        return iter_news_pages(self.client, self.seen_store, query, display=15,
+                               max_pages=self.max_pages, budget=self.request_budget)
+    
+    def _take_new(self, items: List[Dict], seen_urls: set,
+                  title_index: NearDuplicateIndex) -> List[Dict]:
+        """앞서 받은 기사와 URL/제목이 겹치지 않고 날짜 범위 안인 미발송 기사"""
         
-        if actions:
-            signature_parts.extend(sorted(actions)[:2])  # 상위 2개
+        fresh = []
         
-        # 최종 시그니처
-        signature = '_'.join(signature_parts)
+        for item in self.seen_store.filter_unseen(items):
+            normalized_link = item.get('link', '').split('?')[0]
+            
+            if not normalized_link or normalized_link in seen_urls:
+                continue
+            seen_urls.add(normalized_link)
+            
+            if title_index.add(clean_html(item.get('title', ''))):
+                fresh.append(item)
         
-        return signature.lower()
+        return filter_by_date(fresh, days=self.scorer.max_age_days)
     
-    def _clean_title(self, title: str) -> str:
-        """제목 정리"""
-        
-        # HTML 태그 제거
-        title = re.sub(r'<[^>]+>', '', title)
+    def mark_delivered(self, news_list: List[Dict]):
+        """발송 완료 기사를 기록해 다음 실행부터 제외"""
         
-        # HTML 엔티티 변환
-        title = title.replace('&quot;', '"')
-        title = title.replace('&apos;', "'")
-        title = title.replace('&amp;', '&')
-        
-        return title.strip()
+        self.seen_store.mark_delivered(news_list)
     
-    def _filter_by_date(self, news_list: List[Dict], days: int = 2) -> List[Dict]:
-        """최근 N일 이내 뉴스만"""
+    def _remove_duplicates_by_url(self, news_list: List[Dict]) -> List[Dict]:
+        """URL 기반 중복 제거"""
         
-        cutoff_date = datetime.now() - timedelta(days=days)
-        filtered = []
+        seen_urls = set()
+        unique_news = []
         
         for news in news_list:
-            pub_date_str = news.get('pubDate', '')
+            link = news.get('link', '')
+            
+            # URL 정규화 (파라미터 제거)
+            normalized_link = link.split('?')[0]
             
-            try:
-                pub_date = datetime.strptime(
-                    pub_date_str,
-                    '%a, %d %b %Y %H:%M:%S %z'
-                )
-                
-                pub_date_naive = pub_date.replace(tzinfo=None)
-                
-                if pub_date_naive >= cutoff_date:
-                    filtered.append(news)
-                    
-            except Exception:
-                # 날짜 파싱 실패 시 포함
-                filtered.append(news)
-        
-        return filtered
+            if normalized_link and normalized_link not in seen_urls:
+                seen_urls.add(normalized_link)
+                unique_news.append(news)
+        
+        return unique_news
     
-    def _calculate_relevance_score(self, news_list: List[Dict]) -> List[Dict]:
-        """관련도 점수 계산"""
+    def _remove_duplicates_by_title_v2(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        제목 기반 중복 제거 - 유사도 버전
+        문자 bigram MinHash + LSH로 같은 기사의 다른 제목까지 제거
+        """
         
-        for news in news_list:
-            score = 0
-            title = news.get('title', '').lower()
-            description = news.get('description', '').lower()
-            content = f"{title} {description}"
-            
-            # 핵심 키워드 가중치
-            high_priority = ['채용 공고', '신입 채용', '대규모 채용', '인재 영입']
-            medium_priority = ['채용', '구인', '일자리', '입사']
-            
-            for keyword in high_priority:
-                if keyword in content:
-                    score += 5
-            
-            for keyword in medium_priority:
-                score += content.count(keyword) * 2
-            
-            for keyword in self.employment_keywords:
-                if keyword in content:
-                    score += 1
-            
-            news['relevance_score'] = score
+        def log_duplicate(news: Dict):
+            # 디버그: 중복 제거된 항목 출력
+            print(f"    🔄 중복 제거: {clean_html(news.get('title', ''))[:30]}...")
         
-        return sorted(
+        return remove_near_duplicates(
             news_list,
-            key=lambda x: x.get('relevance_score', 0),
-            reverse=True
+            lambda news: clean_html(news.get('title', '')),
+            threshold=self.similarity_threshold,
+            on_duplicate=log_duplicate
         )
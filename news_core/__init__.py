@@ -0,0 +1,7 @@
+"""
+세 봇(기업뉴스/고용뉴스/고용24)이 함께 쓰는 모듈
+
+- 네이버 검색 클라이언트/응답 캐시/호출 한도 장부, 발송 기록, 유사 기사 제거
+- LLM 실행기/출력 캐시
+- 카카오 토큰 관리/템플릿/발송
+"""
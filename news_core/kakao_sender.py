@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카카오톡 발송 시스템
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Union
+from .kakao_token_manager import get_token_manager
+from .kakao_templates import text_template
+
+# 연속 발송 최소 간격 (초)
+MESSAGE_INTERVAL = 1.0
+
+class KakaoSender:
+    """카카오톡 나에게 보내기"""
+    
+    def __init__(self, rest_api_key: str, refresh_token: str, min_interval: float = MESSAGE_INTERVAL,
+                 home_url: str = "https://www.naver.com"):
+        self.rest_api_key = rest_api_key
+        
+        # 문자열 메시지의 text 템플릿 버튼 링크
+        self.home_url = home_url
+        
+        # 액세스 토큰은 만료 전까지 재사용 (같은 앱 키의 발송기끼리 공유)
+        self.tokens = get_token_manager(rest_api_key, refresh_token)
+        
+        self.message_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        
+        # 토큰 발급과 같은 커넥션 풀 사용 (한 프로세스에서 여러 봇이 돌아도 kakao 연결 하나)
+        self.session = self.tokens.session
+        
+        # 연속 발송 속도 제한
+        self.min_interval = min_interval
+        self._last_sent = 0.0
+        self._send_lock = threading.Lock()
+    
+    def send_messages(self, messages: List[Union[str, Dict]]) -> int:
+        """
+        여러 메시지를 순서대로 발송 (같은 세션/토큰, 발송 간격 유지)
+        중간에 실패하면 순서가 어긋나지 않도록 멈추고, 성공한 개수 반환
+        """
+        
+        sent = 0
+        
+        for i, message in enumerate(messages, 1):
+            print(f"  ({i}/{len(messages)}) {self._describe(message)}")
+            
+            if not self.send_message(message):
+                break
+            sent += 1
+        
+        return sent
+    
+    @staticmethod
+    def _describe(message: Union[str, Dict]) -> str:
+        if isinstance(message, str):
+            return f"{len(message)}자"
+        return f"{message.get('object_type')} 템플릿"
+    
+    def _wait_for_slot(self):
+        with self._send_lock:
+            wait = self._last_sent + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_sent = time.monotonic()
+    
+    def send_message(self, message: Union[str, Dict]) -> bool:
+        """메시지 발송 (문자열은 text 템플릿, 딕셔너리는 렌더링된 템플릿 객체)"""
+        
+        access_token = self.tokens.get_access_token()
+        
+        if not access_token:
+            print("❌ 액세스 토큰 발급 실패")
+            return False
+        
+        print(f"✓ 액세스 토큰 준비 (이번 실행 발급 {self.tokens.refreshes}회)")
+        
+        try:
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+            
+            if isinstance(message, str):
+                message = text_template(message, self.home_url)
+            
+            data = {
+                "template_object": json.dumps(message, ensure_ascii=False)
+            }
+            
+            self._wait_for_slot()
+            
+            response = self.session.post(
+                self.message_url,
+                headers=headers,
+                data=data,
+                timeout=10
+            )
+            
+            # 저장해 둔 토큰이 중간에 폐기된 경우 한 번만 재발급 후 재시도
+            if response.status_code == 401:
+                self.tokens.invalidate()
+                access_token = self.tokens.get_access_token()
+                
+                if access_token:
+                    headers["Authorization"] = f"Bearer {access_token}"
+                    response = self.session.post(
+                        self.message_url,
+                        headers=headers,
+                        data=data,
+                        timeout=10
+                    )
+            
+            if response.status_code == 200:
+                print("✓ 카카오톡 발송 성공")
+                return True
+            else:
+                print(f"❌ 발송 실패: {response.json()}")
+                return False
+        
+        except Exception as e:
+            print(f"❌ 발송 오류: {e}")
+            return False
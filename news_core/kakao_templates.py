@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카카오톡 메시지 템플릿 렌더러 - text / list / feed 템플릿 객체 생성
+템플릿 문자열은 한 번만 파싱(컴파일)해 두고 재사용
+"""
+
+import os
+import string
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# text 템플릿 글자 수 한도
+MAX_TEXT_LENGTH = 1000
+
+# list 템플릿 항목 수 (2~3개, 1개면 feed 템플릿)
+MAX_LIST_ITEMS = 3
+
+# list/feed 템플릿 필드 글자 수 (말줄임표 포함)
+TITLE_LENGTH = 60
+DESCRIPTION_LENGTH = 80
+
+# 기본 메시지 형식 (text / list)
+# list 항목 링크는 카카오 앱에 등록된 도메인만 열리므로 원문 URL이 보이는 text가 기본
+DEFAULT_STYLE = os.environ.get('KAKAO_TEMPLATE', 'text')
+
+class CompiledTemplate:
+    """
+    str.format 형식 템플릿을 리터럴/필드 조각으로 미리 파싱
+    렌더링은 조각을 이어 붙이기만 함 (매번 서식 문자열을 해석하지 않음)
+    """
+    
+    def __init__(self, source: str):
+        self.source = source
+        self.parts: List[Tuple[str, Optional[str]]] = []
+        
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if spec or conversion:
+                raise ValueError(f"서식 지정자는 지원하지 않음: {source!r}")
+            self.parts.append((literal, field))
+    
+    def render(self, values: Dict[str, str]) -> str:
+        return ''.join(
+            literal + str(values[field]) if field else literal
+            for literal, field in self.parts
+        )
+
+# 텍스트 메시지 기본 형식
+GROUP_TEXT = CompiledTemplate("{heading}\n{items}")
+ITEM_TEXT = CompiledTemplate("{index}. {title}\n   {link}\n")
+
+def truncate(text: str, limit: int) -> str:
+    """limit 글자 이하로 (자르면 말줄임표 포함)"""
+    
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+def link(url: str) -> Dict[str, str]:
+    return {"web_url": url, "mobile_web_url": url}
+
+def text_template(text: str, url: str) -> Dict:
+    return {
+        "object_type": "text",
+        "text": text,
+        "link": link(url)
+    }
+
+def feed_template(item: Dict, url: str, heading: Optional[str] = None) -> Dict:
+    """항목 하나짜리 feed 템플릿 (heading이 있으면 제목 앞에 붙임)"""
+    
+    title = item.get('title', '')
+    if heading:
+        title = f"[{heading}] {title}"
+    
+    return {
+        "object_type": "feed",
+        "content": {
+            "title": truncate(title, TITLE_LENGTH),
+            "description": truncate(item.get('description', ''), DESCRIPTION_LENGTH),
+            "link": link(item.get('link') or url)
+        },
+        "buttons": [{"title": "자세히 보기", "link": link(item.get('link') or url)}]
+    }
+
+def list_templates(header_title: str, items: Sequence[Dict], url: str) -> List[Dict]:
+    """
+    항목을 MAX_LIST_ITEMS개씩 list 템플릿으로 (항목마다 자기 링크)
+    남은 항목이 1개면 feed 템플릿 (그룹 제목은 항목 제목 앞에)
+    """
+    
+    chunks = [items[i:i + MAX_LIST_ITEMS] for i in range(0, len(items), MAX_LIST_ITEMS)]
+    templates = []
+    
+    for i, chunk in enumerate(chunks, 1):
+        title = header_title if len(chunks) == 1 else f"{header_title} ({i}/{len(chunks)})"
+        
+        if len(chunk) == 1:
+            templates.append(feed_template(chunk[0], url, heading=title))
+            continue
+        
+        templates.append({
+            "object_type": "list",
+            "header_title": truncate(title, TITLE_LENGTH),
+            "header_link": link(url),
+            "contents": [
+                {
+                    "title": truncate(item.get('title', ''), TITLE_LENGTH),
+                    "description": truncate(item.get('description', ''), DESCRIPTION_LENGTH),
+                    "link": link(item.get('link') or url)
+                }
+                for item in chunk
+            ],
+            "buttons": [{"title": "전체 보기", "link": link(url)}]
+        })
+    
+    return templates
+
+def split_message(header: str, sections: List[str], limit: int = MAX_TEXT_LENGTH,
+                  separator: str = "\n") -> List[str]:
+    """
+    섹션 경계에서 나눠 limit 이하 메시지 목록으로 (순서 유지, 내용 생략 없음)
+    메시지가 여러 개면 헤더 뒤에 (1/N) 표시, 한도보다 긴 섹션은 줄 단위로 나눔
+    """
+    
+    # (i/N) 표시 자리를 미리 빼 둔 본문 한도
+    budget = limit - len(header) - len("(99/99)\n")
+    
+    if budget <= 0:
+        raise ValueError("헤더가 메시지 한도보다 깁니다")
+    
+    pieces = []
+    
+    for section in sections:
+        if len(section) <= budget:
+            pieces.append(section)
+            continue
+        
+        # 긴 섹션은 줄 단위로 (한 줄이 한도보다 길면 잘라서)
+        chunk = ""
+        for line in section.split("\n"):
+            while len(line) > budget:
+                if chunk:
+                    pieces.append(chunk)
+                    chunk = ""
+                pieces.append(line[:budget])
+                line = line[budget:]
+            
+            candidate = f"{chunk}\n{line}" if chunk else line
+            if len(candidate) > budget:
+                pieces.append(chunk)
+                candidate = line
+            chunk = candidate
+        
+        if chunk:
+            pieces.append(chunk)
+    
+    bodies = []
+    current = ""
+    
+    for piece in pieces:
+        candidate = f"{current}{separator}{piece}" if current else piece
+        
+        if len(candidate) > budget:
+            bodies.append(current)
+            candidate = piece
+        
+        current = candidate
+    
+    if current or not bodies:
+        bodies.append(current)
+    
+    if len(bodies) == 1:
+        return [header + bodies[0]]
+    
+    return [
+        f"{header}({i}/{len(bodies)})\n{body}"
+        for i, body in enumerate(bodies, 1)
+    ]
+
+class DigestRenderer:
+    """
+    (제목, 항목 목록) 그룹들을 카카오 템플릿 객체 목록으로 렌더링
+    항목은 title / description / link 필드를 가진 딕셔너리
+    
+    - list: 그룹마다 list 템플릿 (3개씩, 항목별 링크)
+    - text: item_text/group_text 템플릿으로 만든 텍스트를 1000자 단위로 분할
+      (제목 있는 그룹은 그룹 경계, 제목 없는 그룹은 항목 경계에서 나눔)
+    """
+    
+    def __init__(self, title: str, home_url: str, style: Optional[str] = None,
+                 rule: str = "=" * 30, item_text: CompiledTemplate = ITEM_TEXT,
+                 group_text: CompiledTemplate = GROUP_TEXT, separator: str = "\n"):
+        self.title = title
+        self.home_url = home_url
+        self.style = style or DEFAULT_STYLE
+        self.text_header = f"{title}\n{rule}\n\n"
+        self.item_text = item_text
+        self.group_text = group_text
+        self.separator = separator
+        
+        if self.style not in ('list', 'text'):
+            raise ValueError(f"알 수 없는 메시지 형식: {self.style}")
+    
+    def render(self, groups: Sequence[Tuple[str, Sequence[Dict]]]) -> List[Dict]:
+        groups = [(heading, items) for heading, items in groups if items]
+        
+        if self.style == 'list':
+            return [
+                template
+                for heading, items in groups
+                for template in list_templates(heading or self.title, items, self.home_url)
+            ]
+        
+        sections = []
+        
+        for heading, items in groups:
+            rendered = [
+                self.item_text.render(dict(item, index=i))
+                for i, item in enumerate(items, 1)
+            ]
+            
+            if heading:
+                sections.append(self.group_text.render({'heading': heading, 'items': ''.join(rendered)}))
+            else:
+                sections.extend(rendered)
+        
+        return [
+            text_template(message, self.home_url)
+            for message in split_message(self.text_header, sections, separator=self.separator)
+        ]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카카오 토큰 관리 - 액세스 토큰 재사용 + 갱신된 리프레시 토큰 암호화 보관
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from typing import Dict, Optional
+from .paths import DEFAULT_CACHE_DIR
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # 암호화 라이브러리가 없으면 메모리에만 보관
+    Fernet = None
+    InvalidToken = ValueError
+
+TOKEN_URL = "https://kauth.kakao.com/oauth/token"
+
+# 만료 5분 전부터는 새로 발급
+REFRESH_MARGIN = 300
+
+def _fingerprint(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+class KakaoTokenManager:
+    """
+    만료 시각까지 액세스 토큰을 재사용하고, 재발급된 리프레시 토큰은 암호화 파일로 저장
+    다음 실행은 저장된 토큰으로 시작 (환경 변수의 리프레시 토큰이 바뀌면 그 값을 우선)
+    """
+    
+    def __init__(self, rest_api_key: str, refresh_token: str, path: Optional[str] = None,
+                 encryption_key: Optional[str] = None):
+        self.rest_api_key = rest_api_key
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'kakao_token.enc')
+        
+        self.session = requests.Session()
+        self._lock = threading.Lock()
+        
+        self.refresh_token = refresh_token
+        self.access_token: Optional[str] = None
+        self.expires_at = 0.0
+        self.refreshes = 0
+        
+        # 시크릿에 넣은 원래 리프레시 토큰 (바뀌었는지 확인용)
+        self._source = _fingerprint(refresh_token)
+        self._fernet = self._make_fernet(encryption_key or os.environ.get('KAKAO_TOKEN_KEY'))
+        
+        self._load()
+    
+    def _make_fernet(self, encryption_key: Optional[str]):
+        """KAKAO_TOKEN_KEY(Fernet 키)가 없으면 REST API 키에서 유도"""
+        
+        if Fernet is None:
+            return None
+        
+        if encryption_key:
+            return Fernet(encryption_key.encode('utf-8'))
+        
+        digest = hashlib.sha256(f"kakao-token:{self.rest_api_key}".encode('utf-8')).digest()
+        return Fernet(base64.urlsafe_b64encode(digest))
+    
+    def get_access_token(self) -> Optional[str]:
+        """유효한 액세스 토큰 (만료가 가까우면 재발급, 실패 시 None)"""
+        
+        with self._lock:
+            if self.access_token and time.time() < self.expires_at - REFRESH_MARGIN:
+                return self.access_token
+            
+            return self._refresh()
+    
+    def invalidate(self):
+        """401 등으로 거절된 토큰은 다음 호출에서 재발급"""
+        
+        with self._lock:
+            self.access_token = None
+            self.expires_at = 0.0
+    
+    def _refresh(self) -> Optional[str]:
+        try:
+            response = self.session.post(
+                TOKEN_URL,
+                data={
+                    "grant_type": "refresh_token",
+                    "client_id": self.rest_api_key,
+                    "refresh_token": self.refresh_token
+                },
+                timeout=10
+            )
+            
+            if response.status_code != 200:
+                print(f"❌ 토큰 발급 실패: {response.json()}")
+                return None
+            
+            token_data = response.json()
+        
+        except Exception as e:
+            print(f"❌ 토큰 발급 오류: {e}")
+            return None
+        
+        self.refreshes += 1
+        self.access_token = token_data.get('access_token')
+        self.expires_at = time.time() + int(token_data.get('expires_in', 0))
+        
+        # 리프레시 토큰은 만료가 가까울 때만 새로 내려옴
+        new_refresh_token = token_data.get('refresh_token')
+        if new_refresh_token:
+            self.refresh_token = new_refresh_token
+        
+        self._save()
+        
+        return self.access_token
+    
+    def _load(self):
+        if self._fernet is None:
+            return
+        
+        try:
+            with open(self.path, 'rb') as f:
+                data: Dict = json.loads(self._fernet.decrypt(f.read()))
+        except (OSError, ValueError, InvalidToken):
+            return
+        
+        # 시크릿이 새 토큰으로 교체됐으면 저장본은 버림
+        if data.get('source') != self._source:
+            return
+        
+        self.refresh_token = data.get('refresh_token') or self.refresh_token
+        self.access_token = data.get('access_token')
+        self.expires_at = float(data.get('expires_at', 0))
+    
+    def _save(self):
+        if self._fernet is None:
+            return
+        
+        data = {
+            'source': self._source,
+            'refresh_token': self.refresh_token,
+            'access_token': self.access_token,
+            'expires_at': self.expires_at
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self._fernet.encrypt(json.dumps(data).encode('utf-8')))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 토큰 저장 실패: {e}")
+
+_managers: Dict[str, KakaoTokenManager] = {}
+_managers_lock = threading.Lock()
+
+def get_token_manager(rest_api_key: str, refresh_token: str) -> KakaoTokenManager:
+    """같은 앱 키의 토큰 관리자는 프로세스 안에서 하나만 생성해 공유"""
+    
+    with _managers_lock:
+        manager: Optional[KakaoTokenManager] = _managers.get(rest_api_key)
+        
+        if manager is None:
+            manager = KakaoTokenManager(rest_api_key, refresh_token)
+            _managers[rest_api_key] = manager
+        
+        return manager
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색어 수확량 학습 - 과거 실행의 쓸 만한 기사 수로 검색 순서/가지치기/재탐색 결정
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+from .quota import KeywordYield
+
+class KeywordPlanner:
+    """
+    검색어 묶음(wave)을 필요한 만큼만 내주는 계획 (한 섹션/한 실행용)
+    - 기록 없는 검색어와 reexplore_days 동안 검색하지 않은 검색어는 첫 묶음에 포함 (재탐색)
+    - 나머지는 요청당 쓸 만한 기사 수가 많은 순으로, 부족한 개수를 채울 것으로 예상되는 만큼씩
+    - min_runs번 이상 검색했는데 평균 min_yield개 미만이면 가지치기 (다른 검색어로 못 채울 때만 마지막 묶음)
+    """
+    
+    def __init__(self, keywords: Iterable[str], history: Dict[str, KeywordYield],
+                 min_yield: float = 0.5, min_runs: int = 3, reexplore_days: float = 7,
+                 now: Optional[float] = None):
+        now = time.time() if now is None else now
+        stale_before = now - reexplore_days * 24 * 60 * 60
+        
+        self.explore: List[str] = []
+        self.ranked: List[str] = []
+        self.pruned: List[str] = []
+        
+        for keyword in dict.fromkeys(keywords):
+            known = history.get(keyword)
+            
+            if known is None or known.updated_at < stale_before:
+                self.explore.append(keyword)
+            elif known.runs >= min_runs and known.avg_items < min_yield:
+                self.pruned.append(keyword)
+            else:
+                self.ranked.append(keyword)
+        
+        # 수확량이 같으면 원래 순서
+        self.ranked.sort(key=lambda keyword: history[keyword].items_per_call, reverse=True)
+        self._expected = {keyword: history[keyword].avg_items for keyword in self.ranked}
+        
+        self._explore = list(self.explore)
+        self._ranked = list(self.ranked)
+        self._pruned = list(self.pruned)
+    
+    def next_wave(self, deficit: int) -> List[str]:
+        """
+        deficit개를 더 채우기 위한 다음 검색어 묶음 (남은 검색어가 없으면 빈 목록)
+        첫 묶음에는 재탐색 검색어가 모두 들어감
+        """
+        
+        wave, self._explore = self._explore, []
+        expected = 0.0
+        
+        while self._ranked and expected < deficit:
+            keyword = self._ranked.pop(0)
+            wave.append(keyword)
+            expected += self._expected[keyword]
+        
+        # 수확이 떨어져 다른 검색어로 못 채우면 가지친 검색어까지
+        if not wave:
+            wave, self._pruned = self._pruned, []
+        
+        return wave
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 키워드 매처 - 키워드 그룹 표를 한 번 컴파일해 본문을 한 번만 훑고 그룹별 적중 수 계산
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class KeywordHits:
+    """그룹별 적중 결과"""
+    
+    def __init__(self, groups: Iterable[str]):
+        # 등장 횟수 (겹치는 위치도 각각 셈)
+        self.counts: Dict[str, int] = dict.fromkeys(groups, 0)
+        
+        # 한 번 이상 나온 서로 다른 키워드 수
+        self.distinct: Dict[str, int] = dict.fromkeys(self.counts, 0)
+    
+    def __repr__(self):
+        return f"KeywordHits(counts={self.counts}, distinct={self.distinct})"
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """키워드 트라이를 정규식으로 (공통 접두사를 한 번만 비교, 선택적 꼬리는 탐욕적이라 가장 긴 키워드)"""
+    
+    trie: Dict[str, dict] = {}
+    
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        
+        if not branches:
+            return ''
+        
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+class KeywordMatcher:
+    """
+    {그룹: 키워드 목록} 표를 정규식 하나로 컴파일한 매처 (Aho–Corasick과 같은 결과)
+    - 키워드 트라이를 정규식으로 옮기고, 키워드 첫 글자가 나온 위치에서만 가장 긴 키워드를 찾음
+      (첫 글자 집합은 정규식 엔진이 C 수준에서 건너뜀, 겹치는 위치도 모두 찾음)
+    - 가장 긴 키워드의 접두사인 키워드들도 같은 위치에서 적중한 것으로 셈
+    - 키워드 수가 늘어도 본문 탐색 비용은 거의 그대로이고, 파이썬 반복은 적중한 키워드 종류 수만큼
+    """
+    
+    def __init__(self, groups: Dict[str, Iterable[str]], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.groups = list(groups)
+        
+        # 키워드 → 속한 그룹 (같은 키워드가 여러 그룹에 있을 수 있음)
+        self._keyword_groups: Dict[str, List[str]] = {}
+        
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                keyword = self._normalize(keyword)
+                
+                if keyword and group not in self._keyword_groups.setdefault(keyword, []):
+                    self._keyword_groups[keyword].append(group)
+        
+        keywords = self.keywords = list(self._keyword_groups)
+        
+        # 첫 글자를 소비해 후보 위치를 찾고, 한 글자 되돌아가 그 위치에서 시작하는 가장 긴 키워드 캡처
+        first_chars = ''.join(sorted({keyword[0] for keyword in keywords}))
+        self._pattern = re.compile(
+            f"[{re.escape(first_chars)}](?<=(?=({_trie_pattern(keywords)})).)"
+        ) if keywords else None
+        
+        # 가장 긴 키워드 → 같은 위치에서 함께 적중하는 (접두사) 키워드 / 그 키워드들이 속한 그룹 (중복 포함)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        self._prefix_groups: Dict[str, Tuple[str, ...]] = {}
+        
+        for keyword in keywords:
+            prefixes = tuple(other for other in keywords if keyword.startswith(other))
+            self._prefixes[keyword] = prefixes
+            self._prefix_groups[keyword] = tuple(
+                group for prefix in prefixes for group in self._keyword_groups[prefix]
+            )
+    
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+    
+    def longest_matches(self, text: str) -> List[str]:
+        """위치별 가장 긴 키워드 목록 (등장 순서, 같은 키워드 반복 포함)"""
+        
+        if self._pattern is None:
+            return []
+        
+        return self._pattern.findall(self._normalize(text))
+    
+    def prefixes(self, keyword: str) -> Tuple[str, ...]:
+        """가장 긴 키워드 하나가 적중할 때 같은 위치에서 함께 적중하는 키워드 (자기 자신 포함)"""
+        
+        return self._prefixes[keyword]
+    
+    def keyword_groups(self, keyword: str) -> List[str]:
+        """키워드가 속한 그룹"""
+        
+        return self._keyword_groups[keyword]
+    
+    def scan(self, text: str) -> KeywordHits:
+        """본문 한 번 탐색으로 그룹별 등장 횟수/서로 다른 키워드 수"""
+        
+        hits = KeywordHits(self.groups)
+        
+        if self._pattern is None:
+            return hits
+        
+        counts, distinct = hits.counts, hits.distinct
+        present = set()
+        
+        # 위치별 최장 키워드를 정규식 엔진 안에서 모두 찾고, 파이썬에서는 미리 펼쳐 둔 그룹만 더함
+        for longest in self._pattern.findall(self._normalize(text)):
+            present.update(self._prefixes[longest])
+            
+            for group in self._prefix_groups[longest]:
+                counts[group] += 1
+        
+        for keyword in present:
+            for group in self._keyword_groups[keyword]:
+                distinct[group] += 1
+        
+        return hits
+    
+    def first_group(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """표 순서상 처음으로 적중한 그룹 (횟수 집계 없이 적중 여부만)"""
+        
+        if self._pattern is None:
+            return default
+        
+        matched = {
+            group
+            for longest in set(self._pattern.findall(self._normalize(text)))
+            for group in self._prefix_groups[longest]
+        }
+        
+        for group in self.groups:
+            if group in matched:
+                return group
+        
+        return default
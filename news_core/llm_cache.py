@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 결과 캐시 - 입력/프롬프트/모델 해시 키의 SQLite 캐시 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from .paths import DEFAULT_CACHE_DIR
+
+def content_key(*parts: str) -> str:
+    """입력 조각들의 sha256 (내용이 같으면 같은 키)"""
+    
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+class LLMOutputCache:
+    """같은 기사 + 같은 프롬프트 + 같은 모델이면 이전 결과 재사용"""
+    
+    def __init__(self, path: Optional[str] = None, max_entries: int = 2000):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'llm_outputs.sqlite3')
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        # 스트리밍 파이프라인에서는 편집 단계 스레드에서 사용
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS outputs (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_outputs_access ON outputs (last_access)')
+        self.conn.commit()
+        
+        # 조회는 메모리 사본에서 (히트 시 마이크로초 단위)
+        self._memory: Dict[str, str] = dict(self.conn.execute('SELECT key, value FROM outputs'))
+        self._touched = set()
+    
+    def get(self, key: str) -> Optional[str]:
+        value = self._memory.get(key)
+        
+        if value is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._touched.add(key)
+        return value
+    
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._memory[key] = value
+            self.conn.execute(
+                'INSERT OR REPLACE INTO outputs VALUES (?, ?, ?)',
+                (key, value, time.time())
+            )
+            self.conn.commit()
+    
+    def flush(self):
+        """이번 실행에서 쓴 항목의 접근 시각 갱신 후 오래 안 쓴 항목부터 정리"""
+        
+        with self._lock:
+            self._flush()
+    
+    def _flush(self):
+        now = time.time()
+        self.conn.executemany(
+            'UPDATE outputs SET last_access = ? WHERE key = ?',
+            [(now, key) for key in self._touched]
+        )
+        self._touched.clear()
+        
+        (count,) = self.conn.execute('SELECT COUNT(*) FROM outputs').fetchone()
+        overflow = count - self.max_entries
+        
+        if overflow > 0:
+            evicted = [
+                key for (key,) in self.conn.execute(
+                    'SELECT key FROM outputs ORDER BY last_access LIMIT ?', (overflow,)
+                )
+            ]
+            self.conn.executemany('DELETE FROM outputs WHERE key = ?', [(key,) for key in evicted])
+            
+            for key in evicted:
+                self._memory.pop(key, None)
+        
+        self.conn.commit()
+    
+    def summary(self) -> str:
+        return f"LLM 캐시 적중 {self.hits}회 / 미스 {self.misses}회"
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
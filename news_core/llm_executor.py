@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 호출 실행기 - 동시 실행 + 토큰 버킷 속도 제한 + 재시도
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+# 재시도할 HTTP 상태 (한도 초과 / 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+class LLMDeadlineExceeded(TimeoutError):
+    """호출 마감 시간 초과"""
+
+def is_retryable(exc: Exception) -> bool:
+    """429/5xx, 타임아웃, 연결 오류만 재시도"""
+    
+    # google.api_core 예외는 code에 HTTP 상태를 담음
+    code = getattr(exc, 'code', None)
+    if not isinstance(code, int):
+        code = getattr(exc, 'status_code', None)
+    
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS
+    
+    return isinstance(exc, (TimeoutError, ConnectionError))
+
+class TokenBucket:
+    """분당 rate만큼 채워지는 토큰 버킷"""
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간 (0이면 바로 꺼냄)"""
+        
+        now = time.monotonic()
+        self._refill(now)
+        
+        # 버킷보다 큰 요청은 가득 찼을 때 통과
+        amount = min(amount, self.capacity)
+        
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        
+        return (amount - self.tokens) / self.rate
+
+class RateLimiter:
+    """요청 수(RPM)와 토큰 수(TPM)를 함께 제한"""
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int, deadline: float):
+        """두 버킷에서 모두 꺼낼 때까지 대기 (deadline 넘기면 LLMDeadlineExceeded)"""
+        
+        while True:
+            with self._lock:
+                wait = self._try_take(tokens)
+            
+            if wait == 0.0:
+                return
+            
+            if time.monotonic() + wait > deadline:
+                raise LLMDeadlineExceeded("속도 제한 대기 중 마감 시간 초과")
+            
+            time.sleep(wait)
+    
+    def _try_take(self, tokens: int) -> float:
+        # 둘 다 가능할 때만 꺼내도록 요청 버킷 먼저 확인 후 되돌림
+        request_wait = self.requests.wait_time(1)
+        if request_wait > 0:
+            return request_wait
+        
+        token_wait = self.tokens.wait_time(tokens)
+        if token_wait > 0:
+            self.requests.tokens += 1
+            return token_wait
+        
+        return 0.0
+
+class LLMExecutor:
+    """
+    워커 풀로 LLM 호출을 동시에 실행
+    결과는 입력 순서대로 반환하고, 실패한 항목은 default로 채움
+    """
+    
+    def __init__(self, max_workers: int = 4, requests_per_minute: float = 10,
+                 tokens_per_minute: float = 250_000, max_retries: int = 3,
+                 base_delay: float = 1.0, max_delay: float = 20.0, deadline: float = 60.0):
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        
+        self.failures = 0
+        self._lock = threading.Lock()
+    
+    def call(self, fn: Callable[[Any, float], Any], item: Any, tokens: int = 1000) -> Any:
+        """
+        fn(item, timeout) 호출
+        429/5xx는 지터 백오프로 재시도, 마감 시간은 재시도까지 포함
+        """
+        
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        
+        while True:
+            self.limiter.acquire(tokens, deadline)
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMDeadlineExceeded("호출 마감 시간 초과")
+            
+            try:
+                return fn(item, remaining)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+            
+            # full jitter: 0 ~ min(max_delay, base * 2^attempt)
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+            attempt += 1
+            
+            if time.monotonic() + delay >= deadline:
+                raise LLMDeadlineExceeded("재시도 대기 중 마감 시간 초과")
+            
+            time.sleep(delay)
+    
+    def map(self, fn: Callable[[Any, float], Any], items: Sequence[Any],
+            estimate_tokens: Optional[Callable[[Any], int]] = None, default: Any = None) -> List[Any]:
+        """items 전체를 동시에 호출하고 입력 순서대로 결과 반환"""
+        
+        def run(item: Any) -> Any:
+            tokens = estimate_tokens(item) if estimate_tokens else 1000
+            
+            try:
+                return self.call(fn, item, tokens)
+            except Exception as e:
+                with self._lock:
+                    self.failures += 1
+                print(f"⚠️ LLM 호출 실패: {e}")
+                return default
+        
+        if not items:
+            return []
+        
+        workers = min(self.max_workers, len(items))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+
+def estimate_tokens(prompt: str, max_output_tokens: int) -> int:
+    """한글 위주 프롬프트 토큰 수 근사 (글자 2개당 1토큰 + 출력 한도)"""
+    
+    return len(prompt) // 2 + max_output_tokens
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+네이버 검색 응답 캐시 - SQLite 디스크 캐시 (TTL + LRU)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from .paths import DEFAULT_CACHE_DIR
+
+class CachedResponse:
+    """캐시된 응답 본문과 조건부 요청용 검증자"""
+    
+    def __init__(self, body: Dict, etag: str, last_modified: str, expires_at: float):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+    
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """만료된 항목 재검증용 헤더"""
+        
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class NaverResponseCache:
+    """(query, display, start, sort) 키의 응답 캐시"""
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 3 * 60 * 60,
+                 max_entries: int = 5000):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'naver_responses.sqlite3')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)')
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(query: str, display: int, start: int, sort: str) -> str:
+        return json.dumps([query, display, start, sort], ensure_ascii=False)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 조회 (만료된 항목도 재검증용으로 반환)"""
+        
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            self.conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key))
+            self.conn.commit()
+        
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(json.loads(body), etag or '', last_modified or '', expires_at)
+    
+    def put(self, key: str, body: Dict, etag: str = '', last_modified: str = '',
+            ttl: Optional[float] = None):
+        """응답 저장 후 용량 초과분은 오래 안 쓴 순서로 제거"""
+        
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (key, json.dumps(body, ensure_ascii=False), etag, last_modified, expires_at, now)
+            )
+            self._evict()
+            self.conn.commit()
+    
+    def touch(self, key: str, ttl: Optional[float] = None):
+        """304 응답으로 재검증된 항목의 만료 시각 연장"""
+        
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        
+        with self._lock:
+            self.conn.execute(
+                'UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?',
+                (expires_at, now, key)
+            )
+            self.conn.commit()
+    
+    def _evict(self):
+        (count,) = self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()
+        overflow = count - self.max_entries
+        
+        if overflow > 0:
+            self.conn.execute(
+                'DELETE FROM responses WHERE key IN '
+                '(SELECT key FROM responses ORDER BY last_access LIMIT ?)',
+                (overflow,)
+            )
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
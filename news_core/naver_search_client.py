@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+네이버 검색 API 공용 클라이언트 - 커넥션 풀 재사용
+"""
+
+import threading
+import time
+import requests
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from typing import Iterator, List, Dict, Optional
+from .naver_response_cache import NaverResponseCache
+
+NEWS_SEARCH_URL = "https://openapi.naver.com/v1/search/news.json"
+
+# 네이버 API의 start / display 최대값
+MAX_START = 1000
+MAX_DISPLAY = 100
+
+# 네이버 검색 API 일일 호출 한도 (같은 인증 정보를 쓰는 봇 전체 합)
+DAILY_QUOTA = 25000
+
+def parse_pub_date(news: Dict) -> Optional[datetime]:
+    """pubDate 파싱 (실패 시 None)"""
+    
+    try:
+        return datetime.strptime(news.get('pubDate', ''), '%a, %d %b %Y %H:%M:%S %z')
+    except ValueError:
+        return None
+
+class NaverSearchError(Exception):
+    """네이버 검색 API 오류 응답"""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"API 오류: {status_code}")
+        self.status_code = status_code
+
+class RequestBudgetExceeded(Exception):
+    """실행 한 번의 요청 예산 소진"""
+    
+    def __init__(self, limit: int):
+        super().__init__(f"요청 예산 소진: {limit}회")
+        self.limit = limit
+
+class RequestBudget:
+    """
+    실행 한 번에 보낼 수 있는 네이버 API 요청 수 (일일 호출 한도 보호)
+    신선한 캐시 적중은 차감하지 않고, 실제로 보낸 요청(304 재검증 포함)만 차감
+    """
+    
+    def __init__(self, limit: int):
+        self._lock = threading.Lock()
+        self.limit = max(0, min(limit, DAILY_QUOTA))
+        self.used = 0
+    
+    def spend(self):
+        """요청 한 번 차감 (남은 예산이 없으면 RequestBudgetExceeded)"""
+        
+        with self._lock:
+            if self.used >= self.limit:
+                raise RequestBudgetExceeded(self.limit)
+            self.used += 1
+    
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self.limit - self.used
+
+class SearchStats:
+    """요청별 지연 시간 카운터"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.new_connections = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.new_connection_seconds = 0.0
+    
+    def record(self, elapsed: float, new_connection: bool):
+        with self._lock:
+            self.requests += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            
+            if new_connection:
+                self.new_connections += 1
+                self.new_connection_seconds += elapsed
+    
+    def record_cache(self, revalidated: bool = False):
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.cache_hits += 1
+    
+    def summary(self) -> str:
+        """요청 수 / 평균 지연 / 새 연결 비용 요약"""
+        
+        with self._lock:
+            cached = f"캐시 적중 {self.cache_hits}회, 재검증 {self.revalidated}회"
+            
+            if not self.requests:
+                return f"네이버 API 요청 없음 ({cached})"
+            
+            reused = self.requests - self.new_connections
+            avg = self.total_seconds / self.requests
+            avg_reused = (self.total_seconds - self.new_connection_seconds) / reused if reused else 0.0
+            avg_new = self.new_connection_seconds / self.new_connections if self.new_connections else 0.0
+            
+            return (
+                f"네이버 API {self.requests}회, 평균 {avg * 1000:.0f}ms (최대 {self.max_seconds * 1000:.0f}ms), "
+                f"새 연결 {self.new_connections}회 평균 {avg_new * 1000:.0f}ms / "
+                f"재사용 {reused}회 평균 {avg_reused * 1000:.0f}ms ({cached})"
+            )
+
+class NaverSearchClient:
+    """keep-alive 세션을 공유하는 네이버 뉴스 검색 클라이언트"""
+    
+    def __init__(self, client_id: str, client_secret: str,
+                 max_connections: int = 8, timeout: float = 10,
+                 cache: Optional[NaverResponseCache] = None):
+        self.timeout = timeout
+        self.cache = cache
+        self.stats = SearchStats()
+        
+        # 인증 헤더는 세션에 한 번만 설정
+        self.session = requests.Session()
+        self.session.headers.update({
+            'X-Naver-Client-Id': client_id,
+            'X-Naver-Client-Secret': client_secret,
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        
+        # 호스트당 최대 연결 수 제한 (초과 요청은 빈 연결을 기다림)
+        self.adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            pool_block=True
+        )
+        self.session.mount('https://', self.adapter)
+    
+    def search_news(self, query: str, display: int = 10, start: int = 1,
+                    sort: str = 'date', budget: Optional[RequestBudget] = None) -> List[Dict]:
+        """
+        뉴스 검색 결과 items 반환 (200 이외 응답은 NaverSearchError)
+        budget이 있으면 실제 요청마다 차감 (소진 시 RequestBudgetExceeded)
+        """
+        
+        key = NaverResponseCache.make_key(query, display, start, sort)
+        cached = self.cache.get(key) if self.cache else None
+        
+        if cached and cached.fresh:
+            self.stats.record_cache()
+            return cached.body.get('items', [])
+        
+        params = {
+            'query': query,
+            'display': display,
+            'start': start,
+            'sort': sort
+        }
+        
+        if budget is not None:
+            budget.spend()
+        
+        headers = cached.conditional_headers() if cached else {}
+        
+        opened_before = self._opened_connections()
+        started = time.perf_counter()
+        
+        response = self.session.get(NEWS_SEARCH_URL, params=params, headers=headers, timeout=self.timeout)
+        
+        elapsed = time.perf_counter() - started
+        # 동시 요청 중에는 근사치 (풀의 누적 연결 수 증가 여부로 판단)
+        self.stats.record(elapsed, self._opened_connections() > opened_before)
+        
+        # 변경 없음: 캐시 항목 만료 연장 후 재사용
+        if response.status_code == 304 and cached:
+            self.cache.touch(key)
+            self.stats.record_cache(revalidated=True)
+            return cached.body.get('items', [])
+        
+        if response.status_code != 200:
+            raise NaverSearchError(response.status_code)
+        
+        body = response.json()
+        
+        if self.cache:
+            self.cache.put(
+                key,
+                body,
+                etag=response.headers.get('ETag', ''),
+                last_modified=response.headers.get('Last-Modified', '')
+            )
+        
+        return body.get('items', [])
+    
+    def iter_search_pages(self, query: str, display: int = 10, since: Optional[datetime] = None,
+                          until: Optional[datetime] = None, max_pages: int = 1, sort: str = 'date',
+                          budget: Optional[RequestBudget] = None) -> Iterator[List[Dict]]:
+        """
+        최신순 페이지를 start 커서로 넘기며 한 페이지씩 반환
+        since(직전 실행의 최고 수위) 이하이거나 until(날짜 범위 하한)보다 오래된 기사가 나오면 중단
+        둘 다 없으면 첫 페이지만
+        """
+        
+        for page in range(max_pages):
+            start = 1 + page * display
+            if start > MAX_START:
+                break
+            
+            page_items = self.search_news(query, display=display, start=start, sort=sort, budget=budget)
+            yield page_items
+            
+            # 첫 실행(기준 없음)이거나 마지막 페이지면 더 넘기지 않음
+            if (since is None and until is None) or len(page_items) < display:
+                break
+            
+            # 최신순이므로 페이지 마지막 기사가 기준보다 오래되면 뒤 페이지는 모두 더 오래됨
+            oldest = parse_pub_date(page_items[-1])
+            if oldest is None:
+                break
+            if since is not None and oldest <= since:
+                break
+            if until is not None and oldest < until:
+                break
+    
+    def search_since(self, query: str, display: int = 10, since: Optional[datetime] = None,
+                     max_pages: int = 1, sort: str = 'date') -> List[Dict]:
+        """
+        최신순 페이지를 start 커서로 넘기며 수집
+        since(직전 실행의 최고 수위)보다 오래된 기사가 나오면 중단
+        """
+        
+        return [
+            item
+            for page in self.iter_search_pages(query, display=display, since=since,
+                                               max_pages=max_pages, sort=sort)
+            for item in page
+        ]
+    
+    def _opened_connections(self) -> int:
+        """풀이 지금까지 새로 연 연결 수"""
+        
+        pool = self.adapter.poolmanager.connection_from_url(NEWS_SEARCH_URL)
+        return pool.num_connections
+    
+    def close(self):
+        self.session.close()
+
+_clients: Dict[str, NaverSearchClient] = {}
+_clients_lock = threading.Lock()
+
+def get_client(client_id: str, client_secret: str,
+               max_connections: int = 8) -> NaverSearchClient:
+    """같은 인증 정보의 클라이언트는 프로세스 안에서 하나만 생성해 공유"""
+    
+    with _clients_lock:
+        client: Optional[NaverSearchClient] = _clients.get(client_id)
+        
+        if client is None:
+            client = NaverSearchClient(
+                client_id,
+                client_secret,
+                max_connections=max_connections,
+                cache=NaverResponseCache()
+            )
+            _clients[client_id] = client
+        
+        return client
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 기사 판별 - 문자 n-gram MinHash + LSH
+"""
+
+import re
+import struct
+import hashlib
+import random
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# 2^61 - 1 (메르센 소수)
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_TAG_PATTERN = re.compile(r'<[^>]+>|&[a-zA-Z]+;|&#\d+;')
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+_LEADING_TAG_PATTERN = re.compile(r'^\s*(?:[\[(【<][^\])】>]*[\])】>]\s*)+')
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+_NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+
+# 제목 bigram만으로는 같은 기사를 다르게 쓴 제목(0.4 안팎)과
+# 회사/수치만 다른 정형 제목(0.5~0.7)이 구분되지 않으므로 key_terms 검사와 함께 사용
+DEFAULT_THRESHOLD = 0.4
+
+KeyTerms = Tuple[str, str, FrozenSet[str]]
+
+def shingles(text: str, n: int = 2) -> Set[str]:
+    """
+    태그/공백/문장부호를 뗀 문자 n-gram 집합
+    한글 제목은 조사/띄어쓰기가 매체마다 달라 어절 대신 문자 bigram 사용
+    """
+    
+    text = _TAG_PATTERN.sub(' ', text)
+    text = _NON_WORD_PATTERN.sub('', text).lower()
+    
+    if len(text) <= n:
+        return {text} if text else set()
+    
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def key_terms(text: str) -> KeyTerms:
+    """
+    (맨 앞 주체, 정규화한 본문, 숫자 집합)
+    "삼성전자, 하반기 공채" / "현대중공업, LNG선 2척 수주"처럼 주체와 수치가 제목 구분의 핵심
+    """
+    
+    text = _TAG_PATTERN.sub(' ', text)
+    words = _WORD_PATTERN.findall(_LEADING_TAG_PATTERN.sub('', text).lower())
+    
+    return (
+        words[0] if words else '',
+        ''.join(words),
+        frozenset(_NUMBER_PATTERN.findall(text))
+    )
+
+def key_terms_conflict(a: KeyTerms, b: KeyTerms) -> bool:
+    """
+    주체나 수치가 다른 기사면 True
+    - 서로 상대에 없는 숫자가 있으면 다른 기사 (2척 / 4척)
+    - 양쪽 맨 앞 주체가 서로 상대 제목에 없고 앞 두 글자도 다르면 다른 기사 (삼성전자 / LG전자)
+      줄임말은 같은 기사로 유지 (삼성 / 삼성전자, 고용부 / 고용노동부)
+    """
+    
+    subject_a, text_a, numbers_a = a
+    subject_b, text_b, numbers_b = b
+    
+    if numbers_a - numbers_b and numbers_b - numbers_a:
+        return True
+    
+    if subject_a in text_b or subject_b in text_a:
+        return False
+    
+    return subject_a[:2] != subject_b[:2]
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """임계값 근처에서 오탐/누락 면적이 최소인 (밴드 수, 밴드당 행 수)"""
+    
+    def probability(s: float, b: int, r: int) -> float:
+        return 1 - (1 - s ** r) ** b
+    
+    def integrate(f, a: float, b: float, steps: int = 100) -> float:
+        width = (b - a) / steps
+        return sum(f(a + (i + 0.5) * width) for i in range(steps)) * width
+    
+    best, best_error = (1, num_perm), float('inf')
+    
+    for b in range(1, num_perm + 1):
+        r = num_perm // b
+        if r == 0:
+            break
+        
+        false_positive = integrate(lambda s: probability(s, b, r), 0.0, threshold)
+        false_negative = integrate(lambda s: 1 - probability(s, b, r), threshold, 1.0)
+        error = false_positive + false_negative
+        
+        if error < best_error:
+            best, best_error = (b, r), error
+    
+    return best
+
+class MinHasher:
+    """고정 시드 순열로 MinHash 서명 계산"""
+    
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        
+        # 뉴스 제목은 n-gram이 많이 겹치므로 n-gram별 순열 해시를 재사용
+        self._shingle_hashes: Dict[str, Tuple[int, ...]] = {}
+    
+    def _hashes(self, shingle: str) -> Tuple[int, ...]:
+        values = self._shingle_hashes.get(shingle)
+        
+        if values is None:
+            h = struct.unpack('<I', hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest())[0]
+            values = tuple(((a * h + b) % _PRIME) & _MAX_HASH for a, b in self.permutations)
+            self._shingle_hashes[shingle] = values
+        
+        return values
+    
+    def signature(self, shingle_set: Set[str]) -> Tuple[int, ...]:
+        if not shingle_set:
+            return tuple([_MAX_HASH] * self.num_perm)
+        
+        return tuple(map(min, zip(*(self._hashes(s) for s in shingle_set))))
+
+def estimate_similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """두 서명의 자카드 유사도 추정값"""
+    
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+class NearDuplicateIndex:
+    """
+    LSH 밴드 버킷으로 후보만 비교하는 유사 기사 인덱스
+    threshold 이상 유사하고 주체/수치가 충돌하지 않으면 중복으로 판단
+    """
+    
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = 64, ngram: int = 2):
+        self.threshold = threshold
+        self.ngram = ngram
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+        
+        self.signatures: Dict[int, Tuple[int, ...]] = {}
+        self.terms: Dict[int, KeyTerms] = {}
+        self.buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+    
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, ...]]:
+        for i in range(self.bands):
+            yield signature[i * self.rows:(i + 1) * self.rows]
+    
+    def find_duplicate(self, signature: Tuple[int, ...], terms: Optional[KeyTerms] = None) -> int:
+        """threshold 이상이고 terms가 충돌하지 않는 기존 문서 id (없으면 -1)"""
+        
+        checked = set()
+        
+        for band, key in zip(self.buckets, self._band_keys(signature)):
+            for doc_id in band.get(key, ()):
+                if doc_id in checked:
+                    continue
+                checked.add(doc_id)
+                
+                if estimate_similarity(signature, self.signatures[doc_id]) < self.threshold:
+                    continue
+                
+                if terms is None or not key_terms_conflict(terms, self.terms[doc_id]):
+                    return doc_id
+        
+        return -1
+    
+    def add(self, text: str) -> bool:
+        """새 문서면 등록 후 True, 기존 문서와 유사하면 False"""
+        
+        signature = self.hasher.signature(shingles(text, self.ngram))
+        terms = key_terms(text)
+        
+        if self.find_duplicate(signature, terms) >= 0:
+            return False
+        
+        doc_id = len(self.signatures)
+        self.signatures[doc_id] = signature
+        self.terms[doc_id] = terms
+        
+        for band, key in zip(self.buckets, self._band_keys(signature)):
+            band.setdefault(key, []).append(doc_id)
+        
+        return True
+
+def remove_near_duplicates(news_list: List[Dict], text_of: Callable[[Dict], str],
+                           threshold: float = DEFAULT_THRESHOLD,
+                           on_duplicate: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+    """먼저 나온 기사를 남기고 유사 기사 제거"""
+    
+    index = NearDuplicateIndex(threshold=threshold)
+    unique_news = []
+    
+    for news in news_list:
+        if index.add(text_of(news)):
+            unique_news.append(news)
+        elif on_duplicate:
+            on_duplicate(news)
+    
+    return unique_news
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 간 상태(.cache) 위치
+"""
+
+import os
+
+# 저장소 루트의 .cache (모든 봇이 같은 디렉터리를 쓰고 파일/namespace로 구분)
+DEFAULT_CACHE_DIR = os.environ.get(
+    'NEWS_BOT_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.cache')
+)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 파이프라인 - 단계마다 스레드 하나, 단계 사이는 크기 제한 큐
+앞 단계가 다음 묶음을 만드는 동안 뒤 단계는 이미 편집/발송
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, List, Tuple
+
+# 입력 종료 표시
+_DONE = object()
+
+class Pipeline:
+    """
+    source → stage → ... → sink
+    큐가 가득 차면 앞 단계가 기다리므로 메모리에는 최대 (단계 수 + 1) × maxsize개만 존재
+    """
+    
+    def __init__(self, source: Iterable[Any], maxsize: int = 2):
+        self.source = source
+        self.maxsize = max(1, maxsize)
+        self.stages: List[Tuple[str, Callable[[Any], Any]]] = []
+        self.errors: List[Tuple[str, Exception]] = []
+        self._lock = threading.Lock()
+    
+    def stage(self, name: str, fn: Callable[[Any], Any]) -> 'Pipeline':
+        """fn(item)의 결과를 다음 단계로 전달 (None이면 버림)"""
+        
+        self.stages.append((name, fn))
+        return self
+    
+    def run(self, sink: Callable[[Any], None]) -> int:
+        """
+        모든 단계를 동시에 실행하고 마지막 결과를 도착 순서대로 sink에 전달
+        sink는 호출한 스레드에서 실행, 성공한 sink 호출 수 반환
+        """
+        
+        queues = [queue.Queue(maxsize=self.maxsize) for _ in range(len(self.stages) + 1)]
+        
+        threads = [threading.Thread(target=self._produce, args=(queues[0],), daemon=True)]
+        for (name, fn), inbox, outbox in zip(self.stages, queues, queues[1:]):
+            threads.append(threading.Thread(target=self._work, args=(name, fn, inbox, outbox), daemon=True))
+        
+        for thread in threads:
+            thread.start()
+        
+        delivered = 0
+        
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            
+            try:
+                sink(item)
+                delivered += 1
+            except Exception as e:
+                self._fail('발송', e)
+        
+        for thread in threads:
+            thread.join()
+        
+        return delivered
+    
+    def _produce(self, outbox: queue.Queue):
+        try:
+            for item in self.source:
+                outbox.put(item)
+        except Exception as e:
+            self._fail('수집', e)
+        finally:
+            outbox.put(_DONE)
+    
+    def _work(self, name: str, fn: Callable[[Any], Any], inbox: queue.Queue, outbox: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                outbox.put(_DONE)
+                return
+            
+            # 한 항목의 실패는 해당 항목만 버리고 계속 진행
+            try:
+                result = fn(item)
+            except Exception as e:
+                self._fail(name, e)
+                continue
+            
+            if result is not None:
+                outbox.put(result)
+    
+    def _fail(self, name: str, error: Exception):
+        with self._lock:
+            self.errors.append((name, error))
+        print(f"⚠️ [{name}] 단계 오류: {error}", flush=True)
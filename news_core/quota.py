@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+네이버 검색 API 호출 한도 관리 - 인증 정보별 일일 호출 장부 (SQLite)
+- 실제로 보낸 요청을 인증 정보/날짜(KST)별로 기록
+- 검색어별 수확량(요청 수, 쓸 만한 기사 수) 이동 평균으로 남은 한도 안의 검색어 선택
+- 실행당 비용 보고
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from .naver_search_client import DAILY_QUOTA, RequestBudget
+from .paths import DEFAULT_CACHE_DIR
+
+# 네이버 API 일일 한도는 한국 시간 자정에 초기화
+KST = timezone(timedelta(hours=9))
+
+class KeywordYield:
+    """검색어 하나의 실행당 평균 요청 수 / 쓸 만한 기사 수 (최근 실행에 가중)"""
+    
+    def __init__(self, runs: int, avg_calls: float, avg_items: float, updated_at: float = 0.0):
+        self.runs = runs
+        self.avg_calls = avg_calls
+        self.avg_items = avg_items
+        
+        # 마지막으로 검색한 시각 (재탐색 판단용)
+        self.updated_at = updated_at
+    
+    @property
+    def items_per_call(self) -> float:
+        return self.avg_items / self.avg_calls if self.avg_calls else 0.0
+    
+    def __repr__(self):
+        return f"KeywordYield(runs={self.runs}, avg_calls={self.avg_calls:.2f}, avg_items={self.avg_items:.2f})"
+
+class QuotaLedger:
+    """인증 정보별 일일 호출 수와 검색어별 수확량 기록"""
+    
+    def __init__(self, path: Optional[str] = None, smoothing: float = 0.3,
+                 retention_days: int = 30):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'naver_quota.sqlite3')
+        
+        # 이동 평균에서 이번 실행 값의 비중
+        self.smoothing = smoothing
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        # 기업뉴스 수집은 워커 스레드에서 요청마다 기록
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS usage (
+                credential TEXT NOT NULL,
+                day TEXT NOT NULL,
+                calls INTEGER NOT NULL,
+                PRIMARY KEY (credential, day)
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS keyword_yield (
+                namespace TEXT NOT NULL,
+                query TEXT NOT NULL,
+                runs INTEGER NOT NULL,
+                avg_calls REAL NOT NULL,
+                avg_items REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, query)
+            )
+        ''')
+        
+        # 보존 기간이 지난 장부 정리
+        cutoff = (datetime.now(KST) - timedelta(days=retention_days)).strftime('%Y-%m-%d')
+        self.conn.execute('DELETE FROM usage WHERE day < ?', (cutoff,))
+        self.conn.commit()
+    
+    def calls_on(self, credential: str, day: str) -> int:
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT calls FROM usage WHERE credential = ? AND day = ?',
+                (credential, day)
+            ).fetchone()
+        
+        return row[0] if row else 0
+    
+    def add_calls(self, credential: str, day: str, calls: int = 1):
+        with self._lock:
+            self.conn.execute(
+                'INSERT INTO usage VALUES (?, ?, ?) '
+                'ON CONFLICT (credential, day) DO UPDATE SET calls = calls + excluded.calls',
+                (credential, day, calls)
+            )
+            self.conn.commit()
+    
+    def yields(self, namespace: str) -> Dict[str, KeywordYield]:
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT query, runs, avg_calls, avg_items, updated_at FROM keyword_yield WHERE namespace = ?',
+                (namespace,)
+            ).fetchall()
+        
+        return {query: KeywordYield(*values) for query, *values in rows}
+    
+    def record_yield(self, namespace: str, query: str, calls: int, items: int):
+        """이번 실행의 요청 수 / 쓸 만한 기사 수를 이동 평균에 반영"""
+        
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT runs, avg_calls, avg_items FROM keyword_yield WHERE namespace = ? AND query = ?',
+                (namespace, query)
+            ).fetchone()
+            
+            if row:
+                runs, avg_calls, avg_items = row
+                avg_calls += self.smoothing * (calls - avg_calls)
+                avg_items += self.smoothing * (items - avg_items)
+            else:
+                runs, avg_calls, avg_items = 0, float(calls), float(items)
+            
+            self.conn.execute(
+                'INSERT OR REPLACE INTO keyword_yield VALUES (?, ?, ?, ?, ?, ?)',
+                (namespace, query, runs + 1, avg_calls, avg_items, time.time())
+            )
+            self.conn.commit()
+    
+    def close(self):
+        self.conn.close()
+
+class QuotaBudget(RequestBudget):
+    """보낸 요청을 장부에도 기록하는 실행당 예산"""
+    
+    def __init__(self, manager: 'QuotaManager', limit: int):
+        super().__init__(limit)
+        self.manager = manager
+    
+    def spend(self):
+        super().spend()
+        self.manager.ledger.add_calls(self.manager.credential, self.manager.today())
+
+class QuotaManager:
+    """
+    인증 정보 하나의 일일 호출 한도 관리
+    - budget(): 오늘 남은 한도로 제한한 실행당 예산 (요청마다 장부 기록)
+    - plan(): 예산 안에 들어가는 검색어만 (넘치면 과거 수확량이 높은 순)
+    - report(): 이번 실행 비용 / 오늘 누적
+    """
+    
+    def __init__(self, client_id: str, daily_quota: int = DAILY_QUOTA,
+                 ledger: Optional[QuotaLedger] = None):
+        # 장부에는 인증 정보 대신 해시만 기록
+        self.credential = hashlib.sha256(client_id.encode('utf-8')).hexdigest()[:16]
+        self.daily_quota = daily_quota
+        self.ledger = ledger or QuotaLedger()
+    
+    @staticmethod
+    def today() -> str:
+        return datetime.now(KST).strftime('%Y-%m-%d')
+    
+    def used_today(self) -> int:
+        return self.ledger.calls_on(self.credential, self.today())
+    
+    def remaining_today(self) -> int:
+        return max(0, self.daily_quota - self.used_today())
+    
+    def budget(self, limit: Optional[int] = None) -> QuotaBudget:
+        """실행당 예산 (limit이 없으면 오늘 남은 한도 전부)"""
+        
+        remaining = self.remaining_today()
+        return QuotaBudget(self, remaining if limit is None else min(limit, remaining))
+    
+    def plan(self, namespace: str, queries: List[str], budget: RequestBudget,
+             default_cost: int = 1) -> List[str]:
+        """
+        남은 예산 안에 들어가는 검색어 (원래 순서 유지)
+        다 들어가면 그대로, 넘치면 요청당 기사 수가 높은 순으로 채움 (기록 없는 검색어는 먼저 시험)
+        검색어 비용은 과거 실행당 평균 요청 수 (기록이 없으면 default_cost)
+        """
+        
+        history = self.ledger.yields(namespace)
+        
+        def cost(query: str) -> int:
+            known = history.get(query)
+            return max(1, math.ceil(known.avg_calls)) if known else default_cost
+        
+        if sum(cost(query) for query in queries) <= budget.remaining:
+            return list(queries)
+        
+        def priority(query: str) -> float:
+            known = history.get(query)
+            return known.items_per_call if known else math.inf
+        
+        chosen = set()
+        left = budget.remaining
+        
+        for query in sorted(queries, key=priority, reverse=True):
+            if cost(query) <= left:
+                chosen.add(query)
+                left -= cost(query)
+        
+        skipped = [query for query in queries if query not in chosen]
+        print(f"⚠️ 요청 예산 {budget.remaining}회에 맞춰 검색어 {len(skipped)}개 제외: {', '.join(skipped)}")
+        
+        return [query for query in queries if query in chosen]
+    
+    def record(self, namespace: str, query: str, calls: int, items: int):
+        self.ledger.record_yield(namespace, query, calls, items)
+    
+    def report(self, budget: RequestBudget) -> str:
+        """이번 실행 비용 / 오늘 누적 요약"""
+        
+        used_today = self.used_today()
+        
+        return (
+            f"💰 네이버 API 비용: 이번 실행 {budget.used}회 (예산 {budget.limit}회), "
+            f"오늘 누적 {used_today:,}/{self.daily_quota:,}회 (남음 {max(0, self.daily_quota - used_today):,}회)"
+        )
+
+_managers: Dict[str, QuotaManager] = {}
+_managers_lock = threading.Lock()
+
+def get_quota_manager(client_id: str) -> QuotaManager:
+    """같은 인증 정보의 한도 관리자는 프로세스 안에서 하나만 생성해 공유"""
+    
+    with _managers_lock:
+        manager: Optional[QuotaManager] = _managers.get(client_id)
+        
+        if manager is None:
+            manager = QuotaManager(client_id)
+            _managers[client_id] = manager
+        
+        return manager
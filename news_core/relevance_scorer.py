@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+설정 파일 기반 관련도 점수 엔진
+- 키워드 그룹별 가중치 (presence: 나오면 한 번, count: 나올 때마다)
+- 최신성: pubDate 경과 시간에 따른 반감기 감쇠 점수
+- 매체 다양성: 같은 매체 기사를 이미 고른 만큼 감점
+- 상위 k개만 힙으로 선택 (전체 정렬 없음)
+"""
+
+import heapq
+import json
+import math
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+from .keywords import KeywordMatcher
+from .naver_search_client import parse_pub_date
+
+KEYWORD_MODES = ('presence', 'count')
+
+def news_source(news: Dict) -> str:
+    """기사 원문 매체 도메인 (originallink 우선, 없으면 link)"""
+    
+    netloc = urlsplit(news.get('originallink') or news.get('link', '')).netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+class RelevanceScorer:
+    """
+    설정(dict)을 한 번 컴파일한 점수 계산기
+    
+    {
+      "keyword_groups": {"이름": {"keywords": [...], "weight": 5, "mode": "presence"}, ...},
+      "recency": {"weight": 2.0, "half_life_hours": 24},
+      "diversity": {"source_penalty": 1.5},
+      "top_k": 30,
+      "max_age_days": 2
+    }
+    """
+    
+    def __init__(self, config: Dict):
+        groups = config.get('keyword_groups', {})
+        
+        for name, group in groups.items():
+            mode = group.get('mode', 'presence')
+            if mode not in KEYWORD_MODES:
+                raise ValueError(f"[{name}] 알 수 없는 mode: {mode} ({', '.join(KEYWORD_MODES)})")
+        
+        self.matcher = KeywordMatcher({name: group.get('keywords', []) for name, group in groups.items()})
+        
+        weights = {name: float(group.get('weight', 1)) for name, group in groups.items()}
+        count_groups = {name for name, group in groups.items() if group.get('mode') == 'count'}
+        
+        # 키워드 → presence 그룹 가중치 합 (기사당 한 번)
+        self._presence_weight: Dict[str, float] = {
+            keyword: sum(weights[g] for g in self.matcher.keyword_groups(keyword) if g not in count_groups)
+            for keyword in self.matcher.keywords
+        }
+        
+        # 가장 긴 키워드 → 같은 위치에서 함께 적중하는 키워드들의 count 그룹 가중치 합 (나올 때마다)
+        self._count_weight: Dict[str, float] = {
+            keyword: sum(
+                weights[g]
+                for prefix in self.matcher.prefixes(keyword)
+                for g in self.matcher.keyword_groups(prefix) if g in count_groups
+            )
+            for keyword in self.matcher.keywords
+        }
+        
+        recency = config.get('recency', {})
+        self.recency_weight = float(recency.get('weight', 0))
+        half_life = float(recency.get('half_life_hours', 24))
+        if half_life <= 0:
+            raise ValueError("recency.half_life_hours는 0보다 커야 합니다")
+        
+        # 0.5 ** (경과 시간 / 반감기) = exp(-경과 초 * 감쇠율)
+        self._decay_per_second = math.log(2) / (half_life * 3600)
+        
+        self.source_penalty = float(config.get('diversity', {}).get('source_penalty', 0))
+        
+        self.top_k = int(config.get('top_k', 30))
+        self.max_age_days = int(config.get('max_age_days', 2))
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'RelevanceScorer':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+    
+    def score(self, news: Dict, now: Optional[datetime] = None,
+              recency_cache: Optional[Dict[str, float]] = None) -> float:
+        """기사 하나의 점수 (다양성 감점 제외)"""
+        
+        found = self.matcher.longest_matches(f"{news.get('title', '')} {news.get('description', '')}")
+        
+        score = 0.0
+        if found:
+            score = sum(map(self._count_weight.__getitem__, found))
+            
+            present = set()
+            for longest in set(found):
+                present.update(self.matcher.prefixes(longest))
+            
+            score += sum(map(self._presence_weight.__getitem__, present))
+        
+        if self.recency_weight:
+            pub_date_str = news.get('pubDate', '')
+            
+            # 같은 pubDate 문자열은 한 번만 파싱 (strptime이 점수 계산보다 비쌈)
+            if recency_cache is not None and pub_date_str in recency_cache:
+                bonus = recency_cache[pub_date_str]
+            else:
+                bonus = self._recency_bonus(news, now or datetime.now(timezone.utc))
+                if recency_cache is not None:
+                    recency_cache[pub_date_str] = bonus
+            
+            score += bonus
+        
+        return score
+    
+    def _recency_bonus(self, news: Dict, now: datetime) -> float:
+        pub_date = parse_pub_date(news)
+        
+        if pub_date is None:
+            return 0.0
+        
+        age = max(0.0, (now - pub_date).total_seconds())
+        return self.recency_weight * math.exp(-age * self._decay_per_second)
+    
+    def score_all(self, news_list: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+        """모든 기사에 relevance_score 기록 (순서 유지)"""
+        
+        now = now or datetime.now(timezone.utc)
+        recency_cache: Dict[str, float] = {}
+        
+        for news in news_list:
+            news['relevance_score'] = round(self.score(news, now, recency_cache), 3)
+        
+        return news_list
+    
+    def select(self, news_list: List[Dict], k: Optional[int] = None,
+               now: Optional[datetime] = None) -> List[Dict]:
+        """
+        점수를 매기고 상위 k개를 점수 순으로 반환 (동점은 입력 순서)
+        다양성 감점이 없으면 heapq.nlargest로 O(n log k),
+        있으면 heapify 후 꺼낼 때마다 감점을 다시 계산하는 지연 탐욕 선택 (대개 O(n + k log n))
+        """
+        
+        k = self.top_k if k is None else k
+        
+        if k <= 0 or not news_list:
+            return []
+        
+        self.score_all(news_list, now)
+        
+        if not self.source_penalty:
+            return heapq.nlargest(k, news_list, key=lambda news: news['relevance_score'])
+        
+        # (-점수, 입력 순서, 점수 계산 당시 같은 매체 선택 수)
+        heap = [(-news['relevance_score'], i, 0) for i, news in enumerate(news_list)]
+        heapq.heapify(heap)
+        
+        # 매체 도메인은 꺼낸 기사에 대해서만 계산 (대부분의 기사는 힙에서 나오지 않음)
+        sources: Dict[int, str] = {}
+        picked_per_source: Dict[str, int] = {}
+        selected = []
+        
+        while heap and len(selected) < k:
+            negative, i, seen = heapq.heappop(heap)
+            
+            if i not in sources:
+                sources[i] = news_source(news_list[i])
+            
+            picked = picked_per_source.get(sources[i], 0)
+            
+            # 꺼낸 뒤 같은 매체가 더 뽑혔으면 감점을 반영해 다시 넣음 (점수는 줄기만 하므로 순서 유지)
+            if picked != seen:
+                penalized = news_list[i]['relevance_score'] - self.source_penalty * picked
+                heapq.heappush(heap, (-penalized, i, picked))
+                continue
+            
+            news = news_list[i]
+            news['relevance_score'] = round(-negative, 3)
+            selected.append(news)
+            picked_per_source[sources[i]] = picked + 1
+        
+        return selected
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 봇을 한 프로세스에서 돌리는 cron 스케줄러
+- 작업마다 cron 식(UTC, 분 시 일 월 요일)과 선행 작업, 사용 자원 지정
+- 같은 회차에 함께 실행되는 선행 작업이 끝난 뒤 시작 (선행 작업이 실패해도 실행)
+- 전체 동시 실행 수와 자원별(예: browser) 동시 실행 수 제한
+- 시계를 바꿔 끼울 수 있어 FakeClock으로 하루치 일정을 바로 돌려볼 수 있음
+"""
+
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+# (최솟값, 최댓값): 분, 시, 일, 월, 요일(0=일요일, 7도 일요일)
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# 밀린 회차를 따라잡을 최대 범위 (작업이 오래 걸려 지나간 분)
+MAX_CATCH_UP = timedelta(hours=6)
+
+class CronExpression:
+    """5필드 cron 식 (*, a-b, a,b, */n, a-b/n)"""
+    
+    def __init__(self, expression: str):
+        self.expression = ' '.join(expression.split())
+        fields = self.expression.split(' ')
+        
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: '{expression}'")
+        
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, CRON_FIELDS)
+        ]
+        self.weekdays = {day % 7 for day in weekdays}
+        
+        # 일/요일이 둘 다 제한되면 어느 한쪽만 맞아도 실행 (표준 cron 규칙)
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+    
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        
+        for part in field.split(','):
+            step = 1
+            
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+                if step < 1:
+                    raise ValueError(f"cron 간격은 1 이상이어야 합니다: '{field}'")
+            
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            
+            if not low <= start <= end <= high:
+                raise ValueError(f"cron 값이 범위({low}-{high})를 벗어났습니다: '{field}'")
+            
+            values.update(range(start, end + 1, step))
+        
+        return values
+    
+    def _day_matches(self, moment: datetime) -> bool:
+        # datetime.weekday(): 월=0 → cron: 일=0
+        weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in self.days
+        weekday_ok = weekday in self.weekdays
+        
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+    
+    def matches(self, moment: datetime) -> bool:
+        """해당 분에 실행되는지"""
+        
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and moment.month in self.months
+            and self._day_matches(moment)
+        )
+    
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후 처음 실행되는 분 (날짜 → 시 → 분 순으로 건너뛰며 탐색)"""
+        
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        
+        # 2월 29일만 지정된 식도 찾도록 윤년 주기만큼
+        for _ in range(366 * 4 + 1):
+            if day.month in self.months and self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        
+        raise ValueError(f"실행 시각이 없는 cron 식입니다: '{self.expression}'")
+    
+    def __repr__(self):
+        return f"CronExpression('{self.expression}')"
+
+class Job:
+    """스케줄 작업 하나"""
+    
+    def __init__(self, name: str, func: Callable[[], object], cron: Optional[str] = None,
+                 after: Iterable[str] = (), resources: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        
+        # cron이 없으면 직접 지정했을 때만 실행
+        self.cron = CronExpression(cron) if cron else None
+        
+        # 같은 회차에 있으면 먼저 끝나야 하는 작업
+        self.after = tuple(after)
+        
+        # 자원별 동시 실행 제한에 쓰는 이름 (예: 'browser', 'gemini')
+        self.resources = tuple(resources)
+    
+    def __repr__(self):
+        return f"Job('{self.name}', cron={self.cron})"
+
+class SystemClock:
+    """실제 시계 (UTC)"""
+    
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+    
+    def sleep(self, seconds: float):
+        time.sleep(max(0.0, seconds))
+
+class FakeClock:
+    """sleep하면 바로 시각만 넘어가는 시계 (일정 확인/테스트용)"""
+    
+    def __init__(self, start: datetime):
+        self._now = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+    
+    def now(self) -> datetime:
+        return self._now
+    
+    def sleep(self, seconds: float):
+        self._now += timedelta(seconds=max(0.0, seconds))
+    
+    def advance(self, **kwargs):
+        self._now += timedelta(**kwargs)
+
+class Scheduler:
+    """cron/선행 작업/동시 실행 제한에 맞춰 작업 실행"""
+    
+    def __init__(self, jobs: Iterable[Job], clock=None, max_concurrent: int = 2,
+                 limits: Optional[Dict[str, int]] = None):
+        self.jobs = {}
+        
+        for job in jobs:
+            if job.name in self.jobs:
+                raise ValueError(f"작업 이름이 중복됩니다: {job.name}")
+            self.jobs[job.name] = job
+        
+        for job in self.jobs.values():
+            unknown = [name for name in job.after if name not in self.jobs]
+            if unknown:
+                raise ValueError(f"[{job.name}] 알 수 없는 선행 작업: {', '.join(unknown)}")
+        
+        self._check_cycles()
+        
+        self.clock = clock or SystemClock()
+        self.max_concurrent = max(1, max_concurrent)
+        
+        # 자원별 동시 실행 수 (지정하지 않은 자원은 max_concurrent까지)
+        self.limits = dict(limits or {})
+        
+        # 작업별 마지막 실행 결과 (성공 여부)
+        self.history: Dict[str, List[bool]] = {name: [] for name in self.jobs}
+    
+    def _check_cycles(self):
+        done, visiting = set(), set()
+        
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"선행 작업이 순환합니다: {name}")
+            
+            visiting.add(name)
+            for dependency in self.jobs[name].after:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in self.jobs:
+            visit(name)
+    
+    def due(self, moment: datetime) -> List[str]:
+        """해당 분에 실행할 작업 이름 (등록 순서)"""
+        
+        return [
+            name for name, job in self.jobs.items()
+            if job.cron and job.cron.matches(moment)
+        ]
+    
+    def for_cron(self, expression: str) -> List[str]:
+        """cron 식이 같은 작업 이름 (GitHub Actions의 github.event.schedule 값으로 고를 때)"""
+        
+        expression = ' '.join(expression.split())
+        
+        return [
+            name for name, job in self.jobs.items()
+            if job.cron and job.cron.expression == expression
+        ]
+    
+    def next_run(self, moment: Optional[datetime] = None) -> Optional[datetime]:
+        """moment 이후 가장 가까운 실행 시각"""
+        
+        moment = moment or self.clock.now()
+        times = [job.cron.next_after(moment) for job in self.jobs.values() if job.cron]
+        
+        return min(times) if times else None
+    
+    def run(self, names: Iterable[str]) -> Dict[str, bool]:
+        """
+        지정한 작업을 지금 실행하고 작업별 성공 여부 반환
+        선행 작업 순서와 동시 실행 제한을 지키고, 실패한 작업의 예외는 출력만 함
+        """
+        
+        pending = list(dict.fromkeys(names))
+        
+        unknown = [name for name in pending if name not in self.jobs]
+        if unknown:
+            raise ValueError(f"알 수 없는 작업: {', '.join(unknown)}")
+        
+        batch = set(pending)
+        results: Dict[str, bool] = {}
+        running = {}
+        in_use: Dict[str, int] = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            while pending or running:
+                for name in list(pending):
+                    if len(running) >= self.max_concurrent:
+                        break
+                    
+                    job = self.jobs[name]
+                    
+                    # 이번 회차에 함께 도는 선행 작업만 기다림
+                    if any(dependency in batch and dependency not in results for dependency in job.after):
+                        continue
+                    
+                    if any(in_use.get(resource, 0) >= self.limits.get(resource, self.max_concurrent)
+                           for resource in job.resources):
+                        continue
+                    
+                    for resource in job.resources:
+                        in_use[resource] = in_use.get(resource, 0) + 1
+                    
+                    pending.remove(name)
+                    running[executor.submit(self._run_job, job)] = job
+                
+                if not running:
+                    # 자원 제한이 0이라 시작할 수 없는 작업만 남은 경우
+                    raise RuntimeError(f"실행할 수 없는 작업: {', '.join(pending)}")
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                
+                for future in finished:
+                    job = running.pop(future)
+                    results[job.name] = future.result()
+                    
+                    for resource in job.resources:
+                        in_use[resource] -= 1
+        
+        return results
+    
+    def _run_job(self, job: Job) -> bool:
+        started = time.monotonic()
+        print(f"\n▶️ [{job.name}] 시작 ({self.clock.now():%Y-%m-%d %H:%M} UTC)", flush=True)
+        
+        try:
+            # 예외 또는 False 반환이면 실패 (봇 main()은 실패를 출력하고 False 반환)
+            ok = job.func() is not False
+        except Exception:
+            print(f"❌ [{job.name}] 실패")
+            traceback.print_exc()
+            ok = False
+        
+        print(f"⏹️ [{job.name}] {'완료' if ok else '실패'} ({time.monotonic() - started:.1f}초)", flush=True)
+        self.history[job.name].append(ok)
+        
+        return ok
+    
+    def run_due(self, moment: Optional[datetime] = None) -> Dict[str, bool]:
+        """해당 분에 예정된 작업 실행"""
+        
+        return self.run(self.due(moment or self.clock.now()))
+    
+    def run_forever(self, until: Optional[datetime] = None):
+        """
+        매 분 예정된 작업 실행 (until이 있으면 그 시각에 종료)
+        작업이 오래 걸려 지나간 분의 회차도 한 번씩 실행
+        """
+        
+        last = self._minute(self.clock.now()) - timedelta(minutes=1)
+        
+        while until is None or self.clock.now() < until:
+            current = self._minute(self.clock.now())
+            
+            names = []
+            moment = max(last + timedelta(minutes=1), current - MAX_CATCH_UP)
+            while moment <= current:
+                names.extend(name for name in self.due(moment) if name not in names)
+                moment += timedelta(minutes=1)
+            last = current
+            
+            if names:
+                self.run(names)
+                continue
+            
+            # 다음 실행 시각까지 대기 (그 사이 until이 오면 거기까지만)
+            wake = self.next_run(current)
+            if wake is None:
+                break
+            if until is not None:
+                wake = min(wake, until)
+            
+            self.clock.sleep((wake - self.clock.now()).total_seconds())
+    
+    @staticmethod
+    def _minute(moment: datetime) -> datetime:
+        return moment.replace(second=0, microsecond=0)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색어별 커서를 이어 가는 네이버 뉴스 검색
+"""
+
+from datetime import datetime
+from typing import Iterator, List, Dict, Optional
+from .naver_search_client import NaverSearchClient, RequestBudget, parse_pub_date
+from .seen_store import SeenArticleStore
+
+def iter_news_pages(client: NaverSearchClient, seen_store: SeenArticleStore, query: str,
+                    display: int = 10, max_pages: int = 1, until: Optional[datetime] = None,
+                    budget: Optional[RequestBudget] = None) -> Iterator[List[Dict]]:
+    """
+    직전 실행 커서(최고 수위 pubDate) 또는 until(날짜 범위 하한)까지 한 페이지씩 반환
+    호출 측이 도중에 멈추거나 예산이 소진돼도 받은 페이지까지 커서 갱신
+    """
+    
+    since = seen_store.high_water(query)
+    newest = None
+    
+    try:
+        for page in client.iter_search_pages(query, display=display, since=since, until=until,
+                                             max_pages=max_pages, budget=budget):
+            # 최신순이므로 최고 수위는 날짜가 있는 첫 페이지에서 정해짐
+            if newest is None:
+                pub_dates = [d for d in (parse_pub_date(item) for item in page) if d]
+                newest = max(pub_dates) if pub_dates else None
+            
+            yield page
+    
+    finally:
+        if newest is not None:
+            seen_store.update_high_water(query, newest)
+
+def search_news(client: NaverSearchClient, seen_store: SeenArticleStore, query: str,
+                display: int = 10, max_pages: int = 1) -> List[Dict]:
+    """
+    직전 실행 커서(최고 수위 pubDate) 이후 기사까지만 페이지 이동하고 커서 갱신
+    오류 응답은 NaverSearchError
+    """
+    
+    return [
+        item
+        for page in iter_news_pages(client, seen_store, query, display=display, max_pages=max_pages)
+        for item in page
+    ]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발송 기사 기록 - 실행 간 중복 발송 방지 (SQLite)
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Optional
+from .paths import DEFAULT_CACHE_DIR
+
+class SeenArticleStore:
+    """발송한 기사의 링크/제목 키와 검색어별 최고 수위(pubDate) 기록"""
+    
+    def __init__(self, namespace: str, path: Optional[str] = None, retention_days: int = 14):
+        self.namespace = namespace
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'seen_articles.sqlite3')
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        # 스트리밍 파이프라인에서는 수집(커서)과 발송(기록)이 다른 스레드
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                delivered_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS cursors (
+                namespace TEXT NOT NULL,
+                query TEXT NOT NULL,
+                high_water TEXT NOT NULL,
+                PRIMARY KEY (namespace, query)
+            )
+        ''')
+        
+        # 보존 기간이 지난 기록 정리
+        cutoff = time.time() - retention_days * 24 * 60 * 60
+        self.conn.execute('DELETE FROM seen WHERE delivered_at < ?', (cutoff,))
+        self.conn.commit()
+        
+        # 조회는 메모리 집합으로 O(1)
+        self._keys = {
+            key for (key,) in self.conn.execute(
+                'SELECT key FROM seen WHERE namespace = ?', (namespace,)
+            )
+        }
+    
+    @staticmethod
+    def link_key(link: str) -> str:
+        """파라미터/끝 슬래시를 뗀 링크"""
+        
+        normalized = link.split('?')[0].split('#')[0].rstrip('/').lower()
+        return f"url:{normalized}" if normalized else ''
+    
+    @staticmethod
+    def title_key(title: str) -> str:
+        """태그/엔티티/공백/문장부호를 뗀 제목의 해시"""
+        
+        text = re.sub(r'<[^>]+>|&[a-zA-Z]+;|&#\d+;', '', title)
+        text = re.sub(r'[\W_]+', '', text).lower()
+        
+        if not text:
+            return ''
+        
+        return "title:" + hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+    
+    def _article_keys(self, news: Dict) -> List[str]:
+        keys = [
+            self.link_key(news.get('link', '')),
+            self.link_key(news.get('originallink', '')),
+            self.title_key(news.get('title', ''))
+        ]
+        return [key for key in keys if key]
+    
+    def is_seen(self, news: Dict) -> bool:
+        return any(key in self._keys for key in self._article_keys(news))
+    
+    def filter_unseen(self, news_list: List[Dict]) -> List[Dict]:
+        """이미 발송한 기사 제외"""
+        
+        return [news for news in news_list if not self.is_seen(news)]
+    
+    def mark_delivered(self, news_list: List[Dict]):
+        """발송 완료 기사 기록"""
+        
+        now = time.time()
+        rows = []
+        
+        for news in news_list:
+            for key in self._article_keys(news):
+                rows.append((self.namespace, key, now))
+        
+        with self._lock:
+            self._keys.update(key for _, key, _ in rows)
+            self.conn.executemany('INSERT OR REPLACE INTO seen VALUES (?, ?, ?)', rows)
+            self.conn.commit()
+    
+    def high_water(self, query: str) -> Optional[datetime]:
+        """직전 실행에서 본 가장 최근 pubDate"""
+        
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT high_water FROM cursors WHERE namespace = ? AND query = ?',
+                (self.namespace, query)
+            ).fetchone()
+        
+        return datetime.fromisoformat(row[0]) if row else None
+    
+    def update_high_water(self, query: str, pub_date: datetime):
+        current = self.high_water(query)
+        
+        if current is not None and current >= pub_date:
+            return
+        
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)',
+                (self.namespace, query, pub_date.isoformat())
+            )
+            self.conn.commit()
+    
+    def close(self):
+        self.conn.close()
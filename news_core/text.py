@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 텍스트/날짜 공통 처리
+"""
+
+import html
+import re
+from datetime import datetime, timedelta
+from typing import Iterable, List, Dict
+from .naver_search_client import parse_pub_date
+
+# 태그와 엔티티(&name; &#39; &#x27;, 세미콜론 없는 옛 표기 포함)를 한 번에 나누는 패턴
+# 엔티티만 캡처 그룹이라 split 결과의 홀수 칸은 엔티티 또는 None(태그)
+# 태그는 배치 구분자(\x00)를 넘어가지 않음
+MARKUP_PATTERN = re.compile(r'<[^>\x00]+>|(&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);?)')
+
+# 배치 정리 시 항목 사이에 끼우는 구분자 (네이버 응답에 나오지 않는 문자)
+BATCH_SEPARATOR = '\x00'
+
+class _EntityTable(dict):
+    """엔티티 원문 → 복원 문자 (HTML5 전체 표 기준, 처음 본 엔티티만 해석해 저장)"""
+    
+    def __missing__(self, token):
+        # 엔티티처럼 생긴 임의 문자열(AT&T 등)로 계속 커지지 않도록
+        if len(self) >= 4096:
+            self.clear()
+        
+        value = '' if token is None else html.unescape(token)
+        self[token] = value
+        return value
+
+_ENTITIES = _EntityTable()
+
+def _strip_markup(text: str) -> str:
+    # 정규식 한 번으로 나누고, 태그/엔티티 칸은 표 조회로 치환 (항목별 콜백 없음)
+    parts = MARKUP_PATTERN.split(text)
+    parts[1::2] = map(_ENTITIES.__getitem__, parts[1::2])
+    return ''.join(parts)
+
+def clean_html(text: str) -> str:
+    """HTML 정리 (태그 제거 + 엔티티 복원을 한 번에, 공백은 하나로)"""
+    
+    return ' '.join(_strip_markup(text).split())
+
+def clean_html_batch(texts: Iterable[str]) -> List[str]:
+    """여러 문자열을 이어 붙여 한 번에 정리 (clean_html과 같은 결과)"""
+    
+    texts = list(texts)
+    
+    if not texts:
+        return []
+    
+    joined = BATCH_SEPARATOR.join(texts)
+    
+    # 구분자가 원문에 섞여 있으면 항목별로
+    if joined.count(BATCH_SEPARATOR) != len(texts) - 1:
+        return [clean_html(text) for text in texts]
+    
+    return [' '.join(part.split()) for part in _strip_markup(joined).split(BATCH_SEPARATOR)]
+
+def clean_news(news_list: List[Dict], fields: Iterable[str] = ('title', 'description')) -> List[Dict]:
+    """기사 목록의 제목/내용을 한 번에 정리한 사본"""
+    
+    fields = tuple(fields)
+    cleaned = iter(clean_html_batch(
+        news.get(field, '') for news in news_list for field in fields
+    ))
+    
+    return [
+        {**news, **{field: next(cleaned) for field in fields}}
+        for news in news_list
+    ]
+
+def filter_by_date(news_list: List[Dict], days: int) -> List[Dict]:
+    """최근 N일 이내 뉴스만 (날짜 파싱 실패 시 포함)"""
+    
+    cutoff_date = datetime.now() - timedelta(days=days)
+    filtered = []
+    
+    for news in news_list:
+        pub_date = parse_pub_date(news)
+        
+        if pub_date is None or pub_date.replace(tzinfo=None) >= cutoff_date:
+            filtered.append(news)
+    
+    return filtered
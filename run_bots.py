@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 봇을 한 프로세스에서 실행 (news_core.scheduler)
+네이버 클라이언트/카카오 토큰 관리자가 프로세스 전역 레지스트리라 봇끼리 커넥션 풀과 액세스 토큰을 공유하고,
+고용24 HTTP 크롤러/브라우저 풀은 프로세스가 끝날 때까지 재사용
+
+사용법:
+    python run_bots.py                        # 전체 봇 지금 실행 (기업뉴스 → 고용뉴스, 고용24는 함께)
+    python run_bots.py corporate employment   # 지정한 봇만
+    python run_bots.py employment --stream    # 뉴스봇 스트리밍 모드
+    python run_bots.py --cron "0 23 * * *"    # 이 cron 식의 봇만 (GitHub Actions 예약 실행)
+    python run_bots.py --loop                 # 상주하며 cron 일정대로 실행
+    python run_bots.py --loop --fake-clock 2026-01-01T22:50 --hours 4 --dry-run   # 일정만 확인
+"""
+
+import os
+import sys
+import argparse
+import importlib
+from datetime import datetime, timedelta
+from news_core.scheduler import FakeClock, Job, Scheduler
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 봇 이름 → 디렉터리, 실행 모듈, 스트리밍 진입점, cron(UTC), 선행 봇, 사용 자원
+BOTS = {
+    'corporate': {
+        'directory': 'corporate_bot',
+        'module': 'daily_corporate_news',
+        'streaming': 'main_streaming',
+        'cron': '0 23 * * *',   # 오전 8시 (KST)
+        'after': (),
+        'resources': ('gemini',),
+    },
+    'employment': {
+        'directory': 'employment_bot',
+        'module': 'daily_employment_news',
+        'streaming': 'main_streaming',
+        'cron': '0 0 * * *',    # 오전 9시 (KST)
+        'after': ('corporate',),
+        'resources': ('gemini',),
+    },
+    'work24': {
+        'directory': 'work24_bot',
+        'module': 'daily_work24_hybrid',
+        'streaming': None,
+        'cron': '0 2 * * *',    # 오전 11시 (KST)
+        'after': (),
+        'resources': ('browser',),
+    },
+}
+
+# 자원별 동시 실행 수 (Gemini 속도 제한, Chrome 메모리)
+LIMITS = {'gemini': 1, 'browser': 1}
+
+# 실행 간 재사용하는 고용24 크롤러/풀 (처음 실행할 때 생성)
+_work24_shared = {}
+
+def load_bot(name: str):
+    """봇 실행 모듈 import (한 번 불러온 모듈은 sys.modules에서 재사용)"""
+    
+    bot = BOTS[name]
+    
+    # 봇 디렉터리의 모듈 이름은 서로 겹치지 않아 한 sys.path에 함께 둘 수 있음
+    bot_path = os.path.join(ROOT, bot['directory'])
+    if bot_path not in sys.path:
+        sys.path.insert(0, bot_path)
+    
+    return importlib.import_module(bot['module'])
+
+def run_bot(name: str, stream: bool = False) -> bool:
+    """봇 하나 실행 (봇 main()이 실패를 출력만 하고 돌려주는 False를 그대로 반환)"""
+    
+    module = load_bot(name)
+    
+    if name == 'work24':
+        if not _work24_shared:
+            from work24_api_crawler import Work24APICrawler
+            from work24_crawler_pool import Work24CrawlerPool
+            _work24_shared['crawler'] = Work24APICrawler()
+            _work24_shared['pool'] = Work24CrawlerPool()
+        
+        return module.main(**_work24_shared)
+    
+    streaming = BOTS[name]['streaming']
+    return getattr(module, streaming if stream and streaming else 'main')()
+
+def close_shared():
+    for resource in _work24_shared.values():
+        resource.close()
+    _work24_shared.clear()
+
+def build_scheduler(stream: bool = False, dry_run: bool = False, clock=None,
+                    max_concurrent: int = 2) -> Scheduler:
+    def job_func(name: str):
+        if dry_run:
+            return lambda: print(f"  (dry-run) {name} 실행")
+        return lambda: run_bot(name, stream=stream)
+    
+    jobs = [
+        Job(name, job_func(name), cron=bot['cron'], after=bot['after'], resources=bot['resources'])
+        for name, bot in BOTS.items()
+    ]
+    
+    return Scheduler(jobs, clock=clock, max_concurrent=max_concurrent, limits=LIMITS)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="뉴스/채용 봇 실행기")
+    parser.add_argument('bots', nargs='*', help=f"실행할 봇 ({', '.join(BOTS)}), 없으면 전체")
+    parser.add_argument('--stream', action='store_true', help="뉴스봇 스트리밍 모드")
+    parser.add_argument('--cron', help="이 cron 식으로 등록된 봇만 실행")
+    parser.add_argument('--loop', action='store_true', help="상주하며 cron 일정대로 실행")
+    parser.add_argument('--fake-clock', help="가상 시계 시작 시각 (UTC, 예: 2026-01-01T22:50)")
+    parser.add_argument('--hours', type=float, help="--loop 실행 시간 (없으면 계속)")
+    parser.add_argument('--dry-run', action='store_true', help="봇은 실행하지 않고 일정만 출력")
+    parser.add_argument('--max-concurrent', type=int, default=2, help="동시에 실행할 봇 수")
+    return parser.parse_args(argv)
+
+def main(argv):
+    args = parse_args(argv)
+    
+    unknown = [name for name in args.bots if name not in BOTS]
+    if unknown:
+        print(f"❌ 알 수 없는 봇: {', '.join(unknown)} (사용 가능: {', '.join(BOTS)})")
+        return 2
+    
+    clock = FakeClock(datetime.fromisoformat(args.fake_clock)) if args.fake_clock else None
+    scheduler = build_scheduler(stream=args.stream, dry_run=args.dry_run, clock=clock,
+                                max_concurrent=args.max_concurrent)
+    
+    try:
+        if args.loop:
+            until = scheduler.clock.now() + timedelta(hours=args.hours) if args.hours else None
+            print(f"⏰ 스케줄러 시작 (다음 실행: {scheduler.next_run():%Y-%m-%d %H:%M} UTC)")
+            scheduler.run_forever(until=until)
+            return 0
+        
+        if args.cron:
+            names = scheduler.for_cron(args.cron)
+            if not names:
+                print(f"ℹ️ '{args.cron}' 일정의 봇이 없습니다.")
+                return 0
+        else:
+            names = args.bots or list(BOTS)
+        
+        results = scheduler.run(names)
+    
+    finally:
+        close_shared()
+    
+    failed = [name for name, ok in results.items() if not ok]
+    
+    if failed:
+        print(f"\n⚠️ 실패한 봇: {', '.join(failed)}")
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,16 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-고용24 채용공고봇 - 순차 실행 모드 (대기업 -> 중견 -> 외국계 -> 강소)
+고용24 채용공고봇 - 한 번의 검색으로 전체 카테고리 수집 후 순서대로 발송 (대기업 -> 중견 -> 외국계 -> 강소)
+단일 검색 실패 시 카테고리별 병렬 수집 (HTTP 우선, 실패 시 Selenium 폴백)
 """
 
 import os
-import time
+import sys
 from datetime import datetime
-from kakao_sender import KakaoSender
-from work24_stealth import Work24StealthCrawler
+from news_core.kakao_sender import KakaoSender
+from news_core.kakao_templates import CompiledTemplate, DigestRenderer
+from work24_api_crawler import Work24APICrawler
+from work24_crawler_pool import Work24CrawlerPool
 
-def main():
+# 공고 하나 (텍스트 형식)
+JOB_TEXT = CompiledTemplate("🏢 {company}\n📌 {title}\n🔗 바로가기: {link}")
+
+def main(crawler=None, pool=None) -> bool:
+    """
+    crawler/pool을 넘기면 (스케줄러에서 여러 번 실행) 세션/브라우저를 재사용하고 닫지 않음
+    발송 실패나 치명적 에러가 있으면 False
+    """
+    
     print("=" * 50)
     print("🏢 고용24 순차 발송 봇 시작")
     print(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -22,10 +33,20 @@ def main():
     
     if not api_key or not refresh_token:
         print("❌ [오류] 카카오 API 키가 설정되지 않았습니다.")
-        return
+        return False
 
-    sender = KakaoSender(rest_api_key=api_key, refresh_token=refresh_token)
-    crawler = Work24StealthCrawler()
+    sender = KakaoSender(rest_api_key=api_key, refresh_token=refresh_token,
+                         home_url="https://www.work24.go.kr")
+    owned = []
+    
+    if crawler is None:
+        crawler = Work24APICrawler()
+        owned.append(crawler)
+    
+    # 폴백: 워커마다 독립 세션/브라우저 (동시 실행 수: WORK24_MAX_WORKERS)
+    if pool is None:
+        pool = Work24CrawlerPool()
+        owned.append(pool)
     
     # 순서대로 실행할 타겟 목록 (이름, 체크박스ID)
     # 1. 대기업 (01)
@@ -40,42 +61,54 @@ def main():
     ]
     
     total_sent = 0
+    ok = True
 
     try:
-        # 루프 시작: 하나씩 처리하고 바로 발송
-        for name, target_id in target_list:
-            
-            # 1. 크롤링 (해당 기업형태만)
-            jobs = crawler.scrape_one_category(name, target_id, max_jobs=15)
+        # 1. 크롤링 (전체 기업형태 한 번에 검색 → 라벨로 분류, 결과는 target_list 순서)
+        try:
+            results = crawler.collect_all_categories(target_list, max_jobs=15)
+        except Exception as e:
+            print(f"⚠️ 단일 검색 실패 ({e}), 카테고리별 검색으로 재시도", flush=True)
+            results = pool.crawl(target_list, max_jobs=15)
+        
+        # 발송은 항상 같은 순서로
+        for name, jobs in results:
             
             if not jobs:
                 print(f"ℹ️ '{name}' 조건의 오늘 공고가 없습니다.\n")
                 continue
             
-            # 2. 메시지 만들기
-            msg = format_message(name, jobs)
+            # 2. 메시지 만들기 (전체 공고, list 템플릿 또는 1000자 단위 텍스트)
+            messages = format_message(name, jobs)
             
             # 3. 바로 발송
-            print(f"📤 [{name}] 카톡 발송 시도 ({len(jobs)}건)...", flush=True)
-            if sender.send_message(msg):
+            print(f"📤 [{name}] 카톡 발송 시도 ({len(jobs)}건, 메시지 {len(messages)}개)...", flush=True)
+            sent = sender.send_messages(messages)
+            total_sent += sent
+            
+            if sent == len(messages):
                 print(f"   ✓ 전송 성공!")
-                total_sent += 1
             else:
-                print(f"   ❌ 전송 실패")
-            
-            # 다음 검색 전 잠시 대기 (도배 방지 및 로딩 안정화)
-            time.sleep(2)
+                print(f"   ❌ 전송 실패 ({sent}/{len(messages)}개 발송)")
+                ok = False
             
     except Exception as e:
         print(f"❌ 전체 프로세스 중 치명적 에러: {e}")
+        ok = False
         
     finally:
-        crawler.close()
+        for resource in owned:
+            resource.close()
         print("=" * 50)
         print(f"🏁 모든 작업 완료. 총 {total_sent}번 발송함.")
+    
+    return ok
 
-def format_message(category, items):
-    """메시지 포맷팅"""
+def format_message(category, items, limit=None, style=None):
+    """
+    메시지 포맷팅 (공고 목록 → 카카오 템플릿 목록)
+    limit을 주면 예전처럼 앞의 limit건만 보여주고 제목에 전체 건수 표시
+    """
     icons = {
         "대기업": "🏆", 
         "중견기업": "💼", 
@@ -85,17 +118,26 @@ def format_message(category, items):
     icon = icons.get(category, "📌")
     
     # 헤더
-    msg = f"{icon} {category} 채용공고 ({datetime.now().strftime('%m/%d')})\n"
-    msg += "=" * 25 + "\n\n"
+    title = f"{icon} {category} 채용공고 ({datetime.now().strftime('%m/%d')})"
     
-    # 내용 (최대 5개 표시)
-    msg += "\n\n".join(items[:5])
+    # 일부만 보여줄 때는 전체 건수 표시
+    if limit and len(items) > limit:
+        title += f" 상위 {limit}건 / 전체 {len(items)}건"
+        items = items[:limit]
     
-    # 더 있으면 표시
-    if len(items) > 5:
-        msg += f"\n\n...외 {len(items)-5}건 더 있음"
+    renderer = DigestRenderer(
+        title,
+        "https://www.work24.go.kr",
+        style=style,
+        rule="=" * 25,
+        item_text=JOB_TEXT,
+        separator="\n\n"
+    )
         
-    return msg
+    # list 템플릿: 제목=공고명, 설명=회사명
+    jobs = [dict(job, description=job['company']) for job in items]
+    
+    return renderer.render([("", jobs)])
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
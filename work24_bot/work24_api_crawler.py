@@ -1,19 +1,40 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-고용24 크롤러 - 대안 방식 (requests + BeautifulSoup)
-Selenium 대신 API 직접 호출
+고용24 크롤러 - HTTP 직접 호출 방식 (requests + lxml)
+Selenium 없이 검색 폼(fn_Search) POST를 그대로 재현
 """
 
 import requests
-from bs4 import BeautifulSoup
+from collections import Counter
+from lxml import etree, html
 from datetime import datetime
-from typing import Dict, List
-import time
-import json
+from typing import Dict, Iterator, List, Optional, Tuple
+from work24_link_resolver import Work24LinkResolver
+
+# 공통 필터: 잡코리아, 사람인, 정규직
+COMMON_FILTER_IDS = ["b_siteClcdCJK", "b_siteClcdCSI", "employGbnParam10"]
+
+# 검색 결과 행 XPath (모듈 로드 시 한 번만 컴파일)
+ROW_XPATH = etree.XPath("//table[contains(@class, 'table-list')]/tbody/tr")
+DATE_XPATH = etree.XPath(".//*[contains(concat(' ', normalize-space(@class), ' '), ' date ')]")
+COMPANY_XPATH = etree.XPath(".//*[contains(concat(' ', normalize-space(@class), ' '), ' cp_name ')]")
+TITLE_XPATH = etree.XPath(".//a[@data-emp-detail]")
+LABEL_XPATH = etree.XPath(".//*[contains(@class, 'tbl_label') or contains(@class, 'badge')]")
+
+# 기업형태 체크박스 → 결과 행 라벨 키워드
+CATEGORY_LABELS = {
+    "enterPriseGbnParam01": "대기업",
+    "enterPriseGbnParam20": "중견",
+    "enterPriseGbnParam05": "외국계",
+    "enterPriseGbnParam10": "강소"
+}
+
+class Work24CrawlError(Exception):
+    """검색 폼/결과 구조를 찾지 못함 (Selenium 폴백 필요)"""
 
 class Work24APICrawler:
-    """고용24 API 기반 크롤러 (Selenium 불필요)"""
+    """고용24 HTTP 기반 크롤러 (Selenium 불필요)"""
     
     def __init__(self):
         self.base_url = "https://www.work24.go.kr"
@@ -21,127 +42,259 @@ class Work24APICrawler:
         
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
             'Referer': 'https://www.work24.go.kr'
         })
+        
+        # 상세 페이지는 같은 세션으로 동시 조회 + 공고 번호별 캐시
+        self.resolver = Work24LinkResolver(self.session)
     
-    def collect_jobs(self, max_jobs: int = 15) -> Dict[str, List[str]]:
+    def close(self):
+        self.session.close()
+    
+    def scrape_one_category(self, category_name: str, target_id: str, max_jobs: int = 10) -> List[Dict]:
+        """
+        특정 기업형태(target_id) 하나만 체크하고 검색하여 결과를 반환
+        Work24StealthCrawler.scrape_one_category와 같은 형식
         """
-        고용24 채용공고 수집 (API 기반)
         
-        Returns:
-            카테고리별 채용공고 딕셔너리
+        print(f"\n>>> [시작] '{category_name}' 공고 검색 (HTTP)...", flush=True)
+        
+        doc = self._search(COMMON_FILTER_IDS + [target_id])
+        rows = self._parse_rows(doc)
+        
+        print(f"👉 [DEBUG] 발견된 행(Row): {len(rows)}개", flush=True)
+        
+        # 오늘 공고만 먼저 고른 뒤 원본 링크는 한 번에 동시 변환
+        today_rows = [row for row in rows if self._is_today(row['reg_date'])][:max_jobs]
+        links = self.resolver.resolve_all([row['detail_url'] for row in today_rows])
+        
+        job_results = [
+            self._format_job(row['company'] or category_name, row['title'], link)
+            for row, link in zip(today_rows, links)
+        ]
+        
+        print(f"✅ [완료] '{category_name}' 수집: {len(job_results)}건", flush=True)
+        
+        return job_results
+    
+    def collect_all_categories(self, target_list: List[Tuple[str, str]], max_jobs: int = 10,
+                               page_unit: int = 100, max_pages: int = 5) -> List[Tuple[str, List[Dict]]]:
         """
+        전체 기업형태를 한 번에 검색한 뒤 행 라벨로 카테고리 분류
+        카테고리마다 scrape_one_category를 부르는 것과 같은 결과를 target_list 순서로 반환
         
-        categorized_jobs = {
-            "대기업": [],
-            "중견기업": [],
-            "외국계": [],
-            "강소기업": []
-        }
+        Args:
+            target_list: (이름, 체크박스ID) 목록 (라벨이 여러 개면 앞선 카테고리 우선)
+            max_jobs: 카테고리별 최대 공고 수
+            page_unit: 페이지당 행 수
+            max_pages: 최대 페이지 수
+        """
         
-        try:
-            # 검색 파라미터 (기업 규모 필터 포함)
-            params = {
-                'pageIndex': 1,
-                'pageUnit': 50,
-                'empTpCd': '',  # 고용형태
-                'dtyCd': '',    # 직무
-                'enterPriseScaleCd': '1,2,3,4',  # 1:대기업, 2:중견, 3:외국계, 4:강소
-                'sortType': 'LATEST'  # 최신순
-            }
-            
-            print(f"  고용24 검색 중...")
+        print(f"\n>>> [시작] 전체 기업형태 한 번에 검색 (HTTP)...", flush=True)
+        
+        target_ids = [target_id for _, target_id in target_list]
+        selected: Dict[str, List[Dict]] = {target_id: [] for target_id in target_ids}
+        seen_ids = set()
+        today_count = 0
+        
+        # 어느 카테고리에도 맞지 않은 행의 라벨 (일부 라벨 이름이 바뀌었는지 확인용)
+        unmatched = Counter()
+        
+        for rows in self._iter_today_rows(COMMON_FILTER_IDS + target_ids, page_unit, max_pages):
+            today_count += len(rows)
             
-            # API 호출
-            response = self.session.get(self.search_url, params=params, timeout=15)
+            for row in rows:
+                target_id = self._match_category(row['labels'], target_ids)
+                if target_id is None:
+                    unmatched[' / '.join(row['labels']) or '(라벨 없음)'] += 1
+                    continue
+                
+                # 여러 페이지/카테고리에 걸쳐 같은 공고는 한 번만
+                job_id = self.resolver.job_id(row['detail_url'])
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+                
+                if len(selected[target_id]) < max_jobs:
+                    selected[target_id].append(row)
             
-            if response.status_code != 200:
-                print(f"  ⚠️ HTTP {response.status_code}")
-                return categorized_jobs
+            if all(len(picked) >= max_jobs for picked in selected.values()):
+                break
+        
+        # 오늘 공고는 있는데 하나도 분류되지 않으면 라벨 구조가 바뀐 것 (카테고리별 검색 필요)
+        if today_count and not seen_ids:
+            raise Work24CrawlError(f"오늘 공고 {today_count}건 중 라벨로 분류된 공고 없음")
+        
+        # 검색 조건이 대상 기업형태뿐이므로 분류 안 된 행은 라벨 변경 신호
+        if unmatched:
+            examples = ', '.join(f"'{labels}' {count}건" for labels, count in unmatched.most_common(3))
+            print(f"⚠️ 오늘 공고 {today_count}건 중 {sum(unmatched.values())}건 분류 안 됨 (라벨 예: {examples})", flush=True)
+        
+        # 원본 링크는 전체 카테고리를 한 번에 동시 변환
+        ordered = [row for target_id in target_ids for row in selected[target_id]]
+        links = iter(self.resolver.resolve_all([row['detail_url'] for row in ordered]))
+        
+        results = []
+        
+        for name, target_id in target_list:
+            jobs = [
+                self._format_job(row['company'] or name, row['title'], next(links))
+                for row in selected[target_id]
+            ]
+            print(f"✅ [완료] '{name}' 수집: {len(jobs)}건", flush=True)
+            results.append((name, jobs))
+        
+        return results
+    
+    def collect_jobs(self, max_jobs: int = 15) -> Dict[str, List[Dict]]:
+        """
+        고용24 채용공고 수집 (전체 기업형태를 한 번에 검색 후 라벨로 분류)
+        
+        Returns:
+            카테고리별 채용공고 딕셔너리 (카테고리별 최대 max_jobs개)
+        """
+        
+        target_list = [
+            ("대기업", "enterPriseGbnParam01"),
+            ("중견기업", "enterPriseGbnParam20"),
+            ("외국계", "enterPriseGbnParam05"),
+            ("강소기업", "enterPriseGbnParam10")
+        ]
+        
+        try:
+            return dict(self.collect_all_categories(target_list, max_jobs=max_jobs))
+        except Exception as e:
+            print(f"  크롤링 오류: {e}")
+            return {name: [] for name, _ in target_list}
+    
+    def _load_search_form(self) -> Tuple[html.HtmlElement, html.FormElement]:
+        """검색 페이지의 폼 (세션 쿠키/hidden 값 확보)"""
+        
+        response = self.session.get(self.search_url, timeout=15)
+        
+        if response.status_code != 200:
+            raise Work24CrawlError(f"검색 페이지 HTTP {response.status_code}")
+        
+        doc = html.fromstring(response.content, base_url=response.url)
+        doc.make_links_absolute(response.url)
+        
+        # 기업형태 체크박스가 들어 있는 폼이 fn_Search가 제출하는 폼
+        forms = doc.xpath("//input[starts-with(@id, 'enterPriseGbnParam')]/ancestor::form[1]")
+        if not forms:
+            raise Work24CrawlError("검색 폼을 찾지 못함")
+        
+        return doc, forms[0]
+    
+    def _search(self, checkbox_ids: List[str], page_index: int = 1, page_unit: Optional[int] = None,
+                search_form: Optional[Tuple[html.HtmlElement, html.FormElement]] = None) -> html.HtmlElement:
+        """
+        fn_Search 재현: 폼 기본값 + 체크박스 선택 + 페이지 지정 후 POST
+        (페이지를 넘길 때는 search_form으로 이미 받은 폼 재사용)
+        """
+        
+        doc, form = search_form or self._load_search_form()
+        
+        fields = list(form.form_values())
+        
+        for checkbox_id in checkbox_ids:
+            elements = doc.xpath(f"//input[@id='{checkbox_id}']")
+            if not elements:
+                print(f"⚠️ 필터 없음: {checkbox_id}", flush=True)
+                continue
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+            name, value = elements[0].get('name'), elements[0].get('value', 'on')
+            if name and (name, value) not in fields:
+                fields.append((name, value))
+        
+        # 폼에 있으면 값만 바꾸고 없으면 추가
+        overrides = {'pageIndex': str(page_index)}
+        if page_unit:
+            overrides['pageUnit'] = str(page_unit)
+        
+        fields = [(name, overrides.pop(name, value)) for name, value in fields]
+        fields += list(overrides.items())
+        
+        action = form.action or self.search_url
+        response = self.session.post(action, data=fields, timeout=20)
+        
+        if response.status_code != 200:
+            raise Work24CrawlError(f"검색 HTTP {response.status_code}")
+        
+        result = html.fromstring(response.content, base_url=response.url)
+        result.make_links_absolute(response.url)
+        
+        if not result.xpath("//table[contains(@class, 'table-list')]"):
+            raise Work24CrawlError("검색 결과 테이블을 찾지 못함")
+        
+        return result
+    
+    def _iter_today_rows(self, checkbox_ids: List[str], page_unit: int, max_pages: int) -> Iterator[List[Dict]]:
+        """
+        페이지별 오늘 공고 행 (최신순 결과이므로 오늘 공고가 없는 페이지에서 중단)
+        """
+        
+        search_form = self._load_search_form()
+        previous_first = None
+        
+        for page_index in range(1, max_pages + 1):
+            rows = self._parse_rows(self._search(checkbox_ids, page_index, page_unit, search_form))
             
-            # 채용공고 목록 찾기
-            job_items = soup.select('table.table-list tbody tr, ul.job-list li')
+            # 마지막 페이지를 넘기면 같은 페이지가 반복될 수 있음
+            if not rows or rows[0]['detail_url'] == previous_first:
+                break
+            previous_first = rows[0]['detail_url']
             
-            print(f"  채용공고 발견: {len(job_items)}개")
+            today_rows = [row for row in rows if self._is_today(row['reg_date'])]
+            print(f"👉 [DEBUG] {page_index}페이지: {len(rows)}행 중 오늘 공고 {len(today_rows)}건", flush=True)
             
-            today = datetime.now().strftime("%y.%m.%d")
-            count = 0
+            if not today_rows:
+                break
             
-            for item in job_items:
-                if count >= max_jobs:
-                    break
-                
-                try:
-                    # 날짜 확인
-                    date_el = item.select_one('.date, .reg-date')
-                    if not date_el:
-                        continue
-                    
-                    reg_date = date_el.get_text(strip=True)
-                    
-                    # 당일 공고만
-                    if today not in reg_date:
-                        continue
-                    
-                    # 기업명
-                    company_el = item.select_one('.cp_name, .company-name')
-                    if not company_el:
-                        continue
-                    
-                    company = company_el.get_text(strip=True)
-                    
-                    # 제목 및 링크
-                    title_el = item.select_one('a.title, a.job-title')
-                    if not title_el:
-                        continue
-                    
-                    title = title_el.get_text(strip=True)
-                    job_link = title_el.get('href', '')
-                    
-                    # 절대 URL로 변환
-                    if job_link and not job_link.startswith('http'):
-                        job_link = f"{self.base_url}{job_link}"
-                    
-                    # 카테고리 라벨
-                    labels = [l.get_text(strip=True) for l in item.select('.tbl_label, .badge')]
-                    
-                    # 카테고리 매칭
-                    category = None
-                    if any('대기업' in l for l in labels):
-                        category = "대기업"
-                    elif any('중견' in l for l in labels):
-                        category = "중견기업"
-                    elif any('외국계' in l for l in labels):
-                        category = "외국계"
-                    elif any('강소' in l for l in labels):
-                        category = "강소기업"
-                    
-                    if not category:
-                        continue
-                    
-                    # 포맷팅
-                    job_info = f"🏢 {company}\n📌 {title}\n🔗 {job_link}"
-                    
-                    categorized_jobs[category].append(job_info)
-                    count += 1
-                    
-                    print(f"    ✓ [{category}] {company} - {title[:20]}...")
-                    
-                    # 서버 부담 줄이기
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    continue
+            yield today_rows
+    
+    def _match_category(self, labels: List[str], target_ids: List[str]) -> Optional[str]:
+        """행 라벨에 해당하는 첫 번째 기업형태 체크박스ID"""
+        
+        for target_id in target_ids:
+            keyword = CATEGORY_LABELS.get(target_id)
+            if keyword and any(keyword in label for label in labels):
+                return target_id
+        
+        return None
+    
+    def _parse_rows(self, doc: html.HtmlElement) -> List[Dict]:
+        """결과 테이블 행 → 공고 정보"""
+        
+        rows = []
+        
+        for tr in ROW_XPATH(doc):
+            title_el = TITLE_XPATH(tr)
+            if not title_el:
+                continue
             
-            print(f"  수집 완료: 총 {count}개")
+            date_el = DATE_XPATH(tr)
+            company_el = COMPANY_XPATH(tr)
             
-        except Exception as e:
-            print(f"  크롤링 오류: {e}")
+            rows.append({
+                'title': title_el[0].text_content().strip(),
+                'detail_url': title_el[0].get('href', ''),
+                'company': company_el[0].text_content().strip() if company_el else '',
+                # 날짜 칸이 없으면 행 전체 텍스트에서 확인
+                'reg_date': (date_el[0] if date_el else tr).text_content().strip(),
+                'labels': [el.text_content().strip() for el in LABEL_XPATH(tr)]
+            })
         
-        return categorized_jobs
+        return rows
+    
+    def _is_today(self, reg_date: str) -> bool:
+        now = datetime.now()
+        today_formats = [now.strftime(f) for f in ["%y.%m.%d", "%Y.%m.%d", "%Y-%m-%d", "%m-%d"]]
+        return any(f in reg_date for f in today_formats)
+    
+    def _format_job(self, company: str, title: str, link: str) -> Dict[str, str]:
+        """공고 정보 (메시지 모양은 format_message의 템플릿이 결정)"""
+
+        return {'company': company, 'title': title, 'link': link}
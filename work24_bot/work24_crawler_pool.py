@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고용24 카테고리 병렬 크롤링 풀
+워커마다 독립된 HTTP 세션(실패 시 독립된 Chrome)을 두고 카테고리를 동시에 수집
+워커 스레드는 close() 전까지 유지되어 여러 번 crawl()해도 세션/브라우저를 재사용
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from work24_api_crawler import Work24APICrawler
+
+class Work24CrawlerPool:
+    """카테고리 목록을 동시에 크롤링하고 입력 순서대로 결과 반환"""
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        # 환경 변수로 동시 실행 수 조절 (기본 4 = 카테고리 수)
+        self.max_workers = max(1, max_workers or int(os.environ.get('WORK24_MAX_WORKERS', '4')))
+        
+        self._local = threading.local()
+        self._crawlers = []
+        self._lock = threading.Lock()
+        self._executor = None
+        
+        # Selenium 대체 크롤러들이 공유하는 단계별 타임아웃 (첫 대체 때 생성)
+        self._timeouts = None
+    
+    def _crawler(self) -> Work24APICrawler:
+        """워커 스레드 전용 HTTP 크롤러 (세션/쿠키 분리)"""
+        
+        crawler = getattr(self._local, 'crawler', None)
+        
+        if crawler is None:
+            crawler = self._local.crawler = Work24APICrawler()
+            with self._lock:
+                self._crawlers.append(crawler)
+        
+        return crawler
+    
+    def _fallback(self):
+        """워커 스레드 전용 Selenium 크롤러 (필요할 때만 생성, 브라우저 분리)"""
+        
+        fallback = getattr(self._local, 'fallback', None)
+        
+        if fallback is None:
+            from work24_readiness import AdaptiveTimeouts
+            from work24_stealth import Work24StealthCrawler
+            
+            with self._lock:
+                if self._timeouts is None:
+                    self._timeouts = AdaptiveTimeouts()
+                timeouts = self._timeouts
+            
+            fallback = self._local.fallback = Work24StealthCrawler(timeouts)
+            with self._lock:
+                self._crawlers.append(fallback)
+        
+        return fallback
+    
+    def _scrape(self, target: Tuple[str, str], max_jobs: int) -> List[Dict]:
+        name, target_id = target
+        
+        try:
+            return self._crawler().scrape_one_category(name, target_id, max_jobs=max_jobs)
+        except Exception as e:
+            print(f"⚠️ [{name}] HTTP 크롤링 실패 ({e}), Selenium으로 재시도", flush=True)
+        
+        # Chrome이 없거나 깨져도 다른 카테고리 결과는 발송되도록 빈 결과
+        try:
+            return self._fallback().scrape_one_category(name, target_id, max_jobs=max_jobs)
+        except Exception as e:
+            print(f"❌ [{name}] Selenium 크롤링도 실패 ({e}), 이 카테고리는 건너뜀", flush=True)
+            return []
+    
+    def crawl(self, target_list: List[Tuple[str, str]], max_jobs: int = 15) -> List[Tuple[str, List[Dict]]]:
+        """
+        (이름, 체크박스ID) 목록을 동시에 수집
+        완료 순서와 관계없이 target_list 순서대로 (이름, 공고 목록) 반환
+        """
+        
+        if not target_list:
+            return []
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        results = list(self._executor.map(lambda target: self._scrape(target, max_jobs), target_list))
+        
+        return [(name, jobs) for (name, _), jobs in zip(target_list, results)]
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        with self._lock:
+            crawlers, self._crawlers = self._crawlers, []
+        
+        for crawler in crawlers:
+            crawler.close()
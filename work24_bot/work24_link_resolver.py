@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고용24 상세 페이지 → 원본 지원 링크 변환기
+공유 세션으로 동시에 가져오고, 공고 번호별로 결과를 디스크에 캐시
+"""
+
+import json
+import os
+import re
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from news_core.paths import DEFAULT_CACHE_DIR
+
+# onclick="f_goMove('https://...')" 의 첫 인자 (DOM을 만들지 않고 원문에서 바로 추출)
+F_GOMOVE_PATTERN = re.compile(r"""f_goMove\(\s*['"]([^'"]+)['"]""")
+
+# 상세 URL의 공고 번호
+JOB_ID_PATTERN = re.compile(r'[?&]wantedAuthNo=([^&#]+)')
+
+# 여러 변환기(병렬 크롤러)가 같은 캐시 파일을 쓰므로 파일 갱신은 직렬화
+_FILE_LOCK = threading.Lock()
+
+class Work24LinkResolver:
+    """상세 페이지 URL 목록을 원본 링크로 일괄 변환"""
+    
+    def __init__(self, session: Optional[requests.Session] = None, max_workers: int = 6,
+                 cache_path: Optional[str] = None, max_entries: int = 5000):
+        self.session = session or requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.cache_path = cache_path or os.path.join(DEFAULT_CACHE_DIR, 'work24_links.json')
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        # 동시 요청 수만큼 연결을 유지
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=self.max_workers))
+        
+        self.cache: Dict[str, str] = self._load_cache()
+        self.hits = 0
+    
+    @staticmethod
+    def job_id(detail_url: str) -> str:
+        """공고 번호 (없으면 URL 자체를 키로 사용)"""
+        
+        match = JOB_ID_PATTERN.search(detail_url)
+        return match.group(1) if match else detail_url
+    
+    def resolve_all(self, detail_urls: List[str]) -> List[str]:
+        """입력 순서대로 원본 링크 반환 (실패 시 상세 페이지 링크)"""
+        
+        links: List[Optional[str]] = [self.cache.get(self.job_id(url)) for url in detail_urls]
+        self.hits += sum(1 for link in links if link)
+        
+        pending = list(dict.fromkeys(url for url, link in zip(detail_urls, links) if not link))
+        
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = dict(zip(pending, executor.map(self._fetch, pending)))
+            
+            for url, link in fetched.items():
+                # 실패(상세 링크 그대로)는 다음에 다시 시도
+                if link != url:
+                    with self._lock:
+                        self.cache[self.job_id(url)] = link
+            
+            links = [link or fetched[url] for url, link in zip(detail_urls, links)]
+            self._save_cache()
+        
+        return links
+    
+    def _fetch(self, detail_url: str) -> str:
+        try:
+            response = self.session.get(detail_url, timeout=10)
+            match = F_GOMOVE_PATTERN.search(response.text)
+            if match:
+                return match.group(1)
+        except Exception:
+            pass
+        
+        return detail_url
+    
+    def _load_cache(self) -> Dict[str, str]:
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self):
+        with _FILE_LOCK:
+            # 다른 변환기가 그사이 저장한 항목과 합침
+            merged = self._load_cache()
+            
+            with self._lock:
+                merged.update(self.cache)
+                # dict는 삽입 순서를 유지하므로 오래된 항목부터 정리
+                self.cache = dict(list(merged.items())[-self.max_entries:])
+                snapshot = dict(self.cache)
+            
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고용24 페이지 준비 상태 감지 - 고정 sleep 대신 실제 신호로 대기
+(결과 행 변화 / CDP Network 이벤트 기반 네트워크 유휴 / MutationObserver)
+"""
+
+import json
+import os
+import threading
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from typing import Dict, List, Optional
+from news_core.paths import DEFAULT_CACHE_DIR
+
+# 같은 프로세스의 타이밍 파일 읽기-합치기-쓰기 직렬화
+_FILE_LOCK = threading.Lock()
+
+# 문서에 MutationObserver를 심어 마지막 DOM 변경 시각 기록
+INSTALL_OBSERVER_JS = """
+if (!window.__w24Observer) {
+    window.__w24LastMutation = performance.now();
+    window.__w24Observer = new MutationObserver(() => { window.__w24LastMutation = performance.now(); });
+    window.__w24Observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__w24LastMutation;
+"""
+
+# 결과 테이블 상태 (행 수 + 첫 행 텍스트)
+RESULT_SIGNATURE_JS = """
+const rows = document.querySelectorAll(arguments[0]);
+return [rows.length, rows.length ? rows[0].innerText.slice(0, 200) : '', !!window.__w24SearchMarker];
+"""
+
+class AdaptiveTimeouts:
+    """
+    최근 실행의 단계별 소요 시간으로 타임아웃 학습
+    크롤러 풀의 워커들이 한 인스턴스를 공유하고, 저장 시 파일의 기록과 합침
+    """
+    
+    def __init__(self, path: Optional[str] = None, history: int = 10,
+                 minimum: float = 5.0, maximum: float = 30.0, default: float = 20.0):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'work24_timings.json')
+        self.history = history
+        self.minimum = minimum
+        self.maximum = maximum
+        self.default = default
+        
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = self._load()
+        
+        # 아직 파일에 쓰지 않은 이번 실행의 기록
+        self._pending: Dict[str, List[float]] = {}
+    
+    def _load(self) -> Dict[str, List[float]]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def timeout(self, stage: str) -> float:
+        """최근 최댓값의 2배 (기록이 없으면 기본값), [minimum, maximum] 범위"""
+        
+        with self._lock:
+            samples = self.samples.get(stage)
+            if not samples:
+                return self.default
+        
+            return min(self.maximum, max(self.minimum, max(samples) * 2))
+    
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            for table in (self.samples, self._pending):
+                samples = table.setdefault(stage, [])
+                samples.append(round(seconds, 3))
+                del samples[:-self.history]
+    
+    def save(self):
+        """다른 크롤러/프로세스가 그사이 저장한 기록 뒤에 이번 기록을 붙여 저장"""
+        
+        with _FILE_LOCK:
+            merged = self._load()
+            
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                
+                for stage, samples in pending.items():
+                    merged[stage] = (merged.get(stage, []) + samples)[-self.history:]
+                
+                self.samples = merged
+            
+            if not pending:
+                return
+            
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, self.path)
+
+class NetworkMonitor:
+    """CDP Network 이벤트(performance 로그)로 진행 중인 요청 수 추적"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.inflight = set()
+        self.last_activity = time.monotonic()
+        self.available = True
+    
+    def poll(self):
+        if not self.available:
+            return
+        
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException:
+            # performance 로그 미지원 드라이버는 DOM 신호만 사용
+            self.available = False
+            return
+        
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            method = message.get('method', '')
+            request_id = message.get('params', {}).get('requestId')
+            
+            if method == 'Network.requestWillBeSent':
+                self.inflight.add(request_id)
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self.inflight.discard(request_id)
+            else:
+                continue
+            
+            self.last_activity = time.monotonic()
+    
+    def idle_for(self) -> float:
+        """진행 중인 요청이 없는 상태로 지난 시간 (요청 중이면 0)"""
+        
+        self.poll()
+        
+        if self.inflight:
+            return 0.0
+        
+        return time.monotonic() - self.last_activity
+    
+    def reset(self):
+        """페이지 이동 시 이전 문서의 요청 정리"""
+        
+        self.poll()
+        self.inflight.clear()
+        self.last_activity = time.monotonic()
+
+class PageReadiness:
+    """결과가 준비되는 순간 바로 반환하는 대기 도우미"""
+    
+    def __init__(self, driver, timeouts: Optional[AdaptiveTimeouts] = None,
+                 quiet_ms: float = 300, poll_frequency: float = 0.1):
+        self.driver = driver
+        self.timeouts = timeouts or AdaptiveTimeouts()
+        self.network = NetworkMonitor(driver)
+        self.quiet_seconds = quiet_ms / 1000
+        self.poll_frequency = poll_frequency
+    
+    def _settled(self) -> bool:
+        """문서 로드 완료 + DOM 변경 없음 + 네트워크 유휴가 quiet_ms 이상 지속"""
+        
+        if self.driver.execute_script("return document.readyState") != 'complete':
+            return False
+        
+        dom_quiet_ms = self.driver.execute_script(INSTALL_OBSERVER_JS)
+        
+        return (
+            dom_quiet_ms >= self.quiet_seconds * 1000
+            and (not self.network.available or self.network.idle_for() >= self.quiet_seconds)
+        )
+    
+    def _wait(self, stage: str, condition) -> bool:
+        timeout = self.timeouts.timeout(stage)
+        started = time.monotonic()
+        
+        try:
+            # 폼 제출로 문서가 바뀌는 사이 execute_script가 "document unloaded" 등으로 실패해도 계속 대기
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency,
+                          ignored_exceptions=(WebDriverException,)).until(
+                lambda driver: condition()
+            )
+            ready = True
+        except TimeoutException:
+            print(f"⚠️ [{stage}] {timeout:.1f}초 안에 준비 신호 없음, 현재 상태로 진행", flush=True)
+            ready = False
+        
+        self.timeouts.record(stage, time.monotonic() - started)
+        return ready
+    
+    def navigate(self, url: str, ready_script: str = "return true") -> bool:
+        """페이지 이동 후 문서/네트워크가 안정되고 ready_script가 참일 때까지 대기"""
+        
+        self.network.reset()
+        self.driver.get(url)
+        
+        return self._wait(
+            'page_load',
+            lambda: self._settled() and bool(self.driver.execute_script(ready_script))
+        )
+    
+    def result_signature(self, row_selector: str):
+        return self.driver.execute_script(RESULT_SIGNATURE_JS, row_selector)
+    
+    def mark_before_search(self):
+        """검색 전 표시 (폼 제출로 문서가 바뀌면 표시가 사라짐)"""
+        
+        self.driver.execute_script("window.__w24SearchMarker = true;")
+        self.network.reset()
+    
+    def wait_for_results(self, row_selector: str, before) -> bool:
+        """
+        결과 행 수/첫 행이 바뀌거나 새 문서로 이동한 뒤
+        DOM과 네트워크가 안정되면 반환
+        """
+        
+        def changed() -> bool:
+            count, first_row, marker = self.result_signature(row_selector)
+            return (not marker) or [count, first_row] != list(before[:2])
+        
+        return self._wait('search', lambda: changed() and self._settled())
+    
+    def save(self):
+        self.timeouts.save()
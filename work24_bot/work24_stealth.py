@@ -7,16 +7,24 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
-import time
+from work24_link_resolver import Work24LinkResolver
+from work24_readiness import AdaptiveTimeouts, PageReadiness
+from typing import Optional
+import requests
 import json
 
+# 검색 결과 행
+ROW_SELECTOR = "table.table-list tbody tr"
+
 class Work24StealthCrawler:
     
-    def __init__(self):
+    def __init__(self, timeouts: Optional[AdaptiveTimeouts] = None):
         self.driver = None
+        self.readiness = None
+        
+        # 크롤러 풀에서는 워커끼리 공유 (없으면 크롤러마다 생성)
+        self.timeouts = timeouts or AdaptiveTimeouts()
     
     def setup_driver(self):
         """드라이버 설정 (한 번만 실행)"""
@@ -31,18 +39,37 @@ class Work24StealthCrawler:
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         options.add_argument('--window-size=1920,1080')
+        # 네트워크 유휴 감지용 CDP Network 이벤트 수집
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         
         self.driver = webdriver.Chrome(options=options)
         self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
             'source': 'Object.defineProperty(navigator, "webdriver", {get: () => undefined})'
         })
-        self.driver.implicitly_wait(10)
+        # 암묵적 대기는 없는 요소마다 10초씩 멈추므로 끄고 명시적 신호로만 대기
+        self.driver.implicitly_wait(0)
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.readiness = PageReadiness(self.driver, self.timeouts)
+
+    def _link_resolver(self):
+        """드라이버의 쿠키/UA를 복사한 세션으로 상세 페이지 변환기 생성"""
+        session = requests.Session()
+        session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        return Work24LinkResolver(session)
 
     def close(self):
         """브라우저 종료"""
         if self.driver:
-            self.driver.quit()
-            self.driver = None
+            try:
+                # 이번 실행의 대기 시간을 다음 타임아웃 계산에 반영
+                self.readiness.save()
+            finally:
+                # 저장에 실패해도 Chrome은 종료
+                self.driver.quit()
+                self.driver = None
+                self.readiness = None
 
     def scrape_one_category(self, category_name, target_id, max_jobs=10):
         """
@@ -55,9 +82,11 @@ class Work24StealthCrawler:
             print(f"\n>>> [시작] '{category_name}' 공고 검색 시작...", flush=True)
             
             # 1. 초기화 (새로고침 효과를 위해 URL 재접속)
-            self.driver.get("https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do")
-            wait = WebDriverWait(self.driver, 20)
-            time.sleep(3) # 접속 대기
+            # fn_Search가 정의되고 DOM/네트워크가 잠잠해지면 바로 진행
+            self.readiness.navigate(
+                "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do",
+                ready_script="return typeof fn_Search === 'function'"
+            )
 
             # 2. 필터 설정 (공통 필터 + 타겟 기업형태 1개)
             # 공통: 잡코리아, 사람인, 정규직
@@ -86,16 +115,19 @@ class Work24StealthCrawler:
                 if (lbl) lbl.click();
             }}
 
-            // 3. 검색 실행
-            setTimeout(() => {{ fn_Search('1'); }}, 500);
+            // 3. 검색 실행 (라벨 클릭은 동기 처리되므로 바로 호출)
+            fn_Search('1');
             """
+            before = self.readiness.result_signature(ROW_SELECTOR)
+            self.readiness.mark_before_search()
             self.driver.execute_script(js_script)
             
-            print(f">>> [로딩] '{category_name}' 검색 결과 대기 중 (10초)...", flush=True)
-            time.sleep(10) # 충분한 대기
+            # 결과 행이 바뀌고 DOM/네트워크가 안정될 때까지 (학습된 타임아웃)
+            print(f">>> [로딩] '{category_name}' 검색 결과 대기 중...", flush=True)
+            self.readiness.wait_for_results(ROW_SELECTOR, before)
 
             # 3. 결과 수집
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table.table-list tbody tr")
+            rows = self.driver.find_elements(By.CSS_SELECTOR, ROW_SELECTOR)
             if len(rows) == 0:
                 print("⚠️ 테이블 못 찾음. 전체 검색 시도.", flush=True)
                 rows = self.driver.find_elements(By.TAG_NAME, "tr")
@@ -106,8 +138,8 @@ class Work24StealthCrawler:
             now = datetime.now()
             today_formats = [now.strftime(f) for f in ["%y.%m.%d", "%Y.%m.%d", "%Y-%m-%d", "%m-%d"]]
             
-            main_window = self.driver.current_window_handle
             count = 0
+            pending = []  # (회사명, 제목, 상세 URL)
 
             for i, row in enumerate(rows, 1):
                 if count >= max_jobs: break
@@ -129,8 +161,6 @@ class Work24StealthCrawler:
                     # (예: 대기업 검색했는데 계열사 중소기업이 나올 수도 있음 -> 그래도 검색결과 존중)
                     
                     # 상세 정보 추출
-                    print(f"   ⏳ [처리중] 상세 페이지 진입...", end='', flush=True)
-                    
                     title_el = row.find_element(By.CSS_SELECTOR, "a[data-emp-detail]")
                     title = title_el.text.strip()
                     detail_url = title_el.get_attribute("href")
@@ -140,36 +170,20 @@ class Work24StealthCrawler:
                     except:
                         company = category_name
 
-                    # 4. 원본 링크 추출 (새 창)
-                    self.driver.execute_script(f"window.open('{detail_url}');")
-                    self.driver.switch_to.window(self.driver.window_handles[-1])
-                    
-                    try:
-                        wait_btn = WebDriverWait(self.driver, 5)
-                        final_btn = wait_btn.until(EC.presence_of_element_located(
-                            (By.XPATH, "//a[contains(@onclick, 'f_goMove')]")
-                        ))
-                        actual_link = final_btn.get_attribute("onclick").split("'")[1]
-                    except:
-                        actual_link = detail_url
-
-                    job_info = f"🏢 {company}\n📌 {title}\n🔗 바로가기: {actual_link}"
-                    job_results.append(job_info)
+                    pending.append((company, title, detail_url))
                     count += 1
-                    print(f" 완료! ({company})", flush=True)
-
-                    # 탭 닫기
-                    if len(self.driver.window_handles) > 1:
-                        self.driver.close()
-                    self.driver.switch_to.window(main_window)
-                    time.sleep(0.5)
 
                 except Exception:
-                    if len(self.driver.window_handles) > 1:
-                        self.driver.close()
-                        self.driver.switch_to.window(main_window)
                     continue
             
+            # 4. 원본 링크 추출 (새 창 대신 브라우저 쿠키를 넘긴 HTTP 세션으로 동시 조회)
+            print(f"   ⏳ [처리중] 상세 페이지 {len(pending)}건 원본 링크 추출...", flush=True)
+            links = self._link_resolver().resolve_all([url for _, _, url in pending])
+            
+            for (company, title, _), actual_link in zip(pending, links):
+                job_results.append({'company': company, 'title': title, 'link': actual_link})
+                print(f"   ✓ {company}", flush=True)
+            
             print(f"✅ [완료] '{category_name}' 수집: {count}건", flush=True)
             
         except Exception as e: